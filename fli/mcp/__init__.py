@@ -9,18 +9,22 @@ try:
     from fli.mcp.server import (
         DateSearchParams,
         FlightSearchParams,
+        get_results_page,
         mcp,
         run,
         run_http,
         search_dates,
         search_flights,
+        search_flights_batch,
     )
 
     __all__ = [
         "DateSearchParams",
         "FlightSearchParams",
+        "get_results_page",
         "search_dates",
         "search_flights",
+        "search_flights_batch",
         "mcp",
         "run",
         "run_http",
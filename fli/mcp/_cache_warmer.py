@@ -0,0 +1,272 @@
+"""Background refresh of the most popular searches in the MCP result cache.
+
+MCP traffic tends to concentrate on a few hundred routes and dates. With
+warming enabled, the server records every search call (cached or not) in a
+:class:`QueryPopularity`, which keeps an exponentially decaying count per
+normalised query. A :class:`CacheWarmer` thread wakes every ``interval``
+seconds and re-runs the ``top_n`` most popular queries whose cached result
+is missing or expires within ``refresh_ahead`` seconds. Interactive calls
+for those queries then find a fresh entry.
+
+Only queries worth at least ``min_score`` decayed hits are warmed, so a
+search asked once is never re-run in the background. A query whose refresh
+fails is skipped for a growing number of rounds (1, 3, 7, … up to
+:data:`MAX_BACKOFF_ROUNDS`) until a refresh succeeds.
+
+Warming only uses spare capacity:
+
+* it runs one search at a time on its own thread, not on the tool pool;
+* before each search it calls ``idle()``, and it ends the round as soon as
+  interactive traffic needs the capacity. The server's check is that no
+  request is waiting on the rate limiter and no tool call is queued;
+* its Google requests are charged to its own
+  :class:`~fli.search.RequestBudget`, a small share of the request rate, so
+  it cannot take more than that share even when idle.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from fli.search import RequestBudget, ResultCache, request_budget
+
+K = TypeVar("K", bound=Hashable)
+P = TypeVar("P")
+
+logger = logging.getLogger(__name__)
+
+# Most rounds a query whose refreshes keep failing is skipped for.
+MAX_BACKOFF_ROUNDS = 64
+
+
+class QueryPopularity(Generic[K, P]):
+    """Decaying hit counts of search queries, bounded in size.
+
+    Each :meth:`record` adds one to the query's score, and scores halve
+    every ``half_life`` seconds. Past ``max_queries``, the lowest-scoring
+    queries are forgotten.
+
+    Args:
+        half_life: Seconds after which a hit counts half as much.
+        max_queries: Queries tracked at once.
+        clock: Monotonic time source, in seconds (overridable for tests).
+
+    """
+
+    def __init__(
+        self,
+        half_life: float,
+        max_queries: int = 5000,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Start with no recorded queries."""
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+        if max_queries < 1:
+            raise ValueError("max_queries must be at least 1")
+        self.half_life = half_life
+        self.max_queries = max_queries
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key → (score at ``stamp``, stamp, query)
+        self._queries: dict[K, tuple[float, float, P]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of tracked queries."""
+        with self._lock:
+            return len(self._queries)
+
+    def record(self, key: K, query: P) -> None:
+        """Count one call of ``query``, stored under its normalised ``key``."""
+        now = self._clock()
+        with self._lock:
+            entry = self._queries.get(key)
+            score = 1.0 if entry is None else self._decayed(entry, now) + 1.0
+            self._queries[key] = (score, now, query)
+            # Prune in batches so recording stays O(1) on average.
+            if len(self._queries) > self.max_queries * 5 // 4 + 1:
+                self._prune(now)
+
+    def forget(self, key: K) -> None:
+        """Stop tracking ``key``."""
+        with self._lock:
+            self._queries.pop(key, None)
+
+    def top(self, n: int) -> list[tuple[K, P, float]]:
+        """Return up to ``n`` ``(key, query, score)`` triples, most popular first."""
+        now = self._clock()
+        with self._lock:
+            ranked = [
+                (key, entry[2], self._decayed(entry, now)) for key, entry in self._queries.items()
+            ]
+        ranked.sort(key=lambda item: item[2], reverse=True)
+        return ranked[:n]
+
+    def _decayed(self, entry: tuple[float, float, P], now: float) -> float:
+        score, stamp, _ = entry
+        return score * 0.5 ** ((now - stamp) / self.half_life)
+
+    def _prune(self, now: float) -> None:
+        ranked = sorted(self._queries, key=lambda k: self._decayed(self._queries[k], now))
+        for key in ranked[: len(ranked) - self.max_queries]:
+            del self._queries[key]
+
+
+@dataclass(frozen=True)
+class CacheWarmerStats:
+    """Point-in-time counters for a :class:`CacheWarmer`.
+
+    ``rounds_cut_short`` counts rounds ended early because interactive
+    traffic needed the capacity.
+    """
+
+    tracked: int
+    rounds: int
+    rounds_cut_short: int
+    refreshed: int
+    failed: int
+
+
+class CacheWarmer(Generic[K, P]):
+    """Re-run popular queries in the background before their cached results expire.
+
+    Args:
+        cache: Result cache to keep warm.
+        popularity: Query counts the warmer picks from.
+        refresh: Runs a query and returns its response; a response whose
+            ``success`` is true is cached. Returning None drops the query
+            from ``popularity`` (e.g. its date has passed).
+        budget: Request budget charged for every refresh.
+        interval: Seconds between rounds.
+        top_n: Most popular queries considered per round.
+        refresh_ahead: Refresh entries that expire within this many seconds.
+        min_score: Least popularity score (decayed hits) a query needs to be
+            refreshed.
+        idle: Returns False while interactive traffic needs the capacity.
+
+    """
+
+    def __init__(
+        self,
+        cache: ResultCache[K, dict[str, Any]],
+        popularity: QueryPopularity[K, P],
+        refresh: Callable[[P], dict[str, Any] | None],
+        *,
+        budget: RequestBudget,
+        interval: float,
+        top_n: int,
+        refresh_ahead: float,
+        min_score: float = 2.0,
+        idle: Callable[[], bool] = lambda: True,
+    ):
+        """Create a stopped warmer; call :meth:`start` to run it."""
+        self.cache = cache
+        self.popularity = popularity
+        self.interval = interval
+        self.top_n = top_n
+        self.refresh_ahead = refresh_ahead
+        self.min_score = min_score
+        self._refresh = refresh
+        self._budget = budget
+        self._idle = idle
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._rounds = self._cut_short = self._refreshed = self._failed = 0
+        # key → (consecutive failed refreshes, first round it is retried in).
+        # Only touched by the thread running :meth:`run_once`.
+        self._backoff: dict[K, tuple[int, int]] = {}
+
+    def start(self) -> None:
+        """Start the background thread (no-op if it is already running)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._loop, name="fli-mcp-cache-warmer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Ask the thread to stop after the current refresh and wait up to ``timeout``."""
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+
+    def run_once(self) -> int:
+        """Run one round in the calling thread and return the number of refreshed entries."""
+        refreshed = failed = 0
+        cut_short = False
+        with self._lock:
+            round_number = self._rounds
+        popular = [
+            (key, query)
+            for key, query, score in self.popularity.top(self.top_n)
+            if score >= self.min_score
+        ]
+        for key, query in popular:
+            if self._stop.is_set():
+                break
+            backoff = self._backoff.get(key)
+            if backoff is not None and backoff[1] > round_number:
+                continue
+            expires_in = self.cache.expires_in(key)
+            if expires_in is not None and expires_in > self.refresh_ahead:
+                continue
+            if not self._idle():
+                cut_short = True
+                break
+            try:
+                with request_budget(self._budget):
+                    result = self._refresh(query)
+            except Exception:
+                logger.warning("Cache warm-up refresh failed", exc_info=True)
+                result = {}
+            if result is None:
+                self.popularity.forget(key)
+                self._backoff.pop(key, None)
+            elif result.get("success"):
+                self.cache.put(key, result)
+                self._backoff.pop(key, None)
+                refreshed += 1
+            else:
+                failures = backoff[0] + 1 if backoff is not None else 1
+                skip = min(2**failures - 1, MAX_BACKOFF_ROUNDS)
+                self._backoff[key] = (failures, round_number + 1 + skip)
+                failed += 1
+        # Forget the failures of queries that are no longer popular.
+        keep = {key for key, _ in popular}
+        self._backoff = {k: v for k, v in self._backoff.items() if k in keep}
+        with self._lock:
+            self._rounds += 1
+            self._cut_short += cut_short
+            self._refreshed += refreshed
+            self._failed += failed
+        return refreshed
+
+    def stats(self) -> CacheWarmerStats:
+        """Return a snapshot of the warmer's counters."""
+        with self._lock:
+            return CacheWarmerStats(
+                tracked=len(self.popularity),
+                rounds=self._rounds,
+                rounds_cut_short=self._cut_short,
+                refreshed=self._refreshed,
+                failed=self._failed,
+            )
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception:  # noqa: BLE001 — keep warming after an unexpected error
+                logger.exception("Cache warm-up round failed")
@@ -0,0 +1,302 @@
+"""Prometheus text exposition for the MCP HTTP server's ``/metrics`` endpoint.
+
+The server exports its own counters (tool latency, tool pool, result cache,
+page store). It also exports those of the search library underneath it:
+the HTTP client (:class:`~fli.search.ClientStats`), the rate limiter
+(:class:`~fli.search.LimiterStats`), the shared executor
+(:class:`~fli.search.ExecutorStats`) and the decoders
+(:class:`~fli.search.DecodeStats`).
+
+Everything is rendered by hand in the `text exposition format
+<https://prometheus.io/docs/instrumenting/exposition_formats/>`_, version
+0.0.4, so no client library or external service is needed.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from fli.mcp._cache_warmer import CacheWarmerStats
+from fli.mcp._tool_pool import ToolPoolStats
+from fli.search import ResultCacheStats
+from fli.search._metrics import REQUEST_SECONDS_BOUNDS, Histogram, HistogramSnapshot
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class ToolMetrics:
+    """Latency histograms of MCP search calls by tool and outcome.
+
+    ``outcome`` is ``"ok"``, ``"error"`` (the search failed), ``"cached"``
+    (answered from the result cache), ``"busy"`` (rejected by a full tool
+    pool) or ``"quota"`` (rejected by the tenant's in-flight quota).
+    """
+
+    def __init__(self) -> None:
+        """Start with no observations."""
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+
+    def observe(self, tool: str, outcome: str, seconds: float) -> None:
+        """Record one call of ``tool`` that ended with ``outcome`` after ``seconds``."""
+        with self._lock:
+            histogram = self._histograms.get((tool, outcome))
+            if histogram is None:
+                histogram = self._histograms[tool, outcome] = Histogram(REQUEST_SECONDS_BOUNDS)
+        histogram.observe(seconds)
+
+    def snapshot(self) -> dict[tuple[str, str], HistogramSnapshot]:
+        """Return the histograms keyed by ``(tool, outcome)``."""
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {key: h.snapshot() for key, h in sorted(histograms.items())}
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+@dataclass
+class _Family:
+    kind: str
+    help: str
+    samples: list[str] = field(default_factory=list)
+
+
+class Exposition:
+    """Collects metric families and renders them as Prometheus text.
+
+    Samples added under the same name join one family, so its ``# HELP``
+    and ``# TYPE`` lines appear once, as the format requires.
+    """
+
+    def __init__(self) -> None:
+        """Start an empty exposition."""
+        self._families: dict[str, _Family] = {}
+
+    def _family(self, name: str, kind: str, help: str) -> _Family:
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = _Family(kind, help)
+        return family
+
+    def counter(
+        self, name: str, help: str, value: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """Add a counter sample; ``name`` should end in ``_total``."""
+        family = self._family(name, "counter", help)
+        family.samples.append(f"{name}{_labels(labels or {})} {_number(value)}")
+
+    def gauge(
+        self, name: str, help: str, value: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """Add a gauge sample."""
+        family = self._family(name, "gauge", help)
+        family.samples.append(f"{name}{_labels(labels or {})} {_number(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        snapshot: HistogramSnapshot,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """Add a histogram, converting per-bucket counts to cumulative ``_bucket`` samples."""
+        family = self._family(name, "histogram", help)
+        labels = dict(labels or {})
+        cumulative = 0
+        for bound, count in zip(snapshot.bounds, snapshot.counts, strict=True):
+            cumulative += count
+            bucket = _labels({**labels, "le": _number(bound)})
+            family.samples.append(f"{name}_bucket{bucket} {cumulative}")
+        family.samples.append(f"{name}_sum{_labels(labels)} {_number(snapshot.sum)}")
+        family.samples.append(f"{name}_count{_labels(labels)} {snapshot.count}")
+
+    def render(self) -> str:
+        """Return the exposition text, ending with a newline."""
+        lines: list[str] = []
+        for name, family in self._families.items():
+            lines.append(f"# HELP {name} {family.help}")
+            lines.append(f"# TYPE {name} {family.kind}")
+            lines.extend(family.samples)
+        return "\n".join(lines) + "\n"
+
+
+def add_search_metrics(out: Exposition) -> None:
+    """Add the search library's client, limiter, executor and decoder counters to ``out``."""
+    from fli.search import decode_stats, executor_stats
+    from fli.search._concurrency import WAIT_HISTOGRAM_BOUNDS
+    from fli.search.client import get_client
+
+    client = get_client()
+    requests = client.stats()
+    for (method, outcome), count in sorted(requests.requests.items()):
+        out.counter(
+            "fli_google_requests_total",
+            "HTTP attempts sent to Google Flights, by method and outcome.",
+            count,
+            {"method": method, "outcome": outcome},
+        )
+    out.counter("fli_google_retries_total", "HTTP attempts that were retried.", requests.retries)
+    out.histogram(
+        "fli_google_request_duration_seconds",
+        "Duration of HTTP attempts to Google Flights, excluding rate-limiter waits.",
+        requests.latency,
+    )
+
+    limiter = client.limiter_stats()
+    out.histogram(
+        "fli_rate_limiter_wait_seconds",
+        "Time requests waited for a rate-limiter token.",
+        HistogramSnapshot(
+            WAIT_HISTOGRAM_BOUNDS,
+            limiter.wait_histogram,
+            limiter.acquisitions,
+            limiter.total_wait_s,
+        ),
+    )
+    out.gauge("fli_rate_limiter_waiters", "Requests waiting for a token now.", limiter.waiters)
+    out.counter("fli_rate_limiter_timeouts_total", "Token waits that timed out.", limiter.timeouts)
+    out.counter(
+        "fli_rate_limiter_cancellations_total",
+        "Token waits abandoned by cancellation.",
+        limiter.cancellations,
+    )
+
+    pool = executor_stats()
+    out.gauge("fli_executor_workers", "Worker threads of the shared executor.", pool.max_workers)
+    out.gauge("fli_executor_running", "Tasks running on the shared executor.", pool.running)
+    out.gauge("fli_executor_queued", "Tasks waiting for a shared-executor worker.", pool.queued)
+    for state, value in (
+        ("submitted", pool.submitted),
+        ("completed", pool.completed),
+        ("cancelled", pool.cancelled),
+    ):
+        out.counter(
+            "fli_executor_tasks_total", "Shared-executor tasks by state.", value, {"state": state}
+        )
+    out.counter(
+        "fli_executor_queue_seconds_total",
+        "Time started tasks spent waiting for a worker.",
+        pool.total_queue_s,
+    )
+    out.counter(
+        "fli_executor_run_seconds_total", "Time completed tasks spent running.", pool.total_run_s
+    )
+
+    decode = decode_stats()
+    for decoder, snapshot in sorted(decode.duration.items()):
+        out.histogram(
+            "fli_decode_duration_seconds",
+            "Time spent decoding Google Flights responses, by decoder.",
+            snapshot,
+            {"decoder": decoder},
+        )
+        out.counter(
+            "fli_decode_errors_total",
+            "Decoder runs that raised, by decoder.",
+            decode.errors.get(decoder, 0),
+            {"decoder": decoder},
+        )
+    out.counter("fli_flight_rows_total", "Flight rows seen in responses.", decode.rows)
+    out.counter(
+        "fli_flight_rows_failed_total", "Flight rows skipped as unparseable.", decode.failed_rows
+    )
+    out.counter(
+        "fli_parse_errors_total",
+        "Responses that could not be parsed into flights (SearchParseError).",
+        decode.parse_errors,
+    )
+
+
+def add_server_metrics(
+    out: Exposition,
+    tools: ToolMetrics,
+    pool: ToolPoolStats,
+    cache: ResultCacheStats | None,
+    pages: ResultCacheStats,
+    warmer: CacheWarmerStats | None = None,
+) -> None:
+    """Add the MCP server's tool, tool pool, cache, page store and cache warmer counters."""
+    for (tool, outcome), snapshot in tools.snapshot().items():
+        out.histogram(
+            "fli_mcp_tool_duration_seconds",
+            "Duration of MCP search calls, by tool and outcome.",
+            snapshot,
+            {"tool": tool, "outcome": outcome},
+        )
+    out.gauge("fli_mcp_tool_pool_workers", "Threads of the MCP tool pool.", pool.max_workers)
+    out.gauge("fli_mcp_tool_pool_running", "Searches running on the tool pool.", pool.running)
+    out.gauge("fli_mcp_tool_pool_queued", "Searches waiting for a tool-pool worker.", pool.queued)
+    out.gauge(
+        "fli_mcp_tool_pool_peak_in_flight",
+        "Highest number of running plus queued searches so far.",
+        pool.peak_in_flight,
+    )
+    out.counter("fli_mcp_tool_pool_completed_total", "Searches completed.", pool.completed)
+    out.counter(
+        "fli_mcp_tool_pool_rejected_total", "Searches rejected as 'Server busy'.", pool.rejected
+    )
+    out.gauge("fli_mcp_tenants_active", "Tenants with searches in flight.", pool.tenants)
+    out.counter(
+        "fli_mcp_tenant_quota_rejected_total",
+        "Searches rejected by a tenant's in-flight quota.",
+        pool.quota_rejected,
+    )
+
+    for store, stats in (("result_cache", cache), ("page_store", pages)):
+        if stats is None:
+            continue
+        labels = {"store": store}
+        out.gauge("fli_mcp_cache_entries", "Entries held, by store.", stats.entries, labels)
+        out.gauge("fli_mcp_cache_bytes", "Approximate bytes held, by store.", stats.bytes, labels)
+        out.gauge("fli_mcp_cache_max_bytes", "Memory budget, by store.", stats.max_bytes, labels)
+        for event, value in (
+            ("hit", stats.hits),
+            ("miss", stats.misses),
+            ("eviction", stats.evictions),
+            ("expiration", stats.expirations),
+        ):
+            out.counter(
+                "fli_mcp_cache_events_total",
+                "Cache lookups and removals, by store and event.",
+                value,
+                {**labels, "event": event},
+            )
+
+    if warmer is not None:
+        out.gauge(
+            "fli_mcp_cache_warmer_tracked_queries",
+            "Searches tracked for popularity.",
+            warmer.tracked,
+        )
+        out.counter("fli_mcp_cache_warmer_rounds_total", "Warm-up rounds run.", warmer.rounds)
+        out.counter(
+            "fli_mcp_cache_warmer_rounds_cut_short_total",
+            "Warm-up rounds ended early to leave capacity to tool calls.",
+            warmer.rounds_cut_short,
+        )
+        for result, value in (("ok", warmer.refreshed), ("error", warmer.failed)):
+            out.counter(
+                "fli_mcp_cache_warmer_refreshes_total",
+                "Background refreshes of popular searches, by result.",
+                value,
+                {"result": result},
+            )
@@ -0,0 +1,213 @@
+"""Response shaping for the MCP search tools: projection, tables and pages.
+
+A ``show_all_results`` flight search can serialise to hundreds of KB of
+JSON. That costs time to encode and space in the model's context. The
+search tools accept three options to cut it down. They can be combined:
+
+* ``fields`` keeps only the named fields of each result. Dotted paths
+  reach into nested objects and lists: ``legs.flight_number`` keeps only
+  the flight number of every leg.
+* ``format="table"`` writes the results as one ``columns`` list plus one
+  ``rows`` list, so field names are not repeated for every result. A
+  column that holds lists of objects (such as ``legs``) has its own columns
+  listed once under ``subcolumns``, and its cells are lists of rows.
+* ``page_size`` returns the results one page at a time. The full result
+  list stays in a :class:`PageStore` on the server under a random handle.
+  Later pages are fetched with the returned ``next_cursor``, without
+  searching again.
+"""
+
+from __future__ import annotations
+
+import secrets
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from fli.search import ResultCache, ResultCacheStats
+from fli.search._result_cache import approx_size
+
+ResultFormat = Literal["records", "table"]
+
+# A projection tree: field name -> None (keep the whole value) or a subtree.
+_Tree = dict[str, "_Tree | None"]
+
+
+def _projection_tree(fields: Iterable[str]) -> _Tree:
+    tree: _Tree = {}
+    for path in fields:
+        node = tree
+        *parents, leaf = [part.strip() for part in path.split(".")]
+        for part in parents:
+            child = node.get(part, {})
+            if child is None:
+                break  # An ancestor is already kept whole.
+            node = node.setdefault(part, child)
+        else:
+            node[leaf] = None
+    return tree
+
+
+def _apply(value: Any, tree: _Tree) -> Any:
+    if isinstance(value, Mapping):
+        out = {}
+        for name, subtree in tree.items():
+            if name in value:
+                out[name] = value[name] if subtree is None else _apply(value[name], subtree)
+        return out
+    if isinstance(value, list):
+        return [_apply(item, tree) for item in value]
+    return value
+
+
+def project(records: Sequence[Mapping[str, Any]], fields: Iterable[str]) -> list[dict[str, Any]]:
+    """Return ``records`` reduced to ``fields``.
+
+    Args:
+        records: Serialised results (dicts).
+        fields: Field names to keep. ``a.b`` keeps only ``b`` inside ``a``;
+            when ``a`` is a list, ``b`` is kept in each of its items.
+            Fields a record does not have are skipped.
+
+    Returns:
+        New dicts holding only the requested fields, in the order requested.
+
+    """
+    tree = _projection_tree(fields)
+    return [_apply(record, tree) for record in records]
+
+
+def _columns(records: Iterable[Mapping[str, Any]]) -> list[str]:
+    # Union of keys in first-seen order: optional keys only present on some
+    # results still get a column.
+    return list(dict.fromkeys(key for record in records for key in record))
+
+
+def _is_record_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(v, Mapping) for v in value)
+
+
+def tabulate(records: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+    """Encode ``records`` as ``{"columns": [...], "rows": [[...], ...]}``.
+
+    Missing fields are ``None``. A column whose values are lists of objects
+    is itself tabulated: its columns are listed once under
+    ``subcolumns[<column>]`` and each cell becomes a list of rows.
+    """
+    columns = _columns(records)
+    nested = {
+        column: _columns(item for record in records for item in record.get(column) or ())
+        for column in columns
+        if any(_is_record_list(record.get(column)) for record in records)
+    }
+    rows = []
+    for record in records:
+        row = []
+        for column in columns:
+            value = record.get(column)
+            if column in nested and isinstance(value, list):
+                value = [[item.get(sub) for sub in nested[column]] for item in value]
+            row.append(value)
+        rows.append(row)
+    table: dict[str, Any] = {"columns": columns, "rows": rows}
+    if nested:
+        table["subcolumns"] = nested
+    return table
+
+
+def shape(
+    records: Sequence[Mapping[str, Any]],
+    fields: Sequence[str] | None = None,
+    format: ResultFormat = "records",
+) -> Any:
+    """Apply ``fields`` and then ``format`` to ``records``."""
+    if fields:
+        records = project(records, fields)
+    return tabulate(records) if format == "table" else list(records)
+
+
+class CursorError(LookupError):
+    """Raised for a cursor that is malformed, unknown or expired."""
+
+
+@dataclass(frozen=True)
+class _Pages:
+    key: str
+    records: Sequence[Mapping[str, Any]]
+    fields: tuple[str, ...] | None
+    format: ResultFormat
+    page_size: int
+
+
+class PageStore:
+    """Holds full result lists so their pages can be fetched one at a time.
+
+    Each stored list gets a random handle. A cursor names a handle and the
+    offset of the next page. Lists share a :class:`~fli.search.ResultCache`,
+    so they expire ``ttl`` seconds after the search and the least recently
+    paged lists are dropped once ``max_bytes`` is exceeded. A cursor for a
+    dropped list raises :class:`CursorError`.
+    """
+
+    def __init__(self, ttl: float, max_bytes: int):
+        """Create an empty store with the given expiry and memory budget."""
+        # ``_Pages`` is a plain dataclass, which approx_size does not walk:
+        # size the records it holds.
+        self._cache: ResultCache[str, _Pages] = ResultCache(
+            ttl, max_bytes, sizer=lambda pages: approx_size(pages.records)
+        )
+
+    def first_page(
+        self,
+        records: Sequence[Mapping[str, Any]],
+        *,
+        page_size: int,
+        fields: Sequence[str] | None = None,
+        format: ResultFormat = "records",
+        key: str = "results",
+    ) -> dict[str, Any]:
+        """Return the first page of ``records``, storing the rest for later pages.
+
+        Args:
+            records: The full, serialised result list.
+            page_size: Results per page.
+            fields: Projection applied to every page (see :func:`project`).
+            format: Encoding of every page (see :func:`shape`).
+            key: Name of the page's results in the returned dict.
+
+        Returns:
+            A dict with the shaped page under ``key``, plus ``count``,
+            ``offset``, ``total`` and ``next_cursor`` (None on the last page).
+            Later pages have the same shape.
+
+        """
+        pages = _Pages(key, records, tuple(fields) if fields else None, format, page_size)
+        handle = secrets.token_urlsafe(12) if len(records) > page_size else None
+        if handle is not None:
+            self._cache.put(handle, pages)
+        return self._page(handle, pages, 0)
+
+    def page(self, cursor: str) -> dict[str, Any]:
+        """Return the page ``cursor`` points at, shaped like the first page."""
+        handle, _, offset = cursor.rpartition(":")
+        pages = self._cache.get(handle) if handle else None
+        if pages is None or not offset.isdigit() or int(offset) >= len(pages.records):
+            raise CursorError(f"Unknown or expired cursor: '{cursor}'. Run the search again.")
+        return self._page(handle, pages, int(offset))
+
+    def stats(self) -> ResultCacheStats:
+        """Return counters of the underlying cache."""
+        return self._cache.stats()
+
+    @staticmethod
+    def _page(handle: str | None, pages: _Pages, offset: int) -> dict[str, Any]:
+        end = offset + pages.page_size
+        more = handle is not None and end < len(pages.records)
+        page = pages.records[offset:end]
+        return {
+            pages.key: shape(page, pages.fields, pages.format),
+            "count": len(page),
+            "offset": offset,
+            "total": len(pages.records),
+            "next_cursor": f"{handle}:{end}" if more else None,
+        }
@@ -0,0 +1,130 @@
+"""Tenant identity and per-tenant Google request budgets for the MCP server.
+
+Every search call that arrives over HTTP is attributed to a tenant: the
+API key sent in the configured header, or the MCP session when no header
+is configured (see :func:`identify_tenant`). Calls over stdio or in memory come
+from the one local client, which has nobody to share with, so they have no
+tenant and no quota. The tenant is used twice:
+
+* :class:`~fli.mcp._tool_pool.ToolPool` caps the calls one tenant may have
+  in flight and starts waiting calls of different tenants in turn;
+* :class:`TenantBudgets` gives each tenant a
+  :class:`~fli.search.RequestBudget`, a token bucket holding a share of the
+  client's global request rate. Every Google request a search sends,
+  including its fanned-out sub-requests, is charged to it first. A tenant
+  that has used up its share waits on its own bucket, so the global
+  limiter's capacity stays available to everyone else.
+
+API keys are hashed before they are used as tenant ids, so they never
+appear in stats or logs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fastmcp.server.dependencies import get_http_request
+
+from fli.search import RequestBudget
+from fli.search._concurrency import TokenBucketRateLimiter
+
+
+@dataclass(frozen=True)
+class Tenant:
+    """Who a tool call is charged to.
+
+    ``id`` is a stable key (``key:<hash>``, ``session:<id>``, …); ``owner``
+    describes the tenant in error messages ("this API key", …).
+    """
+
+    id: str
+    owner: str
+
+
+def identify_tenant(header: str) -> Tenant | None:
+    """Return the tenant of the current tool call.
+
+    Over HTTP with a ``header`` configured, its value is the tenant, and
+    every request without it shares one ``anonymous`` tenant. Otherwise
+    the MCP session id is used, then the client's address for stateless
+    requests. Clients choose their session ids, so a client can get a new
+    quota by opening a new session; and every client behind one reverse
+    proxy shares the proxy's address. Configure a header where that matters.
+
+    Calls that did not arrive over HTTP (stdio, in-memory) return None:
+    they come from the one local client and are not subject to quotas.
+    """
+    try:
+        request = get_http_request()
+    except RuntimeError:
+        return None
+    if header:
+        key = request.headers.get(header.lower())
+        if not key:
+            return Tenant("anonymous", "requests without an API key")
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return Tenant(f"key:{digest}", "this API key")
+    session = request.headers.get("mcp-session-id")
+    if session:
+        return Tenant(f"session:{session}", "this session")
+    if request.client is not None:
+        return Tenant(f"address:{request.client.host}", "this client address")
+    return None
+
+
+def share_limiter(share: float) -> TokenBucketRateLimiter:
+    """Return a token bucket refilling at ``share`` of the shared client's request rate."""
+    from fli.search.client import get_client
+
+    rate = share * get_client().requests_per_second
+    # Whole tokens only: a burst of ``calls`` refilled over ``calls / rate`` seconds.
+    calls = max(1, math.ceil(rate))
+    return TokenBucketRateLimiter(calls=calls, period=calls / rate)
+
+
+class TenantBudgets:
+    """Lazily created :class:`~fli.search.RequestBudget` per tenant.
+
+    Args:
+        share: Fraction of the client's request rate each tenant may use,
+            in ``(0, 1]``.
+        max_wait: Seconds a request waits for its tenant's budget before
+            the search fails with :class:`~fli.search.SearchQuotaError`.
+        max_tenants: Budgets kept at once. The least recently used one is
+            dropped beyond this; that tenant starts again with a full bucket.
+
+    """
+
+    def __init__(self, share: float, max_wait: float, max_tenants: int = 1024):
+        """Create an empty registry; budgets are created on first use."""
+        if not 0 < share <= 1:
+            raise ValueError("share must be in (0, 1]")
+        self.share = share
+        self.max_wait = max_wait
+        self.max_tenants = max_tenants
+        self._lock = threading.Lock()
+        self._budgets: OrderedDict[str, RequestBudget] = OrderedDict()
+
+    def budget(self, tenant: Tenant) -> RequestBudget:
+        """Return ``tenant``'s budget, creating it with a full bucket if needed."""
+        with self._lock:
+            budget = self._budgets.get(tenant.id)
+            if budget is not None:
+                self._budgets.move_to_end(tenant.id)
+                return budget
+        budget = RequestBudget(share_limiter(self.share), self.max_wait, tenant.owner)
+        with self._lock:
+            budget = self._budgets.setdefault(tenant.id, budget)
+            self._budgets.move_to_end(tenant.id)
+            while len(self._budgets) > self.max_tenants:
+                self._budgets.popitem(last=False)
+        return budget
+
+    def __len__(self) -> int:
+        """Return the number of tenants holding a budget."""
+        with self._lock:
+            return len(self._budgets)
@@ -0,0 +1,317 @@
+"""Bounded worker pool that keeps blocking MCP tool calls off the event loop.
+
+A flight or date search blocks for the full Google round trip, plus every
+chunk or round-trip expansion behind it. FastMCP runs plain ``def`` tools
+in the anyio default thread pool, which is shared with everything else the
+server offloads. There, a burst of slow searches starves unrelated work,
+and nothing stops a burst from growing without bound.
+
+The search tools are ``async def`` and hand their synchronous body to a
+:class:`ToolPool` instead:
+
+* a dedicated :class:`~concurrent.futures.ThreadPoolExecutor` caps how
+  many searches run at once (``max_workers``);
+* at most ``max_queued`` more calls wait for a worker. Waiting callers hold
+  no thread, only a queued work item;
+* past that, :meth:`ToolPool.run` raises :class:`ToolPoolFullError`
+  straight away (backpressure) rather than queueing without limit;
+* a caller that goes away (client disconnect, request cancelled) drops
+  its queued work item. A search that has already started runs to
+  completion;
+* calls can be tagged with a ``tenant`` (an API key or MCP session). Each
+  tenant has its own wait queue and free workers take the next call from
+  those queues in turn, so a tenant with a long backlog cannot delay the
+  others by more than one call per round. ``max_per_tenant`` caps how many
+  calls one tenant may have in flight; more raise
+  :class:`TenantQuotaError`, or wait for one of the tenant's calls to
+  finish when run with ``wait_for_quota=True``.
+
+The executor's threads are separate from the shared search executor in
+:mod:`fli.search._concurrency`. A tool thread that fans a search out into
+that executor can therefore never deadlock waiting on itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class ToolPoolFullError(RuntimeError):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class TenantQuotaError(RuntimeError):
+    """Raised when a tenant already has ``max_per_tenant`` calls in flight."""
+
+
+@dataclass(frozen=True)
+class ToolPoolStats:
+    """Point-in-time counters for a :class:`ToolPool`.
+
+    ``tenants`` counts the tenants with calls in flight; untagged calls
+    count as one tenant.
+    """
+
+    max_workers: int
+    max_queued: int
+    running: int
+    queued: int
+    peak_in_flight: int
+    completed: int
+    rejected: int
+    tenants: int
+    quota_rejected: int
+
+
+@dataclass
+class _Call:
+    tenant: str | None
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    context: contextvars.Context
+    future: Future[Any]
+
+
+class ToolPool:
+    """Run blocking callables on a dedicated, bounded thread pool from async code.
+
+    Args:
+        max_workers: Calls that run at once.
+        max_queued: Calls that may wait for a free worker. Calls beyond that
+            are rejected with :class:`ToolPoolFullError`.
+        max_per_tenant: Calls one tenant may have running or waiting.
+            Calls beyond that are rejected with :class:`TenantQuotaError`,
+            or wait when run with ``wait_for_quota``. ``None`` means no
+            per-tenant limit.
+        thread_name_prefix: Prefix for the worker thread names.
+
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queued: int,
+        *,
+        max_per_tenant: int | None = None,
+        thread_name_prefix: str = "fli-mcp-tool",
+    ):
+        """Create the pool; worker threads are started lazily on first use."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queued < 0:
+            raise ValueError("max_queued must not be negative")
+        if max_per_tenant is not None and max_per_tenant < 1:
+            raise ValueError("max_per_tenant must be at least 1")
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_per_tenant = max_per_tenant
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        # Calls handed to the executor and not finished; never above max_workers,
+        # so the executor's own FIFO queue stays empty and the order is ours.
+        self._dispatched = 0
+        self._queues: dict[str | None, deque[_Call]] = {}
+        # Tenants with waiting calls, in the order they get the next free worker.
+        self._turns: deque[str | None] = deque()
+        self._tenant_in_flight: dict[str | None, int] = {}
+        # Calls waiting for their tenant to drop below max_per_tenant, per tenant.
+        self._quota_waiters: dict[str, deque[Future[None]]] = {}
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._quota_rejected = 0
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        /,
+        *args: Any,
+        tenant: str | None = None,
+        wait_for_quota: bool = False,
+    ) -> T:
+        """Run ``fn(*args)`` on a worker and await its result.
+
+        The caller's context variables are copied into the worker. Waiting
+        calls of different tenants are started in round-robin order. With
+        ``wait_for_quota``, a call over its tenant's ``max_per_tenant``
+        waits for one of the tenant's calls to finish instead of failing;
+        it holds no place in the pool while it waits.
+
+        Raises:
+            ToolPoolFullError: Every worker is busy and ``max_queued`` calls
+                are already waiting.
+            TenantQuotaError: ``tenant`` already has ``max_per_tenant``
+                calls in flight and ``wait_for_quota`` is false.
+
+        """
+        future: Future[T] = Future()
+        while True:
+            with self._lock:
+                if self._in_flight >= self.max_workers + self.max_queued:
+                    self._rejected += 1
+                    raise ToolPoolFullError(
+                        f"Server busy: {self._in_flight} searches in flight; retry shortly"
+                    )
+                held = self._tenant_in_flight.get(tenant, 0)
+                over_quota = (
+                    tenant is not None
+                    and self.max_per_tenant is not None
+                    and held >= self.max_per_tenant
+                )
+                if not over_quota:
+                    self._in_flight += 1
+                    self._tenant_in_flight[tenant] = held + 1
+                    self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+                    queue = self._queues.get(tenant)
+                    if queue is None:
+                        queue = self._queues[tenant] = deque()
+                        self._turns.append(tenant)
+                    queue.append(_Call(tenant, fn, args, contextvars.copy_context(), future))
+                    ready = self._take_ready()
+                    break
+                if not wait_for_quota:
+                    self._quota_rejected += 1
+                    raise TenantQuotaError(
+                        f"Quota exceeded: this client already has {held} searches in flight "
+                        f"(limit {self.max_per_tenant}). Wait for one to finish, then retry."
+                    )
+                slot: Future[None] = Future()
+                self._quota_waiters.setdefault(tenant, deque()).append(slot)
+            # Woken when one of the tenant's calls finishes; then try again.
+            try:
+                await asyncio.wrap_future(slot)
+            except asyncio.CancelledError:
+                # Cancelled after being woken: pass the free slot on.
+                if not slot.cancelled():
+                    self._wake_quota_waiter(tenant)
+                raise
+        future.add_done_callback(partial(self._release, tenant))
+        self._dispatch(ready)
+        # Cancelling the awaiting task cancels the future, which drops the
+        # call if no worker has picked it up yet.
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> ToolPoolStats:
+        """Return a snapshot of the pool's load and counters."""
+        with self._lock:
+            return ToolPoolStats(
+                max_workers=self.max_workers,
+                max_queued=self.max_queued,
+                running=self._running,
+                queued=self._in_flight - self._running,
+                peak_in_flight=self._peak_in_flight,
+                completed=self._completed,
+                rejected=self._rejected,
+                tenants=len(self._tenant_in_flight),
+                quota_rejected=self._quota_rejected,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads; the pool restarts them if used again.
+
+        Waiting calls are cancelled; calls already started run to completion.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            waiting = [call for queue in self._queues.values() for call in queue]
+            self._queues.clear()
+            self._turns.clear()
+        for call in waiting:
+            call.future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _take_ready(self) -> list[_Call]:
+        """Claim waiting calls for free workers, one tenant at a time (caller holds the lock)."""
+        ready: list[_Call] = []
+        while self._dispatched < self.max_workers and self._turns:
+            tenant = self._turns.popleft()
+            queue = self._queues[tenant]
+            call = queue.popleft()
+            if queue:
+                self._turns.append(tenant)
+            else:
+                del self._queues[tenant]
+            # False when the caller cancelled while the call was waiting.
+            if call.future.set_running_or_notify_cancel():
+                self._dispatched += 1
+                ready.append(call)
+        return ready
+
+    def _dispatch(self, ready: list[_Call]) -> None:
+        for call in ready:
+            with self._lock:
+                executor = self._executor
+                if executor is None:
+                    executor = self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self._thread_name_prefix,
+                    )
+            try:
+                executor.submit(call.context.run, self._call, call)
+            except BaseException as e:
+                with self._lock:
+                    self._dispatched -= 1
+                call.future.set_exception(e)
+
+    def _call(self, call: _Call) -> None:
+        with self._lock:
+            self._running += 1
+        error: BaseException | None = None
+        try:
+            result = call.fn(*call.args)
+        except BaseException as e:
+            error = e
+        # Free the worker before resolving the future, so a caller that sees
+        # the result also sees consistent stats.
+        with self._lock:
+            self._running -= 1
+            self._dispatched -= 1
+            ready = self._take_ready()
+        self._dispatch(ready)
+        if error is not None:
+            call.future.set_exception(error)
+        else:
+            call.future.set_result(result)
+
+    def _release(self, tenant: str | None, future: Future[Any]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            held = self._tenant_in_flight[tenant] - 1
+            if held:
+                self._tenant_in_flight[tenant] = held
+            else:
+                del self._tenant_in_flight[tenant]
+            if not future.cancelled():
+                self._completed += 1
+        if tenant is not None:
+            self._wake_quota_waiter(tenant)
+
+    def _wake_quota_waiter(self, tenant: str) -> None:
+        """Wake the first call still waiting for ``tenant`` to drop below its quota."""
+        with self._lock:
+            waiters = self._quota_waiters.get(tenant)
+            woken = None
+            while waiters:
+                slot = waiters.popleft()
+                # False when the waiting caller has been cancelled.
+                if slot.set_running_or_notify_cancel():
+                    woken = slot
+                    break
+            if waiters is not None and not waiters:
+                del self._quota_waiters[tenant]
+        if woken is not None:
+            woken.set_result(None)
@@ -3,42 +3,50 @@
 This module provides an MCP (Model Context Protocol) server for flight search
 functionality, enabling AI assistants to search for flights and find cheapest
 travel dates.
+
+Importing it stays cheap: :mod:`fli.core`, :mod:`fli.models` (the airport and
+airline enums), babel and the search classes are only imported by the first
+tool call that needs them. ``run()`` and ``run_http()`` start importing them
+in the background while the client connects. ``SearchFlights``,
+``SearchDates`` and ``CONFIG_SCHEMA`` are still module attributes, resolved
+on first access.
 """
 
+import asyncio
+import concurrent.futures
+import importlib
 import json
 import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
-from typing import Annotated, Any
+from functools import partial
+from typing import TYPE_CHECKING, Annotated, Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from mcp.types import Icon
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-
-from fli.core import (
-    build_date_search_segments,
-    build_flight_segments,
-    build_time_restrictions,
-    parse_airlines,
-    parse_alliances,
-    parse_cabin_class,
-    parse_currency,
-    parse_emissions,
-    parse_max_stops,
-    parse_sort_by,
-    resolve_airport,
-    search_airports,
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+from fli.mcp._cache_warmer import CacheWarmer, QueryPopularity
+from fli.mcp._metrics import (
+    CONTENT_TYPE,
+    Exposition,
+    ToolMetrics,
+    add_search_metrics,
+    add_server_metrics,
 )
-from fli.core.parsers import ParseError
-from fli.models import (
-    Airport,
-    BagsFilter,
-    DateSearchFilters,
-    FlightSearchFilters,
-    PassengerInfo,
-    TripType,
-)
-from fli.search import SearchDates, SearchFlights
+from fli.mcp._payload import CursorError, PageStore, ResultFormat, project, shape
+from fli.mcp._tenants import Tenant, TenantBudgets, identify_tenant, share_limiter
+from fli.mcp._tool_pool import TenantQuotaError, ToolPool, ToolPoolFullError
+from fli.search import RequestBudget, ResultCache, SearchProgress, request_budget
+
+if TYPE_CHECKING:
+    from fli.models import Airport
 
 
 class FlightSearchConfig(BaseSettings):
@@ -74,10 +82,160 @@ class FlightSearchConfig(BaseSettings):
         gt=0,
         description="Optional maximum number of results returned by each tool.",
     )
+    tool_workers: int = Field(
+        32,
+        ge=1,
+        description="Searches the server runs at once; further calls wait for a worker.",
+    )
+    tool_queue: int = Field(
+        256,
+        ge=0,
+        description=(
+            "Searches that may wait for a free worker; beyond this, calls are "
+            "rejected with a 'Server busy' error instead of queueing."
+        ),
+    )
+    batch_max_queries: int = Field(
+        20,
+        ge=1,
+        description="Maximum number of queries accepted by one search_flights_batch call.",
+    )
+    batch_max_in_flight: int = Field(
+        8,
+        ge=1,
+        description="Distinct queries of one search_flights_batch call searched at once.",
+    )
+    cache_ttl: float = Field(
+        300.0,
+        ge=0,
+        description="Seconds a search result is reused for identical calls (0 disables).",
+    )
+    cache_max_bytes: int = Field(
+        64 * 1024 * 1024,
+        gt=0,
+        description="Approximate memory budget for cached search results, in bytes.",
+    )
+    page_ttl: float = Field(
+        900.0,
+        gt=0,
+        description="Seconds the results of a paginated search stay available for later pages.",
+    )
+    page_max_bytes: int = Field(
+        32 * 1024 * 1024,
+        gt=0,
+        description="Approximate memory budget for results held for pagination, in bytes.",
+    )
+    metrics: bool = Field(
+        False,
+        description="Serve Prometheus metrics at /metrics on the HTTP transport.",
+    )
+    cache_warm: bool = Field(
+        False,
+        description=(
+            "Refresh the most popular searches in the background before their cached "
+            "results expire, using spare request capacity."
+        ),
+    )
+    cache_warm_interval: float = Field(
+        60.0,
+        gt=0,
+        description="Seconds between cache warm-up rounds.",
+    )
+    cache_warm_top_n: int = Field(
+        100,
+        ge=1,
+        description="Most popular searches considered in each warm-up round.",
+    )
+    cache_warm_refresh_ahead: float = Field(
+        60.0,
+        ge=0,
+        description="Refresh cached results that expire within this many seconds.",
+    )
+    cache_warm_request_share: float = Field(
+        0.2,
+        gt=0,
+        le=1,
+        description="Fraction of the Google request rate cache warming may use.",
+    )
+    cache_warm_min_score: float = Field(
+        2.0,
+        ge=0,
+        description=(
+            "Least popularity (decayed calls) a search needs before it is warmed, so "
+            "searches asked only once are not re-run in the background."
+        ),
+    )
+    cache_warm_half_life: float = Field(
+        3600.0,
+        gt=0,
+        description="Seconds after which a search counts half as much towards its popularity.",
+    )
+    tenant_header: str = Field(
+        "x-api-key",
+        description=(
+            "HTTP header identifying a tenant by API key; requests without it share "
+            "one 'anonymous' tenant. Empty to group by MCP session instead (clients "
+            "pick their session ids, so a new session gets a new quota) or, for "
+            "stateless requests, by address (all clients behind a proxy share one)."
+        ),
+    )
+    tenant_max_in_flight: int | None = Field(
+        8,
+        ge=1,
+        description=(
+            "Searches one tenant may have running or waiting; beyond this, its calls "
+            "are rejected with a 'Quota exceeded' error. Null for no limit."
+        ),
+    )
+    tenant_request_share: float = Field(
+        0.5,
+        gt=0,
+        le=1,
+        description="Fraction of the Google request rate one tenant may use.",
+    )
+    tenant_max_wait: float = Field(
+        30.0,
+        gt=0,
+        description=(
+            "Seconds a search waits for its tenant's share of the request rate before "
+            "failing with a 'Request quota exceeded' error."
+        ),
+    )
 
 
 CONFIG = FlightSearchConfig()
-CONFIG_SCHEMA = FlightSearchConfig.model_json_schema()
+
+# Dedicated, bounded pool for the blocking search tools (see fli.mcp._tool_pool).
+TOOL_POOL = ToolPool(
+    CONFIG.tool_workers, CONFIG.tool_queue, max_per_tenant=CONFIG.tenant_max_in_flight
+)
+
+# Each tenant's share of the Google request rate (see fli.mcp._tenants).
+TENANT_BUDGETS = TenantBudgets(CONFIG.tenant_request_share, CONFIG.tenant_max_wait)
+
+# Successful tool responses shared across calls and sessions, keyed by
+# normalised parameters (see _cache_key). None when caching is disabled.
+RESULT_CACHE: ResultCache[tuple[str, str], dict[str, Any]] | None = (
+    ResultCache(CONFIG.cache_ttl, CONFIG.cache_max_bytes) if CONFIG.cache_ttl > 0 else None
+)
+
+# Full result lists of paginated searches, fetched page by page with
+# get_results_page (see fli.mcp._payload).
+PAGE_STORE = PageStore(CONFIG.page_ttl, CONFIG.page_max_bytes)
+
+# Latency of search calls by tool and outcome, exported at /metrics.
+TOOL_METRICS = ToolMetrics()
+
+# How often each search is asked for, and the thread that keeps the most
+# popular ones cached (see fli.mcp._cache_warmer). The warmer is created by
+# _start_cache_warmer when the server starts; both are None when cache
+# warming or the result cache is disabled.
+QUERY_POPULARITY: QueryPopularity[tuple[str, str], Any] | None = (
+    QueryPopularity(CONFIG.cache_warm_half_life)
+    if CONFIG.cache_warm and RESULT_CACHE is not None
+    else None
+)
+CACHE_WARMER: CacheWarmer[tuple[str, str], Any] | None = None
 
 
 mcp = FastMCP(
@@ -389,21 +547,94 @@ def _serialize_date_result(date_result: Any) -> dict[str, Any]:
     }
 
 
+# =============================================================================
+# Deferred Imports
+# =============================================================================
+
+# Modules the tools need but start-up does not; see the module docstring.
+_DEFERRED_MODULES = ("fli.core", "fli.models", "fli.search.flights", "fli.search.dates")
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``SearchFlights``, ``SearchDates`` and ``CONFIG_SCHEMA`` on first access."""
+    if name in ("SearchFlights", "SearchDates"):
+        value = getattr(importlib.import_module("fli.search"), name)
+    elif name == "CONFIG_SCHEMA":
+        value = FlightSearchConfig.model_json_schema()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def _search_class(name: str) -> Any:
+    # Looked up on the module, so a patched ``server.SearchFlights`` is used.
+    return globals().get(name) or __getattr__(name)
+
+
+def _config_schema() -> dict[str, Any]:
+    return globals().get("CONFIG_SCHEMA") or __getattr__("CONFIG_SCHEMA")
+
+
+def _warm_up() -> None:
+    for module in _DEFERRED_MODULES:
+        importlib.import_module(module)
+
+
+def _start_warm_up() -> None:
+    """Import the deferred modules on a background thread.
+
+    The server starts accepting connections straight away; by the time a
+    client has finished its handshake, the first tool call usually finds
+    the modules loaded.
+    """
+    threading.Thread(target=_warm_up, name="fli-mcp-warm-up", daemon=True).start()
+
+
 # =============================================================================
 # Search Execution
 # =============================================================================
 
 
-def _resolve_airports(codes: str) -> list[Airport]:
+def _resolve_airports(codes: str) -> "list[Airport]":
     """Resolve one or more comma-separated airport codes."""
+    from fli.core import resolve_airport
+    from fli.core.parsers import ParseError
+
     airports = [resolve_airport(code.strip()) for code in codes.split(",") if code.strip()]
     if not airports:
         raise ParseError(f"No valid airport codes found in: '{codes}'")
     return airports
 
 
-def _execute_flight_search(params: FlightSearchParams) -> dict[str, Any]:
-    """Execute a flight search and return formatted results."""
+def _execute_flight_search(
+    params: FlightSearchParams,
+    on_progress: Callable[[SearchProgress], None] | None = None,
+) -> dict[str, Any]:
+    """Execute a flight search and return formatted results.
+
+    ``on_progress`` is passed through to :meth:`SearchFlights.search`.
+    """
+    from fli.core import (
+        build_flight_segments,
+        build_time_restrictions,
+        parse_airlines,
+        parse_alliances,
+        parse_cabin_class,
+        parse_currency,
+        parse_emissions,
+        parse_max_stops,
+        parse_sort_by,
+    )
+    from fli.core.parsers import ParseError
+    from fli.models import (
+        BagsFilter,
+        FlightSearchFilters,
+        LayoverRestrictions,
+        PassengerInfo,
+        TripType,
+    )
+
     try:
         # Parse inputs using shared utilities (supports comma-separated multi-airport)
         origins = _resolve_airports(params.origin)
@@ -437,8 +668,6 @@ def _execute_flight_search(params: FlightSearchParams) -> dict[str, Any]:
 
         layover_restrictions = None
         if params.min_layover is not None or params.max_layover is not None:
-            from fli.models import LayoverRestrictions
-
             layover_restrictions = LayoverRestrictions(
                 min_duration=params.min_layover,
                 max_duration=params.max_layover,
@@ -465,12 +694,13 @@ def _execute_flight_search(params: FlightSearchParams) -> dict[str, Any]:
 
         # Perform search
         currency = parse_currency(params.currency)
-        search_client = SearchFlights()
+        search_client = _search_class("SearchFlights")()
         flights = search_client.search(
             filters,
             currency=currency,
             language=params.language,
             country=params.country,
+            on_progress=on_progress,
         )
 
         if not flights:
@@ -499,8 +729,26 @@ def _execute_flight_search(params: FlightSearchParams) -> dict[str, Any]:
         return {"success": False, "error": f"Search failed: {error_msg}", "flights": []}
 
 
-def _execute_date_search(params: DateSearchParams) -> dict[str, Any]:
-    """Execute a date search and return formatted results."""
+def _execute_date_search(
+    params: DateSearchParams,
+    on_progress: Callable[[SearchProgress], None] | None = None,
+) -> dict[str, Any]:
+    """Execute a date search and return formatted results.
+
+    ``on_progress`` is passed through to :meth:`SearchDates.search`.
+    """
+    from fli.core import (
+        build_date_search_segments,
+        build_time_restrictions,
+        parse_airlines,
+        parse_alliances,
+        parse_cabin_class,
+        parse_currency,
+        parse_max_stops,
+    )
+    from fli.core.parsers import ParseError
+    from fli.models import DateSearchFilters, LayoverRestrictions, PassengerInfo
+
     try:
         # Parse inputs using shared utilities (supports comma-separated multi-airport)
         origins = _resolve_airports(params.origin)
@@ -528,8 +776,6 @@ def _execute_date_search(params: DateSearchParams) -> dict[str, Any]:
 
         layover_restrictions = None
         if params.min_layover is not None or params.max_layover is not None:
-            from fli.models import LayoverRestrictions
-
             layover_restrictions = LayoverRestrictions(
                 min_duration=params.min_layover,
                 max_duration=params.max_layover,
@@ -554,12 +800,13 @@ def _execute_date_search(params: DateSearchParams) -> dict[str, Any]:
 
         # Perform search
         currency = parse_currency(params.currency)
-        search_client = SearchDates()
+        search_client = _search_class("SearchDates")()
         dates = search_client.search(
             filters,
             currency=currency,
             language=params.language,
             country=params.country,
+            on_progress=on_progress,
         )
 
         if not dates:
@@ -595,6 +842,194 @@ def _execute_date_search(params: DateSearchParams) -> dict[str, Any]:
         return {"success": False, "error": f"Search failed: {str(e)}", "dates": []}
 
 
+_CODE_LIST_FIELDS = ("airlines", "exclude_airlines", "alliance", "exclude_alliance")
+_ENUM_FIELDS = ("cabin_class", "max_stops", "sort_by", "emissions", "currency", "country")
+
+
+def _cache_key(params: FlightSearchParams | DateSearchParams) -> tuple[str, str]:
+    """Return a cache key that is equal for parameter sets Google answers identically.
+
+    Airport, airline and alliance codes and enum names are matched
+    case-insensitively, so they are upper-cased. Airport and code lists are
+    treated as sets, and ``trip_duration`` is ignored for one-way date searches.
+    """
+    fields = params.model_dump()
+    for name in ("origin", "destination"):
+        codes = {code.strip().upper() for code in fields[name].split(",") if code.strip()}
+        fields[name] = ",".join(sorted(codes))
+    for name in _CODE_LIST_FIELDS:
+        if fields[name]:
+            fields[name] = sorted({code.strip().upper() for code in fields[name]})
+        fields[name] = fields[name] or None
+    for name in _ENUM_FIELDS:
+        if fields.get(name):
+            fields[name] = fields[name].strip().upper()
+    if isinstance(params, DateSearchParams) and not params.is_round_trip:
+        fields["trip_duration"] = None
+    return type(params).__name__, json.dumps(fields, sort_keys=True)
+
+
+class _ProgressRelay:
+    """Forward :class:`SearchProgress` events from search threads to the MCP client.
+
+    Each event becomes a progress notification. When ``serialize`` is given,
+    the event's results are also sent as a ``fli.partial_results`` log
+    message whose ``extra`` holds the serialised batch. Events are called
+    in on worker threads, serialised there, and then sent in order from
+    the event loop.
+    """
+
+    def __init__(self, ctx: Context, serialize: Callable[[Any], dict[str, Any]] | None):
+        """Bind to ``ctx`` and the running event loop."""
+        self._ctx = ctx
+        self._serialize = serialize
+        self._loop = asyncio.get_running_loop()
+        self._order = asyncio.Lock()
+        self._pending: list[concurrent.futures.Future[None]] = []
+
+    def __call__(self, event: SearchProgress) -> None:
+        batch = None
+        if self._serialize is not None and event.results:
+            batch = [self._serialize(result) for result in event.results]
+            if CONFIG.max_results:
+                batch = batch[: CONFIG.max_results]
+        self._pending.append(asyncio.run_coroutine_threadsafe(self._send(event, batch), self._loop))
+
+    async def _send(self, event: SearchProgress, batch: list[dict[str, Any]] | None) -> None:
+        message = f"{event.kind} {event.completed}/{event.total}: {event.description}"
+        async with self._order:
+            await self._ctx.report_progress(event.completed, event.total, message)
+            if batch:
+                await self._ctx.log(
+                    message,
+                    logger_name="fli.partial_results",
+                    extra={
+                        "kind": event.kind,
+                        "completed": event.completed,
+                        "total": event.total,
+                        "results": batch,
+                    },
+                )
+
+    async def drain(self) -> None:
+        """Wait until every notification queued so far has been sent (or failed)."""
+        if self._pending:
+            await asyncio.gather(
+                *(asyncio.wrap_future(f) for f in self._pending), return_exceptions=True
+            )
+
+
+async def _offload(
+    execute: Callable[..., dict[str, Any]],
+    params: Any,
+    results_key: str,
+    relay: _ProgressRelay | None = None,
+    *,
+    tool: str,
+    tenant: Tenant | None = None,
+    wait_for_quota: bool = False,
+) -> dict[str, Any]:
+    """Run a blocking ``_execute_*`` search on :data:`TOOL_POOL` without blocking the loop.
+
+    Successful responses are cached in :data:`RESULT_CACHE`; a fresh hit is
+    returned without touching the pool. Every call, cached or not, counts
+    towards the query's popularity for cache warming. ``relay`` receives the search's
+    progress events; they are all delivered before the response is returned.
+    The call's latency and outcome are recorded in :data:`TOOL_METRICS`
+    under ``tool``.
+
+    A search run for ``tenant`` counts against its in-flight quota in
+    :data:`TOOL_POOL`, and its Google requests against its budget in
+    :data:`TENANT_BUDGETS`. With ``wait_for_quota``, a search over the
+    in-flight quota waits for one of the tenant's searches to finish
+    instead of failing.
+    """
+    started = time.perf_counter()
+    key = _cache_key(params) if RESULT_CACHE is not None else None
+    if key is not None and QUERY_POPULARITY is not None:
+        QUERY_POPULARITY.record(key, params)
+    if key is not None:
+        cached = RESULT_CACHE.get(key)
+        if cached is not None:
+            TOOL_METRICS.observe(tool, "cached", time.perf_counter() - started)
+            return cached
+    search = partial(execute, params, on_progress=relay)
+    try:
+        if tenant is None:
+            result = await TOOL_POOL.run(search)
+        else:
+            budget = TENANT_BUDGETS.budget(tenant)
+            result = await TOOL_POOL.run(
+                _within_budget,
+                budget,
+                search,
+                tenant=tenant.id,
+                wait_for_quota=wait_for_quota,
+            )
+    except ToolPoolFullError as e:
+        TOOL_METRICS.observe(tool, "busy", time.perf_counter() - started)
+        return {"success": False, "error": str(e), results_key: []}
+    except TenantQuotaError as e:
+        TOOL_METRICS.observe(tool, "quota", time.perf_counter() - started)
+        return {"success": False, "error": str(e), results_key: []}
+    if relay is not None:
+        await relay.drain()
+    if key is not None and result.get("success"):
+        RESULT_CACHE.put(key, result)
+    outcome = "ok" if result.get("success") else "error"
+    TOOL_METRICS.observe(tool, outcome, time.perf_counter() - started)
+    return result
+
+
+def _within_budget(budget: RequestBudget, search: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+    """Run ``search`` with its Google requests charged to ``budget``."""
+    with request_budget(budget):
+        return search()
+
+
+def _serialize_progress_flight(flight: Any) -> dict[str, Any]:
+    # Expansion batches hold (outbound, return) tuples; outbound batches hold
+    # bare outbound flights, which serialise as-is.
+    return _serialize_flight_result(flight, is_round_trip=isinstance(flight, tuple))
+
+
+def _projected(
+    serialize: Callable[[Any], dict[str, Any]], fields: list[str] | None
+) -> Callable[[Any], dict[str, Any]]:
+    # Partial-result batches honour ``fields`` too; they are always records.
+    if not fields:
+        return serialize
+    return lambda result: project([serialize(result)], fields)[0]
+
+
+def _shape_response(
+    result: dict[str, Any],
+    results_key: str,
+    fields: list[str] | None,
+    format: ResultFormat,
+    page_size: int | None,
+) -> dict[str, Any]:
+    """Apply the ``fields``, ``format`` and ``page_size`` tool options to ``result``.
+
+    ``result`` may be shared with :data:`RESULT_CACHE`, so it is left
+    untouched and a new dict is returned. With ``page_size``, the full list
+    goes to :data:`PAGE_STORE` and the response carries the first page.
+    """
+    if not result.get("success") or (not fields and format == "records" and page_size is None):
+        return result
+    shaped = dict(result)
+    records = result[results_key]
+    if page_size is None:
+        shaped[results_key] = shape(records, fields, format)
+    else:
+        shaped.update(
+            PAGE_STORE.first_page(
+                records, page_size=page_size, fields=fields, format=format, key=results_key
+            )
+        )
+    return shaped
+
+
 # =============================================================================
 # MCP Tools
 # =============================================================================
@@ -607,7 +1042,7 @@ def _execute_date_search(params: DateSearchParams) -> dict[str, Any]:
         "idempotentHint": True,
     },
 )
-def search_flights(
+async def search_flights(
     origin: Annotated[
         str,
         Field(
@@ -711,11 +1146,51 @@ def search_flights(
         int | None,
         Field(description="Maximum layover duration in minutes.", ge=1),
     ] = None,
+    partial_results: Annotated[
+        bool,
+        Field(
+            description=(
+                "Also send each batch of flights as it arrives, as a 'fli.partial_results' "
+                "log notification, before the final response."
+            )
+        ),
+    ] = False,
+    fields: Annotated[
+        list[str] | None,
+        Field(
+            description=(
+                "Only return these fields of each flight, e.g. ['price', 'legs.flight_number', "
+                "'legs.departure_time']. Dotted paths select fields inside each leg."
+            )
+        ),
+    ] = None,
+    format: Annotated[
+        ResultFormat,
+        Field(
+            description=(
+                "'records' (one object per flight) or 'table' (shared 'columns' plus one "
+                "'rows' entry per flight; more compact)"
+            )
+        ),
+    ] = "records",
+    page_size: Annotated[
+        int | None,
+        Field(
+            description=(
+                "Return at most this many flights; fetch the rest with get_results_page "
+                "and the returned next_cursor"
+            ),
+            ge=1,
+        ),
+    ] = None,
+    ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Search for flights between two airports on a specific date.
 
     Returns a list of available flights with prices, durations, and leg details.
     Supports one-way and round-trip searches with various filtering options.
+    Progress notifications are sent as the outbound and each return-leg request
+    complete. Use `fields`, `format` and `page_size` to keep large responses small.
     """
     effective_departure_window = departure_window or CONFIG.default_departure_window
     params = FlightSearchParams(
@@ -743,7 +1218,22 @@ def search_flights(
         min_layover=min_layover,
         max_layover=max_layover,
     )
-    return _execute_flight_search(params)
+    relay = (
+        _ProgressRelay(
+            ctx, _projected(_serialize_progress_flight, fields) if partial_results else None
+        )
+        if ctx is not None
+        else None
+    )
+    result = await _offload(
+        _execute_flight_search,
+        params,
+        "flights",
+        relay,
+        tool="search_flights",
+        tenant=identify_tenant(CONFIG.tenant_header),
+    )
+    return _shape_response(result, "flights", fields, format, page_size)
 
 
 def _search_flights_from_params(params: FlightSearchParams) -> dict[str, Any]:
@@ -758,7 +1248,7 @@ def _search_flights_from_params(params: FlightSearchParams) -> dict[str, Any]:
         "idempotentHint": True,
     },
 )
-def search_dates(
+async def search_dates(
     origin: Annotated[
         str,
         Field(
@@ -839,11 +1329,46 @@ def search_dates(
         int | None,
         Field(description="Maximum layover duration in minutes.", ge=1),
     ] = None,
+    partial_results: Annotated[
+        bool,
+        Field(
+            description=(
+                "Also send each chunk of dates as it arrives, as a 'fli.partial_results' "
+                "log notification, before the final response."
+            )
+        ),
+    ] = False,
+    fields: Annotated[
+        list[str] | None,
+        Field(description="Only return these fields of each date, e.g. ['date', 'price']"),
+    ] = None,
+    format: Annotated[
+        ResultFormat,
+        Field(
+            description=(
+                "'records' (one object per date) or 'table' (shared 'columns' plus one "
+                "'rows' entry per date; more compact)"
+            )
+        ),
+    ] = "records",
+    page_size: Annotated[
+        int | None,
+        Field(
+            description=(
+                "Return at most this many dates; fetch the rest with get_results_page "
+                "and the returned next_cursor"
+            ),
+            ge=1,
+        ),
+    ] = None,
+    ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Find the cheapest travel dates between two airports within a date range.
 
     Returns a list of dates with their prices, useful for flexible travel planning.
-    Supports both one-way and round-trip searches.
+    Supports both one-way and round-trip searches. Progress notifications are
+    sent as each calendar chunk completes. Use `fields`, `format` and `page_size`
+    to keep large responses small.
     """
     effective_departure_window = departure_window or CONFIG.default_departure_window
     params = DateSearchParams(
@@ -868,7 +1393,20 @@ def search_dates(
         min_layover=min_layover,
         max_layover=max_layover,
     )
-    return _execute_date_search(params)
+    relay = (
+        _ProgressRelay(ctx, _projected(_serialize_date_result, fields) if partial_results else None)
+        if ctx is not None
+        else None
+    )
+    result = await _offload(
+        _execute_date_search,
+        params,
+        "dates",
+        relay,
+        tool="search_dates",
+        tenant=identify_tenant(CONFIG.tenant_header),
+    )
+    return _shape_response(result, "dates", fields, format, page_size)
 
 
 def _search_dates_from_params(params: DateSearchParams) -> dict[str, Any]:
@@ -876,8 +1414,127 @@ def _search_dates_from_params(params: DateSearchParams) -> dict[str, Any]:
     return _execute_date_search(params)
 
 
+@mcp.tool(
+    annotations={
+        "title": "Search Flights (Batch)",
+        "readOnlyHint": True,
+        "idempotentHint": True,
+    },
+)
+async def search_flights_batch(
+    queries: Annotated[
+        list[FlightSearchParams],
+        Field(
+            min_length=1,
+            description=(
+                "Flight searches to run, each with the same fields as `search_flights` "
+                "(origin, destination, departure_date, ...)."
+            ),
+        ),
+    ],
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Run several flight searches concurrently and return all their results at once.
+
+    Use this instead of repeated `search_flights` calls when comparing routes,
+    dates or cabins. Identical queries are searched once. Each entry of
+    `results` has the query's `index`, its response (shaped like a
+    `search_flights` response) and `elapsed_ms`; a repeat of an earlier
+    query also has `duplicate_of`. A progress notification is sent as each
+    distinct query completes.
+    """
+    if len(queries) > CONFIG.batch_max_queries:
+        return {
+            "success": False,
+            "error": f"Too many queries: {len(queries)} (maximum {CONFIG.batch_max_queries})",
+            "results": [],
+        }
+    started = time.perf_counter()
+
+    # Dedupe on the same normalised key as the result cache.
+    first_index: dict[tuple[str, str], int] = {}
+    for index, params in enumerate(queries):
+        first_index.setdefault(_cache_key(params), index)
+    unique = sorted(first_index.values())
+
+    # Queries over the tenant's in-flight quota (the batch's own, or searches
+    # the tenant runs alongside it) wait for a slot rather than fail.
+    tenant = identify_tenant(CONFIG.tenant_header)
+    window = asyncio.Semaphore(
+        min(CONFIG.batch_max_in_flight, CONFIG.tenant_max_in_flight or len(unique))
+    )
+    completed = 0
+
+    async def run(index: int) -> tuple[dict[str, Any], float]:
+        nonlocal completed
+        async with window:
+            query_started = time.perf_counter()
+            result = await _offload(
+                _execute_flight_search,
+                queries[index],
+                "flights",
+                tool="search_flights_batch",
+                tenant=tenant,
+                wait_for_quota=True,
+            )
+            elapsed_ms = (time.perf_counter() - query_started) * 1000
+        completed += 1
+        if ctx is not None:
+            await ctx.report_progress(completed, len(unique), f"query {index} done")
+        return result, elapsed_ms
+
+    outcomes = dict(zip(unique, await asyncio.gather(*(run(i) for i in unique)), strict=True))
+
+    results = []
+    for index, params in enumerate(queries):
+        first = first_index[_cache_key(params)]
+        result, elapsed_ms = outcomes[first]
+        entry: dict[str, Any] = {"index": index, **result, "elapsed_ms": round(elapsed_ms, 1)}
+        if first != index:
+            entry["duplicate_of"] = first
+        results.append(entry)
+
+    return {
+        "success": True,
+        "results": results,
+        "count": len(results),
+        "unique_queries": len(unique),
+        "succeeded": sum(1 for entry in results if entry["success"]),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+@mcp.tool(
+    annotations={
+        "title": "Get Results Page",
+        "readOnlyHint": True,
+        "idempotentHint": True,
+    },
+)
+def get_results_page(
+    cursor: Annotated[
+        str,
+        Field(description="The next_cursor of a search_flights / search_dates response or page"),
+    ],
+) -> dict[str, Any]:
+    """Fetch the next page of a search that was run with `page_size`, without searching again.
+
+    The page keeps the search's `fields` and `format` and has the same shape as
+    its first page: results under `flights` or `dates`, plus `count`, `offset`,
+    `total` and `next_cursor` (null on the last page). Results stay available
+    for a limited time after the search.
+    """
+    try:
+        page = PAGE_STORE.page(cursor)
+    except CursorError as e:
+        return {"success": False, "error": str(e)}
+    return {"success": True, **page}
+
+
 def _find_airports_impl(query: str, limit: int = 10) -> dict[str, Any]:
     """Run search_airports and shape the result into the MCP response dict."""
+    from fli.core import search_airports
+
     try:
         results = search_airports(query, limit=limit)
     except Exception as exc:
@@ -989,10 +1646,15 @@ def find_budget_window_prompt(
     mime_type="application/json",
 )
 def configuration_resource() -> str:
-    """Expose configuration defaults and schema as a resource."""
+    """Expose configuration defaults, schema and cache / page-store counters as a resource."""
+    if RESULT_CACHE is None:
+        cache: dict[str, Any] = {"enabled": False}
+    else:
+        stats = RESULT_CACHE.stats()
+        cache = {"enabled": True, **asdict(stats), "hit_rate": round(stats.hit_rate, 4)}
     payload = {
         "defaults": CONFIG.model_dump(),
-        "schema": CONFIG_SCHEMA,
+        "schema": _config_schema(),
         "environment": {
             "prefix": "FLI_MCP_",
             "variables": {
@@ -1002,12 +1664,114 @@ def configuration_resource() -> str:
                 "FLI_MCP_DEFAULT_SORT_BY": "Set the default result sorting strategy.",
                 "FLI_MCP_DEFAULT_DEPARTURE_WINDOW": "Provide a default departure window (HH-HH).",
                 "FLI_MCP_MAX_RESULTS": "Limit the maximum number of results returned by tools.",
+                "FLI_MCP_TOOL_WORKERS": "Set how many searches run at once.",
+                "FLI_MCP_TOOL_QUEUE": "Set how many searches may wait before 'Server busy'.",
+                "FLI_MCP_BATCH_MAX_QUERIES": "Limit the queries accepted per batch call.",
+                "FLI_MCP_BATCH_MAX_IN_FLIGHT": "Set how many queries of a batch run at once.",
+                "FLI_MCP_CACHE_TTL": "Seconds to reuse identical search results (0 disables).",
+                "FLI_MCP_CACHE_MAX_BYTES": "Approximate memory budget for cached results.",
+                "FLI_MCP_PAGE_TTL": "Seconds paginated results stay available for later pages.",
+                "FLI_MCP_PAGE_MAX_BYTES": "Approximate memory budget for paginated results.",
+                "FLI_MCP_METRICS": "Serve Prometheus metrics at /metrics over HTTP.",
+                "FLI_MCP_CACHE_WARM": "Refresh popular searches in the background.",
+                "FLI_MCP_CACHE_WARM_INTERVAL": "Seconds between cache warm-up rounds.",
+                "FLI_MCP_CACHE_WARM_TOP_N": "Popular searches considered per warm-up round.",
+                "FLI_MCP_CACHE_WARM_REFRESH_AHEAD": "Refresh results expiring within N seconds.",
+                "FLI_MCP_CACHE_WARM_REQUEST_SHARE": "Fraction of the request rate for warming.",
+                "FLI_MCP_CACHE_WARM_MIN_SCORE": "Least popularity a search needs to be warmed.",
+                "FLI_MCP_CACHE_WARM_HALF_LIFE": "Seconds for a search's popularity to halve.",
+                "FLI_MCP_TENANT_HEADER": "Header carrying a tenant's API key (empty: per session).",
+                "FLI_MCP_TENANT_MAX_IN_FLIGHT": "Limit the searches one tenant has in flight.",
+                "FLI_MCP_TENANT_REQUEST_SHARE": "Fraction of the Google request rate per tenant.",
+                "FLI_MCP_TENANT_MAX_WAIT": "Seconds to wait for a tenant's request budget.",
             },
         },
+        "cache": cache,
+        "pages": asdict(PAGE_STORE.stats()),
+        "cache_warmer": (
+            {"enabled": False}
+            if CACHE_WARMER is None
+            else {"enabled": True, **asdict(CACHE_WARMER.stats())}
+        ),
     }
     return json.dumps(payload, indent=2)
 
 
+def render_metrics() -> str:
+    """Render the server's and the search library's counters as Prometheus text."""
+    out = Exposition()
+    add_server_metrics(
+        out,
+        TOOL_METRICS,
+        TOOL_POOL.stats(),
+        RESULT_CACHE.stats() if RESULT_CACHE is not None else None,
+        PAGE_STORE.stats(),
+        CACHE_WARMER.stats() if CACHE_WARMER is not None else None,
+    )
+    add_search_metrics(out)
+    return out.render()
+
+
+@mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+async def metrics_endpoint(request: Request) -> Response:
+    """Serve :func:`render_metrics` when ``FLI_MCP_METRICS`` is enabled (HTTP only)."""
+    if not CONFIG.metrics:
+        return PlainTextResponse("Metrics are disabled; set FLI_MCP_METRICS=1.", status_code=404)
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
+
+
+# =============================================================================
+# Cache Warming
+# =============================================================================
+
+
+def _refresh_cached(params: FlightSearchParams | DateSearchParams) -> dict[str, Any] | None:
+    """Re-run a popular search for :data:`CACHE_WARMER`; None once its date has passed."""
+    first_date = (
+        params.departure_date if isinstance(params, FlightSearchParams) else params.start_date
+    )
+    try:
+        if datetime.strptime(first_date, "%Y-%m-%d").date() < datetime.now(timezone.utc).date():
+            return None
+    except ValueError:
+        return None
+    if isinstance(params, FlightSearchParams):
+        return _execute_flight_search(params)
+    return _execute_date_search(params)
+
+
+def _has_spare_capacity() -> bool:
+    """Return True when no tool call is queued and nothing waits on the rate limiter."""
+    from fli.search.client import get_client
+
+    return TOOL_POOL.stats().queued == 0 and get_client().limiter_stats().waiters == 0
+
+
+def _start_cache_warmer() -> None:
+    """Start :data:`CACHE_WARMER` when cache warming is enabled."""
+    global CACHE_WARMER
+    if QUERY_POPULARITY is None or RESULT_CACHE is None:
+        return
+    if CACHE_WARMER is None:
+        budget = RequestBudget(
+            share_limiter(CONFIG.cache_warm_request_share),
+            max_wait=CONFIG.cache_warm_interval,
+            owner="the cache warmer",
+        )
+        CACHE_WARMER = CacheWarmer(
+            RESULT_CACHE,
+            QUERY_POPULARITY,
+            _refresh_cached,
+            budget=budget,
+            interval=CONFIG.cache_warm_interval,
+            top_n=CONFIG.cache_warm_top_n,
+            refresh_ahead=CONFIG.cache_warm_refresh_ahead,
+            min_score=CONFIG.cache_warm_min_score,
+            idle=_has_spare_capacity,
+        )
+    CACHE_WARMER.start()
+
+
 # =============================================================================
 # Entry Points
 # =============================================================================
@@ -1015,6 +1779,8 @@ def configuration_resource() -> str:
 
 def run():
     """Run the MCP server on STDIO."""
+    _start_warm_up()
+    _start_cache_warmer()
     mcp.run(transport="stdio")
 
 
@@ -1032,6 +1798,8 @@ def run_http(host: str = "0.0.0.0", port: int = 8000) -> None:
     bind_host = env_host if env_host else host
     bind_port = int(env_port) if env_port else port
 
+    _start_warm_up()
+    _start_cache_warmer()
     mcp.run(transport="http", host=bind_host, port=bind_port)
 
 
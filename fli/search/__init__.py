@@ -1,18 +1,120 @@
-from .dates import DatePrice, SearchDates
+"""Flight, date, matrix, flexible and explore searches against Google Flights.
+
+The search classes pull in :mod:`fli.models` (the airport and airline enums)
+and the HTTP client. They are imported on first attribute access (PEP 562),
+so ``import fli.search`` and its light helpers, such as
+:class:`ResultCache` or :class:`SearchProgress`, stay cheap for callers that
+only need those, for example the MCP server at start-up.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from ._calendar_store import CalendarPriceStore, CalendarStoreStats
+from ._concurrency import (
+    CancellationToken,
+    ExecutorStats,
+    LimiterStats,
+    RequestBudget,
+    executor_stats,
+    request_budget,
+)
+from ._metrics import ClientStats, DecodeStats, HistogramSnapshot, decode_stats
+from ._progress import SearchProgress
+from ._result_cache import CacheEntry, ResultCache, ResultCacheStats
+from ._search_cache import CacheStatus, SearchCacheStats, SearchResultCache
 from .exceptions import (
+    SearchCancelledError,
     SearchClientError,
     SearchConnectionError,
     SearchHTTPError,
+    SearchQuotaError,
     SearchTimeoutError,
+    SubRequestFailure,
 )
-from .flights import SearchFlights
+
+if TYPE_CHECKING:
+    from .batch import BatchResult, BatchSearch, BatchStats
+    from .dates import DatePrice, DatePriceArray, SearchDates
+    from .explore import DestinationFares, ExploreResult, SearchExplore
+    from .flexible import FlexibleItinerary, SearchFlexible
+    from .flights import SearchFlights
+    from .matrix import MatrixResult, SearchMatrix
+
+# Public name -> submodule that defines it, for the lazily imported names.
+_LAZY = {
+    "BatchResult": "batch",
+    "BatchSearch": "batch",
+    "BatchStats": "batch",
+    "DatePrice": "dates",
+    "DatePriceArray": "dates",
+    "SearchDates": "dates",
+    "DestinationFares": "explore",
+    "ExploreResult": "explore",
+    "SearchExplore": "explore",
+    "FlexibleItinerary": "flexible",
+    "SearchFlexible": "flexible",
+    "SearchFlights": "flights",
+    "MatrixResult": "matrix",
+    "SearchMatrix": "matrix",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "SearchFlights",
     "SearchDates",
+    "SearchMatrix",
+    "MatrixResult",
+    "SearchFlexible",
+    "SearchExplore",
+    "ExploreResult",
+    "DestinationFares",
+    "FlexibleItinerary",
     "DatePrice",
+    "DatePriceArray",
+    "CalendarPriceStore",
+    "CalendarStoreStats",
+    "ResultCache",
+    "SearchProgress",
+    "ResultCacheStats",
+    "CacheEntry",
+    "SearchResultCache",
+    "SearchCacheStats",
+    "CacheStatus",
+    "BatchResult",
+    "BatchSearch",
+    "BatchStats",
+    "CancellationToken",
+    "LimiterStats",
+    "ExecutorStats",
+    "executor_stats",
+    "RequestBudget",
+    "request_budget",
+    "ClientStats",
+    "DecodeStats",
+    "HistogramSnapshot",
+    "decode_stats",
     "SearchClientError",
     "SearchTimeoutError",
     "SearchConnectionError",
     "SearchHTTPError",
+    "SearchCancelledError",
+    "SearchQuotaError",
+    "SubRequestFailure",
 ]
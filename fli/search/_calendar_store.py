@@ -0,0 +1,193 @@
+"""Per-day calendar price store for incremental ``SearchDates`` refreshes.
+
+``GetCalendarGraph`` answers with one price per departure day. Without a
+store every :meth:`SearchDates.search` re-downloads every day in range,
+even when an overlapping query fetched the same days a minute ago. The
+:class:`CalendarPriceStore` keeps each day as its own *cell* with a
+freshness deadline, so a later search only plans requests for the days
+that are missing or stale (see :mod:`fli.search._chunk_planner`).
+
+Cells are keyed by:
+
+* the *scope* — route and every other filter field (passengers, cabin,
+  stops, airlines, …) plus the locale (currency / language / country);
+* the departure day;
+* the return day for round trips, so a duration sweep can share a store
+  with plain searches.
+
+Far-out fares move slowly and near-term ones quickly, so the default TTL
+policy (:func:`default_ttl`) grows with lead time. Days for which Google
+returned no fare are stored too (as ``None``) — "no fare" is an answer.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+# (lead-time upper bound in days, TTL in seconds), checked in order.
+_DEFAULT_TTL_STEPS: tuple[tuple[int, float], ...] = (
+    (3, 10 * 60),
+    (14, 30 * 60),
+    (60, 2 * 60 * 60),
+)
+_DEFAULT_FAR_TTL = 6 * 60 * 60
+
+
+def default_ttl(lead_days: int) -> float:
+    """Return the default freshness window, in seconds, for a day ``lead_days`` out.
+
+    10 minutes within 3 days of departure, 30 minutes within two weeks,
+    2 hours within two months and 6 hours beyond.
+    """
+    for bound, ttl in _DEFAULT_TTL_STEPS:
+        if lead_days <= bound:
+            return ttl
+    return _DEFAULT_FAR_TTL
+
+
+@dataclass(frozen=True)
+class CalendarStoreStats:
+    """Point-in-time counters for a :class:`CalendarPriceStore`."""
+
+    cells: int
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+
+
+class CalendarPriceStore:
+    """Thread-safe per-day price cells with lead-time dependent freshness.
+
+    One store can back any number of :class:`~fli.search.SearchDates`
+    instances (and threads); searches with different filters or locales
+    never see each other's cells.
+
+    Args:
+        ttl: Maps a cell's lead time (days from today to departure) to how
+            many seconds it stays fresh. Defaults to :func:`default_ttl`.
+        max_cells: Upper bound on stored cells. When exceeded, expired cells
+            are dropped first, then the least recently written ones.
+        clock: Monotonic time source, in seconds (overridable for tests).
+        today: Returns the current date used for lead times (overridable
+            for tests).
+
+    """
+
+    def __init__(
+        self,
+        ttl: Callable[[int], float] = default_ttl,
+        *,
+        max_cells: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = date.today,
+    ):
+        """Create an empty store."""
+        if max_cells <= 0:
+            raise ValueError("max_cells must be positive")
+        self._ttl = ttl
+        self._max_cells = max_cells
+        self._clock = clock
+        self._today = today
+        self._lock = threading.Lock()
+        # (scope, depart, return) → (expires_at, value); dict order is write order.
+        self._cells: dict[tuple[str, date, date | None], tuple[float, Any]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored cells (fresh or not)."""
+        with self._lock:
+            return len(self._cells)
+
+    def fresh(
+        self,
+        scope: str,
+        start: date,
+        end: date,
+        stay_days: int | None = None,
+    ) -> dict[date, Any]:
+        """Return the fresh cells of ``scope`` departing ``start..end`` (inclusive).
+
+        Args:
+            scope: Opaque key for the route, filters and locale.
+            start: First departure day.
+            end: Last departure day.
+            stay_days: Round-trip length; the return day of each cell is the
+                departure day plus this. ``None`` for one-way searches.
+
+        Returns:
+            ``{departure day: value}`` for every fresh cell; missing and
+            stale days are absent. A value of ``None`` means "no fare".
+
+        """
+        now = self._clock()
+        found: dict[date, Any] = {}
+        with self._lock:
+            day = start
+            while day <= end:
+                cell = self._cells.get((scope, day, _return_day(day, stay_days)))
+                if cell is not None and cell[0] > now:
+                    found[day] = cell[1]
+                    self._hits += 1
+                else:
+                    self._misses += 1
+                day += timedelta(days=1)
+        return found
+
+    def put(
+        self,
+        scope: str,
+        cells: Iterable[tuple[date, Any]],
+        stay_days: int | None = None,
+    ) -> None:
+        """Store ``(departure day, value)`` cells, stamping each with its lead-time TTL."""
+        now = self._clock()
+        today = self._today()
+        with self._lock:
+            for day, value in cells:
+                key = (scope, day, _return_day(day, stay_days))
+                # Re-insert so dict order tracks write recency for eviction.
+                self._cells.pop(key, None)
+                self._cells[key] = (now + self._ttl((day - today).days), value)
+                self._stores += 1
+            if len(self._cells) > self._max_cells:
+                self._evict(now)
+
+    def clear(self) -> None:
+        """Drop every cell (counters are kept)."""
+        with self._lock:
+            self._cells.clear()
+
+    def stats(self) -> CalendarStoreStats:
+        """Return a snapshot of the store's size and hit / miss counters."""
+        with self._lock:
+            return CalendarStoreStats(
+                cells=len(self._cells),
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+            )
+
+    def _evict(self, now: float) -> None:
+        """Shrink to ``max_cells``: expired cells first, then the oldest writes."""
+        expired = [key for key, (expires_at, _) in self._cells.items() if expires_at <= now]
+        for key in expired:
+            del self._cells[key]
+        overflow = len(self._cells) - self._max_cells
+        if overflow > 0:
+            for key in list(self._cells)[:overflow]:
+                del self._cells[key]
+        self._evictions += len(expired) + max(overflow, 0)
+
+
+def _return_day(day: date, stay_days: int | None) -> date | None:
+    return None if stay_days is None else day + timedelta(days=stay_days)
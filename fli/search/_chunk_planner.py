@@ -0,0 +1,149 @@
+"""Chunk planning for ``GetCalendarGraph`` date-range searches.
+
+Google prices at most :data:`MAX_DAYS_PER_CHUNK` days per calendar request,
+so longer ranges are split into several requests. The naive split — fixed
+61-day windows from ``from_date`` — has two costs:
+
+* the last window is arbitrarily short (a 62-day range sends one 61-day
+  and one 1-day request), and
+* two overlapping queries produce different windows, so nothing one of
+  them fetched lines up with what the other needs.
+
+:func:`plan_chunks` instead works from the set of days that are still
+*missing* (everything, on a cold start) and:
+
+1. groups missing days into spans, bridging gaps of already-known days
+   whenever that does not cost an extra request;
+2. when padding is allowed, snaps a span to cells of a global calendar grid
+   (fixed 61-day cells counted from :data:`GRID_EPOCH`) if the span fits in
+   as many grid cells as it needs requests anyway — overlapping queries then
+   issue identical chunks and the padding days come for free;
+3. otherwise splits the span into equal-length chunks, so no request is a
+   one-day remainder.
+
+The planner is pure date arithmetic; :class:`~fli.search.dates.SearchDates`
+decides which days are known and what the padding bounds are.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Container
+from datetime import date, timedelta
+
+MAX_DAYS_PER_CHUNK = 61
+"""Widest range a single ``GetCalendarGraph`` request prices."""
+
+GRID_EPOCH = date(2000, 1, 1)
+"""Origin of the global chunk grid; cell ``i`` starts ``i × max_days`` days later."""
+
+
+def plan_chunks(
+    start: date,
+    end: date,
+    *,
+    known: Container[date] = frozenset(),
+    max_days: int = MAX_DAYS_PER_CHUNK,
+    pad_bounds: tuple[date, date] | None = None,
+) -> list[tuple[date, date]]:
+    """Plan the inclusive ``(first, last)`` chunks needed to cover ``start..end``.
+
+    Args:
+        start: First day of the requested range.
+        end: Last day of the requested range (inclusive).
+        known: Days whose prices are already available and need not be
+            fetched. They are still re-fetched when bridging them is free.
+        max_days: Maximum days per chunk.
+        pad_bounds: Inclusive ``(earliest, latest)`` days a chunk may extend
+            to beyond the requested range. ``None`` disables padding and
+            grid alignment, so chunks stay within ``start..end``.
+
+    Returns:
+        Chunks in date order. Empty when every day is already known.
+
+    Raises:
+        ValueError: ``max_days`` is not positive.
+
+    """
+    if max_days <= 0:
+        raise ValueError("max_days must be positive")
+    plan: list[tuple[date, date]] = []
+    for first, last in _spans(_missing_runs(start, end, known), max_days):
+        aligned = _grid_cells(first, last, max_days, pad_bounds)
+        plan.extend(aligned if aligned is not None else _balanced(first, last, max_days))
+    return plan
+
+
+def _chunks_needed(first: date, last: date, max_days: int) -> int:
+    return -(-((last - first).days + 1) // max_days)
+
+
+def _missing_runs(start: date, end: date, known: Container[date]) -> list[tuple[date, date]]:
+    """Contiguous runs of days in ``start..end`` that are not in ``known``."""
+    runs: list[tuple[date, date]] = []
+    run_start: date | None = None
+    day = start
+    one = timedelta(days=1)
+    while day <= end:
+        if day in known:
+            if run_start is not None:
+                runs.append((run_start, day - one))
+                run_start = None
+        elif run_start is None:
+            run_start = day
+        day += one
+    if run_start is not None:
+        runs.append((run_start, end))
+    return runs
+
+
+def _spans(runs: list[tuple[date, date]], max_days: int) -> list[tuple[date, date]]:
+    """Merge neighbouring runs when covering the gap between them adds no request."""
+    spans: list[tuple[date, date]] = []
+    for first, last in runs:
+        if spans:
+            span_first, span_last = spans[-1]
+            separate = _chunks_needed(span_first, span_last, max_days) + _chunks_needed(
+                first, last, max_days
+            )
+            if _chunks_needed(span_first, last, max_days) <= separate:
+                spans[-1] = (span_first, last)
+                continue
+        spans.append((first, last))
+    return spans
+
+
+def _balanced(first: date, last: date, max_days: int) -> list[tuple[date, date]]:
+    """Split ``first..last`` into the fewest chunks, with lengths differing by at most one."""
+    days = (last - first).days + 1
+    count = _chunks_needed(first, last, max_days)
+    base, extra = divmod(days, count)
+    chunks: list[tuple[date, date]] = []
+    cursor = first
+    for i in range(count):
+        length = base + (1 if i < extra else 0)
+        chunks.append((cursor, cursor + timedelta(days=length - 1)))
+        cursor += timedelta(days=length)
+    return chunks
+
+
+def _grid_cells(
+    first: date,
+    last: date,
+    max_days: int,
+    pad_bounds: tuple[date, date] | None,
+) -> list[tuple[date, date]] | None:
+    """Return the grid cells covering ``first..last``, or None if that costs extra requests."""
+    if pad_bounds is None:
+        return None
+    first_cell = (first - GRID_EPOCH).days // max_days
+    last_cell = (last - GRID_EPOCH).days // max_days
+    if last_cell - first_cell + 1 > _chunks_needed(first, last, max_days):
+        return None
+    lower = min(pad_bounds[0], first)
+    upper = max(pad_bounds[1], last)
+    cells: list[tuple[date, date]] = []
+    for cell in range(first_cell, last_cell + 1):
+        cell_first = GRID_EPOCH + timedelta(days=cell * max_days)
+        cell_last = cell_first + timedelta(days=max_days - 1)
+        cells.append((max(cell_first, lower), min(cell_last, upper)))
+    return cells
@@ -1,7 +1,7 @@
 """Thread-safe concurrency primitives for the search layer.
 
 This module is the single source of truth for how ``fli`` parallelises
-work. It exposes three small building blocks:
+work. It exposes a few small building blocks:
 
 * :class:`TokenBucketRateLimiter` — a thread-safe token bucket that
   enforces a global "N requests per period" budget. The search code
@@ -16,7 +16,30 @@ work. It exposes three small building blocks:
 * :func:`parallel_map` — a small ``map``-shaped helper that submits
   ``fn(item)`` for each item and returns results in input order. Falls
   back to a sequential loop for trivial inputs (``len ≤ 1`` or
-  ``max_workers == 1``) so the fast path stays allocation-free.
+  ``max_workers == 1``) so the fast path stays allocation-free. Pass
+  ``return_exceptions=True`` to keep partial results when some items fail.
+  Calls made *from* a pool worker switch to caller-runs scheduling so
+  nested fan-out (multi-city expansion) can never starve the pool.
+
+* :func:`parallel_imap` — the streaming sibling: pulls lazily from a
+  (possibly unbounded) iterable, keeps at most ``window`` calls in
+  flight, and yields results as they complete (or in input order with
+  ``ordered=True``). Memory stays bounded by the window, not the input.
+
+* :class:`RequestBudget` / :func:`request_budget` — a per-caller share
+  of the request budget, enforced on top of the client's own limiter for
+  every request made inside the ``with`` block (including requests made
+  by the executor's workers on the caller's behalf). The MCP server uses
+  one per tenant so a single noisy session cannot starve the rest.
+
+* :class:`CancellationToken` — a cooperative "stop" signal. Threaded
+  through a search, it drops queued work, wakes threads parked in the
+  rate limiter, and stops retries; see the class docstring.
+
+* :class:`LimiterStats` / :func:`executor_stats` — cheap, always-on
+  counters (rate-limiter wait histogram and current waiters; executor
+  queue depth, queue/run time and concurrency high-water marks) for
+  telling "throttled by the limiter" apart from "starved for workers".
 
 Design notes
 ------------
@@ -28,23 +51,238 @@ CLI, the MCP server) is sync too. Threads keep the call sites unchanged
 ``json.loads`` releases the GIL, so wall-clock overlap is real even on
 CPython.
 
-The rate limiter is the only piece of shared mutable state. It uses a
+The exception is decoding. Walking the response tree in
+:mod:`fli.search._decoders` is pure Python and holds the GIL, so a batch
+job parsing thousands of responses saturates one core however many
+threads it runs. :func:`configure_process_parsing` opts into a
+:class:`~concurrent.futures.ProcessPoolExecutor` stage: worker threads
+still do all the I/O, but hand each raw response body to
+:func:`run_decoder`, which decodes it in a worker process and returns
+compact, picklable results. It is off by default because spawning
+processes and pickling results only pays off at batch volume.
+
+Nested calls are the one sharp edge of a shared, bounded pool: a worker
+that submits sub-tasks and blocks on their futures holds a thread the
+sub-tasks may need. With ten workers and a 3+-segment multi-city search
+every worker can end up waiting on queued work that no thread is free to
+run. :func:`parallel_map` therefore detects when it runs on a pool thread
+and lets the calling worker claim and run items itself, borrowing idle
+workers only opportunistically — progress never depends on a free thread.
+
+The rate limiter is the main piece of shared mutable state. It uses a
 ``threading.Condition`` rather than a ``Semaphore`` because we need the
 bucket to *refill* over time, not just count borrowed tokens.
+
+Free-threaded builds
+--------------------
+
+On a free-threaded CPython (3.13t / 3.14t, ``sys._is_gil_enabled()`` is
+false) the same thread pool runs decoding truly in parallel and the
+process stage is unnecessary; :func:`gil_enabled` reports which mode is
+active. The shared state the hot path touches is safe in that mode:
+
+* the rate limiter, cancellation tokens, executor and process-pool
+  singletons are guarded by explicit locks (including the worker-cap read
+  in :func:`get_executor`, and resubmission when a resize retires the
+  executor mid-fan-out);
+* the ``Client`` singleton uses double-checked locking, and HTTP sessions
+  are per-thread (``threading.local``);
+* the currency-token cache (:mod:`fli.core.currency`) is a read-mostly
+  dict — lock-free hits, locked inserts — instead of ``lru_cache``,
+  whose internal lock would serialise every parse;
+* the airline / airport lookup tables are built at import and never
+  mutated, so concurrent reads need no lock.
 """
 
 from __future__ import annotations
 
+import contextvars
+import multiprocessing
+import os
+import sys
 import threading
 import time
-from collections.abc import Callable, Iterable, Sequence
-from concurrent.futures import ThreadPoolExecutor
-from typing import TypeVar
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Literal, TypeVar, overload
+
+from fli.search._metrics import record_decode
+from fli.search.exceptions import SearchCancelledError, SearchQuotaError
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 
+# ---------------------------------------------------------------------------
+# Runtime detection
+# ---------------------------------------------------------------------------
+
+
+def gil_enabled() -> bool:
+    """Return False only on a free-threaded CPython build running without the GIL."""
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_enabled is None else bool(is_enabled())
+
+
+# ---------------------------------------------------------------------------
+# Cooperative cancellation
+# ---------------------------------------------------------------------------
+
+
+class CancellationToken:
+    """Thread-safe, one-shot "stop this search" signal.
+
+    Pass one token to a search (``cancel_token=``) and call :meth:`cancel`
+    from any thread to abandon it. Cancellation is cooperative: work that
+    has not started is dropped, threads waiting on the rate limiter or on
+    sibling results are woken at once and raise
+    :class:`~fli.search.exceptions.SearchCancelledError`, and no further
+    HTTP requests or retries are issued. A request already on the wire
+    is not interrupted; its result is simply discarded.
+
+    Example:
+    -------
+    >>> token = CancellationToken()
+    >>> threading.Timer(2.0, token.cancel).start()
+    >>> SearchFlights().search(filters, cancel_token=token)  # raises if still running at 2s
+
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Signal cancellation and run every registered callback (idempotent)."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise :class:`SearchCancelledError` once :meth:`cancel` has been called."""
+        if self._event.is_set():
+            raise SearchCancelledError("Search was cancelled")
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run ``callback`` on cancellation; return a function that unregisters it.
+
+        If the token is already cancelled the callback runs immediately, on
+        the calling thread. Callbacks must be quick and must not raise —
+        they run on whichever thread calls :meth:`cancel`.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass  # already fired or removed
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation snapshots
+# ---------------------------------------------------------------------------
+
+
+# Upper bounds (seconds) of the rate-limiter wait histogram buckets. The
+# final ``inf`` bucket catches everything slower than the last bound.
+WAIT_HISTOGRAM_BOUNDS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    float("inf"),
+)
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    """Point-in-time counters for a :class:`TokenBucketRateLimiter`.
+
+    ``wait_histogram[i]`` counts granted acquisitions whose wait was at
+    most ``WAIT_HISTOGRAM_BOUNDS[i]`` seconds (and above the previous
+    bound). Timed-out and cancelled waits are counted separately and do
+    not appear in the histogram or ``total_wait_s``.
+    """
+
+    tokens_granted: int
+    acquisitions: int
+    total_wait_s: float
+    max_wait_s: float
+    waiters: int
+    timeouts: int
+    cancellations: int
+    wait_histogram: tuple[int, ...]
+
+    @property
+    def mean_wait_s(self) -> float:
+        """Mean wait per granted acquisition, in seconds."""
+        return self.total_wait_s / self.acquisitions if self.acquisitions else 0.0
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    """Point-in-time counters for tasks submitted to the shared executor.
+
+    ``queued`` and ``running`` are current gauges; the ``max_*`` fields are
+    high-water marks since the last :func:`reset_executor_stats`. Queue
+    time is submission → start; run time is start → finish.
+    """
+
+    max_workers: int
+    submitted: int
+    completed: int
+    cancelled: int
+    queued: int
+    running: int
+    max_queued: int
+    max_running: int
+    total_queue_s: float
+    total_run_s: float
+
+    @property
+    def mean_queue_s(self) -> float:
+        """Mean time a started task spent waiting for a worker, in seconds."""
+        started = self.completed + self.running
+        return self.total_queue_s / started if started else 0.0
+
+    @property
+    def mean_run_s(self) -> float:
+        """Mean run time of completed tasks, in seconds."""
+        return self.total_run_s / self.completed if self.completed else 0.0
+
+
 # ---------------------------------------------------------------------------
 # Token-bucket rate limiter
 # ---------------------------------------------------------------------------
@@ -75,11 +313,56 @@ class TokenBucketRateLimiter:
         self._tokens = float(calls)
         self._last_refill = time.monotonic()
         self._cv = threading.Condition()
+        self._reset_counters()
 
     @property
     def capacity(self) -> int:
         return int(self._capacity)
 
+    @property
+    def rate(self) -> float:
+        """Sustained rate the bucket refills at, in tokens per second."""
+        return self._refill_per_second
+
+    def _reset_counters(self) -> None:
+        self._granted = 0
+        self._acquisitions = 0
+        self._total_wait_s = 0.0
+        self._max_wait_s = 0.0
+        self._waiters = 0
+        self._timeouts = 0
+        self._cancellations = 0
+        self._histogram = [0] * len(WAIT_HISTOGRAM_BOUNDS)
+
+    def stats(self) -> LimiterStats:
+        """Return a consistent snapshot of the limiter's counters."""
+        with self._cv:
+            return LimiterStats(
+                tokens_granted=self._granted,
+                acquisitions=self._acquisitions,
+                total_wait_s=self._total_wait_s,
+                max_wait_s=self._max_wait_s,
+                waiters=self._waiters,
+                timeouts=self._timeouts,
+                cancellations=self._cancellations,
+                wait_histogram=tuple(self._histogram),
+            )
+
+    def reset_stats(self) -> None:
+        """Zero the cumulative counters (the current ``waiters`` gauge is kept)."""
+        with self._cv:
+            waiters = self._waiters
+            self._reset_counters()
+            self._waiters = waiters
+
+    def _record_grant(self, tokens: int, waited_s: float) -> None:
+        """Account for one granted acquisition (caller holds the lock)."""
+        self._granted += tokens
+        self._acquisitions += 1
+        self._total_wait_s += waited_s
+        self._max_wait_s = max(self._max_wait_s, waited_s)
+        self._histogram[bisect_left(WAIT_HISTOGRAM_BOUNDS, waited_s)] += 1
+
     def _refill(self) -> None:
         """Advance the bucket's clock and add accrued tokens (caller holds the lock)."""
         now = time.monotonic()
@@ -88,36 +371,140 @@ class TokenBucketRateLimiter:
             self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_per_second)
             self._last_refill = now
 
-    def acquire(self, tokens: int = 1, timeout: float | None = None) -> bool:
+    def acquire(
+        self,
+        tokens: int = 1,
+        timeout: float | None = None,
+        cancel_token: CancellationToken | None = None,
+    ) -> bool:
         """Block until ``tokens`` are available; return False on timeout.
 
         ``tokens`` must be ≤ capacity (otherwise the call would never
         return). The wait is fair in practice — :class:`threading.Condition`
         wakes a single waiter at a time and we re-check under the lock.
+        Every call is accounted for in :meth:`stats`.
+
+        Cancelling ``cancel_token`` wakes the waiter immediately and raises
+        :class:`SearchCancelledError` instead of granting a token.
         """
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
         if tokens <= 0:
             return True
         if tokens > self._capacity:
             raise ValueError(f"tokens={tokens} exceeds bucket capacity={int(self._capacity)}")
+        if cancel_token is None:
+            return self._acquire(tokens, timeout, None)
+        unregister = cancel_token.add_callback(self._wake_all)
+        try:
+            return self._acquire(tokens, timeout, cancel_token)
+        finally:
+            unregister()
+
+    def _wake_all(self) -> None:
+        with self._cv:
+            self._cv.notify_all()
 
-        deadline = None if timeout is None else time.monotonic() + timeout
+    def _acquire(
+        self, tokens: int, timeout: float | None, cancel_token: CancellationToken | None
+    ) -> bool:
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        waiting = False
         with self._cv:
-            while True:
-                self._refill()
-                if self._tokens >= tokens:
-                    self._tokens -= tokens
-                    # Wake the next waiter — they may also be ready now.
-                    self._cv.notify()
-                    return True
-                deficit = tokens - self._tokens
-                wait_s = deficit / self._refill_per_second
-                if deadline is not None:
-                    remaining = deadline - time.monotonic()
-                    if remaining <= 0:
-                        return False
-                    wait_s = min(wait_s, remaining)
-                # ``wait`` releases the lock and re-acquires on wake.
-                self._cv.wait(timeout=wait_s)
+            try:
+                while True:
+                    if cancel_token is not None and cancel_token.cancelled:
+                        self._cancellations += 1
+                        # Pass the wake-up on: another waiter may be able to proceed.
+                        self._cv.notify()
+                        cancel_token.raise_if_cancelled()
+                    self._refill()
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        self._record_grant(tokens, time.monotonic() - started)
+                        # Wake the next waiter — they may also be ready now.
+                        self._cv.notify()
+                        return True
+                    deficit = tokens - self._tokens
+                    wait_s = deficit / self._refill_per_second
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._timeouts += 1
+                            return False
+                        wait_s = min(wait_s, remaining)
+                    if not waiting:
+                        waiting = True
+                        self._waiters += 1
+                    # ``wait`` releases the lock and re-acquires on wake.
+                    self._cv.wait(timeout=wait_s)
+            finally:
+                if waiting:
+                    self._waiters -= 1
+
+
+# ---------------------------------------------------------------------------
+# Per-caller request budgets
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RequestBudget:
+    """One caller's share of the request budget.
+
+    The client acquires a token from ``limiter`` before it takes one from
+    its own (global) limiter, so a caller can never send more than its
+    share, and callers over their share wait on their own bucket instead
+    of crowding the global one. Waiting longer than ``max_wait`` seconds
+    raises :class:`SearchQuotaError`; ``owner`` names the caller in that
+    error.
+    """
+
+    limiter: TokenBucketRateLimiter
+    max_wait: float | None = None
+    owner: str = "this caller"
+
+    def acquire(self, cancel_token: CancellationToken | None = None) -> None:
+        """Take one token, waiting up to ``max_wait`` seconds for it.
+
+        Raises:
+            SearchQuotaError: No token became available within ``max_wait``.
+            SearchCancelledError: ``cancel_token`` was cancelled while waiting.
+
+        """
+        if self.limiter.acquire(timeout=self.max_wait, cancel_token=cancel_token):
+            return
+        raise SearchQuotaError(
+            f"Request quota exceeded: {self.owner} is limited to {self.limiter.rate:g} "
+            f"Google requests per second and none became available within {self.max_wait:g}s. "
+            "Run fewer searches at once or retry shortly."
+        )
+
+
+_request_budget: contextvars.ContextVar[RequestBudget | None] = contextvars.ContextVar(
+    "fli_request_budget", default=None
+)
+
+
+@contextmanager
+def request_budget(budget: RequestBudget | None) -> Iterator[None]:
+    """Charge every request made inside the block to ``budget``.
+
+    The budget follows the work into the shared executor, so fanned-out
+    sub-requests (round-trip expansions, date chunks) are charged too.
+    ``None`` lifts any budget set by an enclosing block.
+    """
+    reset = _request_budget.set(budget)
+    try:
+        yield
+    finally:
+        _request_budget.reset(reset)
+
+
+def current_request_budget() -> RequestBudget | None:
+    """Return the budget set by the innermost :func:`request_budget` block, if any."""
+    return _request_budget.get()
 
 
 # ---------------------------------------------------------------------------
@@ -133,6 +520,19 @@ _executor_lock = threading.Lock()
 _executor: ThreadPoolExecutor | None = None
 _executor_max_workers: int = _DEFAULT_MAX_WORKERS
 
+# Set on every shared-pool thread by the executor's ``initializer`` so
+# :func:`parallel_map` can tell a nested call from a top-level one.
+_worker_state = threading.local()
+
+
+def _mark_pool_thread() -> None:
+    _worker_state.in_pool = True
+
+
+def in_pool_thread() -> bool:
+    """Return True when the current thread belongs to the shared executor."""
+    return getattr(_worker_state, "in_pool", False)
+
 
 def get_executor(max_workers: int | None = None) -> ThreadPoolExecutor:
     """Return the shared :class:`ThreadPoolExecutor`, creating it on first use.
@@ -140,22 +540,147 @@ def get_executor(max_workers: int | None = None) -> ThreadPoolExecutor:
     Re-requesting with a larger ``max_workers`` grows the pool by
     discarding the old executor and starting a new one. This is rare and
     only happens when a user explicitly asks for more parallelism via
-    :func:`configure_concurrency`.
+    :func:`configure_concurrency`. Work already queued on the retired
+    executor still runs; callers racing the swap resubmit to the new one
+    (see :func:`_submit`).
     """
     global _executor, _executor_max_workers
-    desired = max_workers or _executor_max_workers
     with _executor_lock:
+        desired = max_workers or _executor_max_workers
         if _executor is None or desired > _executor_max_workers:
             if _executor is not None:
                 _executor.shutdown(wait=False)
             _executor = ThreadPoolExecutor(
                 max_workers=desired,
                 thread_name_prefix="fli-worker",
+                initializer=_mark_pool_thread,
             )
             _executor_max_workers = desired
         return _executor
 
 
+class _ExecutorMeter:
+    """Queue / run-time accounting for every task :func:`_submit` hands the pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._submitted = self._started = self._cancelled = self._running = 0
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            # Carry in-flight tasks over so the gauges stay consistent when
+            # they start / finish after the reset.
+            queued, running = self._queued(), self._running
+            self._submitted = queued + running
+            self._started = running
+            self._completed = 0
+            self._cancelled = 0
+            self._max_queued = 0
+            self._max_running = 0
+            self._queue_s = 0.0
+            self._run_s = 0.0
+
+    def snapshot(self, max_workers: int) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                max_workers=max_workers,
+                submitted=self._submitted,
+                completed=self._completed,
+                cancelled=self._cancelled,
+                queued=self._queued(),
+                running=self._running,
+                max_queued=self._max_queued,
+                max_running=self._max_running,
+                total_queue_s=self._queue_s,
+                total_run_s=self._run_s,
+            )
+
+    def _queued(self) -> int:
+        return max(0, self._submitted - self._started - self._cancelled)
+
+    def wrap(self, fn: Callable[..., R]) -> Callable[..., R]:
+        """Count a submission now and return ``fn`` wrapped to time its run."""
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._submitted += 1
+            self._max_queued = max(self._max_queued, self._queued())
+
+        def run(*args: object) -> R:
+            started_at = time.perf_counter()
+            with self._lock:
+                self._started += 1
+                self._running += 1
+                self._max_running = max(self._max_running, self._running)
+                self._queue_s += started_at - submitted_at
+            try:
+                return fn(*args)
+            finally:
+                elapsed = time.perf_counter() - started_at
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._run_s += elapsed
+
+        return run
+
+    def discard(self) -> None:
+        """Account for a counted submission the executor refused."""
+        with self._lock:
+            self._cancelled += 1
+
+    def on_done(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._cancelled += 1
+
+
+_meter = _ExecutorMeter()
+
+
+def executor_stats() -> ExecutorStats:
+    """Return queue depth, run-time and concurrency counters for the shared executor.
+
+    Covers every task submitted through :func:`parallel_map`,
+    :func:`parallel_imap` and the nested caller-runs helpers. Work a
+    nested call runs inline on its calling worker is not a separate task.
+    """
+    with _executor_lock:
+        max_workers = _executor_max_workers
+    return _meter.snapshot(max_workers)
+
+
+def reset_executor_stats() -> None:
+    """Zero the shared executor's cumulative counters; in-flight tasks stay in the gauges."""
+    _meter.reset()
+
+
+def _submit(executor: ThreadPoolExecutor, fn: Callable[..., R], *args: object) -> Future[R]:
+    """Submit to ``executor``, falling over to the current shared executor if it was retired.
+
+    A concurrent :func:`get_executor` resize or :func:`configure_concurrency`
+    call shuts the old executor down between our ``get_executor()`` and
+    ``submit()``; ``submit`` then raises :class:`RuntimeError`. Retrying on
+    the replacement keeps resizes invisible to in-flight fan-outs.
+    """
+    task = _meter.wrap(fn)
+    # Run in a copy of the caller's context so a :func:`request_budget`
+    # (and any other context variable) follows the work onto the worker.
+    context = contextvars.copy_context()
+    while True:
+        try:
+            future = executor.submit(context.run, task, *args)
+        except RuntimeError:
+            replacement = get_executor()
+            if replacement is executor:
+                _meter.discard()  # counted as submitted but never queued
+                raise  # genuinely shut down (e.g. interpreter exit), not resized
+            executor = replacement
+            continue
+        future.add_done_callback(_meter.on_done)
+        return future
+
+
 def configure_concurrency(max_workers: int) -> None:
     """Resize the shared executor's worker cap (must be > 0)."""
     if max_workers <= 0:
@@ -177,17 +702,108 @@ def shutdown_executor(wait: bool = True) -> None:
             _executor = None
 
 
+# ---------------------------------------------------------------------------
+# Optional process-pool decode stage
+# ---------------------------------------------------------------------------
+
+
+_process_lock = threading.Lock()
+_process_pool: ProcessPoolExecutor | None = None
+_process_workers: int = 0  # 0 = decode in the calling thread
+
+
+def configure_process_parsing(workers: int | None = None) -> None:
+    """Decode responses in ``workers`` processes (``0`` turns the stage off).
+
+    ``None`` uses one process per CPU. The pool is started lazily on the
+    first decode and uses the ``spawn`` start method, so it is safe to
+    enable from a process that already runs threads. Reconfiguring shuts
+    the previous pool down.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError("workers must be >= 0")
+    global _process_pool, _process_workers
+    with _process_lock:
+        _process_workers = workers
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+def process_parsing_enabled() -> bool:
+    """Return True when :func:`run_decoder` ships work to worker processes."""
+    return _process_workers > 0
+
+
+def _get_process_pool() -> ProcessPoolExecutor | None:
+    global _process_pool
+    if _process_workers <= 0:
+        return None
+    with _process_lock:
+        if _process_pool is None and _process_workers > 0:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=_process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def run_decoder(fn: Callable[[T], R], body: T) -> R:
+    """Run the pure decoder ``fn(body)``, in a worker process when enabled.
+
+    ``fn`` must be a module-level function and its result picklable. With
+    process parsing off (the default) this is a plain call, so the
+    thread-only path pays nothing. Each run is timed into
+    :func:`~fli.search._metrics.decode_stats` under ``fn.__name__``.
+    """
+    pool = _get_process_pool()
+    started = time.perf_counter()
+    try:
+        result = fn(body) if pool is None else pool.submit(fn, body).result()
+    except Exception:
+        record_decode(fn.__name__, time.perf_counter() - started, failed=True)
+        raise
+    record_decode(fn.__name__, time.perf_counter() - started)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # parallel_map — the only helper search code calls directly
 # ---------------------------------------------------------------------------
 
 
+@overload
+def parallel_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int | None = ...,
+    return_exceptions: Literal[False] = ...,
+    cancel_token: CancellationToken | None = ...,
+) -> list[R]: ...
+
+
+@overload
+def parallel_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int | None = ...,
+    return_exceptions: Literal[True],
+    cancel_token: CancellationToken | None = ...,
+) -> list[R | Exception]: ...
+
+
 def parallel_map(
     fn: Callable[[T], R],
     items: Iterable[T],
     *,
     max_workers: int | None = None,
-) -> list[R]:
+    return_exceptions: bool = False,
+    cancel_token: CancellationToken | None = None,
+) -> list[R] | list[R | Exception]:
     """Apply ``fn`` to each item in parallel; return results in input order.
 
     The first exception raised by any worker is re-raised here, after the
@@ -195,20 +811,41 @@ def parallel_map(
     cancel siblings — once submitted, they hold a rate-limit token and
     will release it cleanly when done.
 
+    With ``return_exceptions=True`` nothing is re-raised: an item whose
+    call raised an :class:`Exception` gets the exception object in its
+    result slot instead (the :func:`asyncio.gather` convention), so the
+    caller keeps every successful result it already paid for.
+
+    Cancelling ``cancel_token`` is the exception to both rules: queued
+    items are dropped, the caller stops waiting at once and
+    :class:`SearchCancelledError` is raised (even with
+    ``return_exceptions=True``). Items already running finish or fail at
+    their next cancellation check, in the background.
+
     Falls back to a synchronous loop when the work fits on a single
     thread; this keeps the hot path allocation-free and avoids the
     executor's submit/await overhead for trivial cases.
+
+    When called from a shared-pool worker (a nested fan-out) the items are
+    scheduled caller-runs: see :func:`_caller_runs_map`.
     """
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
     materialised: Sequence[T] = list(items) if not isinstance(items, list | tuple) else items
     n = len(materialised)
     if n == 0:
         return []
+    call = _guarded(fn, return_exceptions, cancel_token)
     workers = max_workers if max_workers is not None else _executor_max_workers
     if n == 1 or workers == 1:
-        return [fn(materialised[0])] if n == 1 else [fn(item) for item in materialised]
+        return [call(materialised[0])] if n == 1 else [call(item) for item in materialised]
 
     executor = get_executor(max_workers=workers)
-    futures = [executor.submit(fn, item) for item in materialised]
+    if in_pool_thread():
+        return _caller_runs_map(executor, call, materialised, workers, cancel_token)
+    futures = [_submit(executor, call, item) for item in materialised]
+    if cancel_token is not None:
+        _wait_all(futures, cancel_token)
     results: list[R] = [None] * n  # type: ignore[list-item]
     first_exc: BaseException | None = None
     for idx, fut in enumerate(futures):
@@ -220,3 +857,262 @@ def parallel_map(
     if first_exc is not None:
         raise first_exc
     return results
+
+
+def _guarded(
+    fn: Callable[[T], R], return_exceptions: bool, cancel_token: CancellationToken | None
+) -> Callable[[T], R]:
+    """Apply the ``return_exceptions`` / ``cancel_token`` wrappers ``fn`` needs."""
+    call = _capturing(fn) if return_exceptions else fn
+    if cancel_token is None:
+        return call
+
+    def checked(item: T) -> R:
+        # Queued work that starts after cancellation is dropped here.
+        cancel_token.raise_if_cancelled()
+        return call(item)
+
+    return checked
+
+
+def _capturing(fn: Callable[[T], R]) -> Callable[[T], R | Exception]:
+    """Wrap ``fn`` so an :class:`Exception` is returned instead of raised.
+
+    :class:`SearchCancelledError` still propagates — a cancelled search
+    has no partial result to hand back.
+    """
+
+    def call(item: T) -> R | Exception:
+        try:
+            return fn(item)
+        except SearchCancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001 — handed back to the caller
+            return exc
+
+    return call
+
+
+def _cancel_signal(cancel_token: CancellationToken) -> tuple[Future[None], Callable[[], None]]:
+    """Return a future that completes on cancellation, plus its unregister hook.
+
+    Adding it to a :func:`concurrent.futures.wait` set lets a blocked
+    caller wake the moment the token fires.
+    """
+    signal: Future[None] = Future()
+
+    def fire() -> None:
+        if not signal.done():
+            signal.set_result(None)
+
+    return signal, cancel_token.add_callback(fire)
+
+
+def _wait_all(futures: list[Future[R]], cancel_token: CancellationToken) -> None:
+    """Wait for every future, or cancel the stragglers and raise once the token fires."""
+    signal, unregister = _cancel_signal(cancel_token)
+    try:
+        not_done = set(futures)
+        while not_done:
+            done, not_done = wait(not_done | {signal}, return_when=FIRST_COMPLETED)
+            if signal in done:
+                for fut in futures:
+                    fut.cancel()
+                cancel_token.raise_if_cancelled()
+            not_done.discard(signal)
+    finally:
+        unregister()
+
+
+@overload
+def parallel_imap(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    window: int | None = ...,
+    ordered: bool = ...,
+    max_workers: int | None = ...,
+    return_exceptions: Literal[False] = ...,
+    cancel_token: CancellationToken | None = ...,
+) -> Generator[R, None, None]: ...
+
+
+@overload
+def parallel_imap(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    window: int | None = ...,
+    ordered: bool = ...,
+    max_workers: int | None = ...,
+    return_exceptions: Literal[True],
+    cancel_token: CancellationToken | None = ...,
+) -> Generator[R | Exception, None, None]: ...
+
+
+def parallel_imap(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    window: int | None = None,
+    ordered: bool = False,
+    max_workers: int | None = None,
+    return_exceptions: bool = False,
+    cancel_token: CancellationToken | None = None,
+) -> Generator[R, None, None] | Generator[R | Exception, None, None]:
+    """Lazily apply ``fn`` to ``items`` with at most ``window`` calls in flight.
+
+    Unlike :func:`parallel_map`, the input is never materialised: the next
+    item is pulled only when a slot frees up, so ``items`` may be a
+    generator of any length. Results are yielded in completion order by
+    default (no head-of-line blocking behind one slow call); pass
+    ``ordered=True`` to get input order instead, at the cost of buffering
+    results that finish ahead of an earlier one. Results carry no index —
+    have ``fn`` return one when the caller needs to correlate them.
+
+    The first exception raised by ``fn`` is re-raised from the iterator and
+    no further items are pulled; with ``return_exceptions=True`` it is
+    yielded in that item's place instead. Closing the iterator early (e.g.
+    ``break`` in a ``for`` loop) cancels every call that has not started.
+
+    Args:
+        fn: Callable applied to each item.
+        items: Any iterable; consumed incrementally.
+        window: Maximum calls in flight. Defaults to the worker cap.
+        ordered: Yield in input order rather than completion order.
+        max_workers: Worker cap for the shared executor (see :func:`parallel_map`).
+        return_exceptions: Yield exceptions instead of raising them.
+        cancel_token: Stop pulling items, drop queued calls and raise
+            :class:`SearchCancelledError` from the iterator once cancelled.
+
+    Raises:
+        ValueError: ``window`` is not positive.
+
+    """
+    workers = max_workers if max_workers is not None else _executor_max_workers
+    limit = window if window is not None else workers
+    if limit <= 0:
+        raise ValueError("window must be positive")
+    call = _guarded(fn, return_exceptions, cancel_token)
+    if in_pool_thread() or limit == 1 or workers == 1:
+        # Nested (or single-slot) use runs inline: submitting and waiting
+        # from a pool worker is exactly the starvation parallel_map avoids.
+        return (call(item) for item in items)
+    return _imap(get_executor(max_workers=workers), call, iter(items), limit, ordered, cancel_token)
+
+
+def _imap(
+    executor: ThreadPoolExecutor,
+    call: Callable[[T], R],
+    source: Iterator[T],
+    limit: int,
+    ordered: bool,
+    cancel_token: CancellationToken | None,
+) -> Generator[R, None, None]:
+    """Drive :func:`parallel_imap` (a separate generator so argument checks stay eager)."""
+    pending: set[Future[R]] = set()
+    queue: deque[Future[R]] = deque()  # submission order, for ``ordered``
+    exhausted = False
+    signal, unregister = (
+        _cancel_signal(cancel_token) if cancel_token is not None else (None, lambda: None)
+    )
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                try:
+                    item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                fut = _submit(executor, call, item)
+                pending.add(fut)
+                if ordered:
+                    queue.append(fut)
+            if not pending:
+                return
+            watch = {queue[0]} if ordered else pending
+            done, _ = wait(
+                watch if signal is None else watch | {signal}, return_when=FIRST_COMPLETED
+            )
+            if signal is not None and signal in done:
+                cancel_token.raise_if_cancelled()
+            if ordered:
+                fut = queue.popleft()
+                pending.discard(fut)
+                yield fut.result()
+                continue
+            pending -= done
+            for fut in done:
+                yield fut.result()
+    finally:
+        unregister()
+        for fut in pending:
+            fut.cancel()
+
+
+def _caller_runs_map(
+    executor: ThreadPoolExecutor,
+    call: Callable[[T], R],
+    items: Sequence[T],
+    workers: int,
+    cancel_token: CancellationToken | None = None,
+) -> list[R]:
+    """Nested ``parallel_map``: the calling worker drains the items itself.
+
+    Items are claimed one at a time from a shared cursor. The caller
+    submits up to ``min(n, workers) - 1`` helper tasks that claim from the
+    same cursor, then starts claiming too. A helper that only gets a
+    thread after the caller has claimed everything finds nothing left and
+    returns at once, so the caller never waits on *queued* work — only on
+    items some thread is actively running. That is what rules out pool
+    starvation, however deep the nesting goes.
+    """
+    n = len(items)
+    results: list[R] = [None] * n  # type: ignore[list-item]
+    errors: list[BaseException | None] = [None] * n
+    cursor = 0
+    done = 0
+    cv = threading.Condition()
+
+    def drain() -> None:
+        nonlocal cursor, done
+        while True:
+            with cv:
+                if cursor >= n or (cancel_token is not None and cancel_token.cancelled):
+                    return
+                idx = cursor
+                cursor += 1
+            try:
+                results[idx] = call(items[idx])
+            except BaseException as exc:  # noqa: BLE001 — re-raised by the caller
+                errors[idx] = exc
+            with cv:
+                done += 1
+                if done == n:
+                    cv.notify_all()
+
+    def wake() -> None:
+        with cv:
+            cv.notify_all()
+
+    unregister = cancel_token.add_callback(wake) if cancel_token is not None else lambda: None
+    try:
+        helpers = [_submit(executor, drain) for _ in range(min(n, workers) - 1)]
+        drain()
+        # Helpers still queued have nothing left to claim; drop them so they
+        # don't occupy a worker slot later.
+        for helper in helpers:
+            helper.cancel()
+        with cv:
+            cv.wait_for(lambda: done == n or (cancel_token is not None and cancel_token.cancelled))
+    finally:
+        unregister()
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
+
+    first_exc = next((exc for exc in errors if exc is not None), None)
+    if first_exc is not None:
+        raise first_exc
+    return results
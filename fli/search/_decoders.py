@@ -5,6 +5,11 @@ These functions take the already-deserialised inner-JSON value of a
 objects. They are intentionally I/O free so they can be exercised
 deterministically against captured fixtures and from unit tests.
 
+The ``decode_*_response`` functions at the bottom take a raw response body
+instead and return plain, picklable results. They are the unit of work
+the optional process-pool parsing stage ships to worker processes (see
+:func:`fli.search._concurrency.configure_process_parsing`).
+
 Position layouts live in ``.reverse-eng/notes/response_map.md`` (the
 overall flight row) and ``.reverse-eng/notes/booking_results.md`` (the
 booking-option row).
@@ -13,6 +18,7 @@ booking-option row).
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -27,6 +33,7 @@ from fli.models import (
     Layover,
 )
 from fli.search._helpers import as_bool, as_int, as_non_negative_int, as_str, safe_get
+from fli.search._wire import iter_wrb_chunks, parse_first_wrb_payload
 
 logger = logging.getLogger(__name__)
 
@@ -277,6 +284,8 @@ def _parse_datetime(date_arr: list[int], time_arr: list[int]) -> datetime:
 # member instance — cache the ``getattr`` walk so the parse hot path
 # turns into a dict lookup. ``__members__`` is itself a dict, but going
 # through ``getattr`` adds attribute-protocol overhead we don't need.
+# Both tables are built once at import and never mutated afterwards, so
+# concurrent lookups need no locking, with or without the GIL.
 _AIRLINE_BY_CODE: dict[str, Airline] = {m.name: m for m in Airline}
 _AIRPORT_BY_CODE: dict[str, Airport] = {m.name: m for m in Airport}
 
@@ -468,3 +477,79 @@ def _extract_fare_name(row: list) -> str | None:
         if isinstance(label, str) and label:
             return label
     return None
+
+
+# ---------------------------------------------------------------------------
+# Whole-response decoding (process-pool unit of work)
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ShoppingDecode:
+    """Everything :class:`~fli.search.flights.SearchFlights` needs from one response.
+
+    Decoding never raises for shape problems; they are reported in fields
+    so the caller (possibly in another process) decides how to surface
+    them. ``has_payload`` is ``False`` when the body held no ``wrb.fr``
+    payload at all. ``session_id`` is ``inner[0][4]``; when indexing it
+    failed, ``session_id_missing`` is set and ``session_id_error`` holds the
+    exception (its traceback only survives an in-process decode).
+    ``shape_error`` holds the exception raised while locating the flights
+    arrays, likewise.
+    """
+
+    has_payload: bool
+    session_id: Any = None
+    session_id_missing: bool = False
+    session_id_error: BaseException | None = None
+    flights: list[FlightResult] = field(default_factory=list)
+    row_count: int = 0
+    failure_samples: list[str] = field(default_factory=list)
+    shape_error: BaseException | None = None
+
+    @property
+    def failed_rows(self) -> int:
+        """Number of rows that were skipped as unparseable."""
+        return self.row_count - len(self.flights)
+
+
+def decode_shopping_response(body: str | bytes) -> ShoppingDecode:
+    """Decode a ``GetShoppingResults`` body into a :class:`ShoppingDecode`."""
+    inner = parse_first_wrb_payload(body)
+    if inner is None:
+        return ShoppingDecode(has_payload=False)
+
+    result = ShoppingDecode(has_payload=True)
+    try:
+        result.session_id = inner[0][4]
+    except (IndexError, TypeError) as e:
+        result.session_id_missing = True
+        result.session_id_error = e
+
+    try:
+        flights_raw = [item for i in (2, 3) if isinstance(inner[i], list) for item in inner[i][0]]
+    except (IndexError, TypeError) as e:
+        result.shape_error = e
+        return result
+
+    result.row_count = len(flights_raw)
+    # Bounded sample of unique failure reasons — only the first few are
+    # surfaced to the caller, so memory stays constant however large a
+    # future response gets.
+    for row in flights_raw:
+        try:
+            result.flights.append(parse_flight_row(row))
+        except (AttributeError, KeyError, ValueError, TypeError) as e:
+            reason = f"{type(e).__name__}: {e}"
+            if reason not in result.failure_samples and len(result.failure_samples) < 3:
+                result.failure_samples.append(reason)
+            logger.debug("Skipping flight with unparseable data: %s", reason)
+    return result
+
+
+def decode_booking_response(body: str | bytes) -> list[BookingOption]:
+    """Decode every booking option in a (multi-chunk) ``GetBookingResults`` body."""
+    options: list[BookingOption] = []
+    for chunk in iter_wrb_chunks(body):
+        options.extend(parse_booking_chunk(chunk))
+    return options
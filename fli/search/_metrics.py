@@ -0,0 +1,222 @@
+"""Process-wide counters for HTTP requests and response decoding.
+
+These complement :class:`~fli.search.LimiterStats` and
+:class:`~fli.search.ExecutorStats` so that a long-running process (the MCP
+HTTP server, typically) can report how many requests it sends to Google,
+how they end, how often they are retried, and how long decoding takes and
+how often it fails. Snapshots are plain frozen dataclasses; exporting them
+(Prometheus text, logs, …) is left to the caller.
+
+* :class:`Histogram` is a small thread-safe, fixed-bucket histogram.
+* :class:`~fli.search.client.Client` keeps a :class:`ClientStats` per
+  client (see :meth:`Client.stats`).
+* :func:`decode_stats` returns the process-wide :class:`DecodeStats`,
+  recorded by :func:`~fli.search._concurrency.run_decoder` and by
+  :class:`~fli.search.SearchFlights` when rows fail to parse.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+
+# Upper bounds (seconds) of the histogram buckets; the final ``inf`` bucket
+# catches everything slower than the last bound.
+REQUEST_SECONDS_BOUNDS: tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    float("inf"),
+)
+DECODE_SECONDS_BOUNDS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+    float("inf"),
+)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Point-in-time state of a :class:`Histogram`.
+
+    ``counts[i]`` counts observations at most ``bounds[i]`` (and above the
+    previous bound), matching :class:`~fli.search.LimiterStats`'s
+    ``wait_histogram``.
+    """
+
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    count: int
+    sum: float
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram of non-negative values."""
+
+    __slots__ = ("_bounds", "_counts", "_sum", "_lock")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        """Create an empty histogram; ``bounds`` must be ascending and end with ``inf``."""
+        if not bounds or bounds[-1] != float("inf"):
+            raise ValueError("bounds must end with float('inf')")
+        self._bounds = bounds
+        self._counts = [0] * len(bounds)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Return a consistent copy of the buckets, count and sum."""
+        with self._lock:
+            return HistogramSnapshot(
+                self._bounds, tuple(self._counts), sum(self._counts), self._sum
+            )
+
+
+# ---------------------------------------------------------------------------
+# HTTP client
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ClientStats:
+    """Point-in-time counters for a :class:`~fli.search.client.Client`.
+
+    ``requests`` counts attempts (a retried call counts once per attempt)
+    by ``(method, outcome)``. ``outcome`` is ``"ok"``, ``"timeout"``,
+    ``"connection"``, ``"http_<status>"`` or ``"error"``. ``retries``
+    counts attempts that were followed by another one. ``latency`` covers
+    every attempt, successful or not, excluding the rate-limiter wait.
+    """
+
+    requests: dict[tuple[str, str], int]
+    retries: int
+    latency: HistogramSnapshot
+
+
+class _ClientMetrics:
+    """Mutable counters behind :class:`ClientStats`."""
+
+    __slots__ = ("_lock", "_requests", "_retries", "latency")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests: dict[tuple[str, str], int] = {}
+        self._retries = 0
+        self.latency = Histogram(REQUEST_SECONDS_BOUNDS)
+
+    def request(self, method: str, outcome: str, seconds: float) -> None:
+        self.latency.observe(seconds)
+        with self._lock:
+            key = (method, outcome)
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+    def retry(self) -> None:
+        with self._lock:
+            self._retries += 1
+
+    def stats(self) -> ClientStats:
+        with self._lock:
+            requests, retries = dict(self._requests), self._retries
+        return ClientStats(requests=requests, retries=retries, latency=self.latency.snapshot())
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DecodeStats:
+    """Process-wide decode counters.
+
+    ``duration`` and ``errors`` are keyed by decoder function name
+    (``decode_shopping_response``, …); ``errors`` counts decoders that
+    raised. ``rows`` and ``failed_rows`` count flight rows seen and
+    skipped as unparseable. ``parse_errors`` counts
+    :class:`~fli.search.flights.SearchParseError` raised by searches.
+    """
+
+    duration: dict[str, HistogramSnapshot]
+    errors: dict[str, int]
+    rows: int
+    failed_rows: int
+    parse_errors: int
+
+
+_decode_lock = threading.Lock()
+_decode_duration: dict[str, Histogram] = {}
+_decode_errors: dict[str, int] = {}
+_rows = [0, 0]  # seen, failed
+_parse_errors = 0
+
+
+def record_decode(decoder: str, seconds: float, failed: bool = False) -> None:
+    """Record one run of ``decoder``."""
+    with _decode_lock:
+        histogram = _decode_duration.get(decoder)
+        if histogram is None:
+            histogram = _decode_duration[decoder] = Histogram(DECODE_SECONDS_BOUNDS)
+        if failed:
+            _decode_errors[decoder] = _decode_errors.get(decoder, 0) + 1
+    histogram.observe(seconds)
+
+
+def record_rows(rows: int, failed: int) -> None:
+    """Record flight rows seen in one response, and how many failed to parse."""
+    with _decode_lock:
+        _rows[0] += rows
+        _rows[1] += failed
+
+
+def record_parse_error() -> None:
+    """Record one :class:`~fli.search.flights.SearchParseError`."""
+    global _parse_errors
+    with _decode_lock:
+        _parse_errors += 1
+
+
+def decode_stats() -> DecodeStats:
+    """Return a snapshot of the process-wide decode counters."""
+    with _decode_lock:
+        histograms = dict(_decode_duration)
+        errors = dict(_decode_errors)
+        rows, failed = _rows
+        parse_errors = _parse_errors
+    return DecodeStats(
+        duration={name: h.snapshot() for name, h in histograms.items()},
+        errors=errors,
+        rows=rows,
+        failed_rows=failed,
+        parse_errors=parse_errors,
+    )
+
+
+def reset_decode_stats() -> None:
+    """Zero the process-wide decode counters (mainly for tests and benchmarks)."""
+    global _parse_errors
+    with _decode_lock:
+        _decode_duration.clear()
+        _decode_errors.clear()
+        _rows[:] = [0, 0]
+        _parse_errors = 0
@@ -0,0 +1,92 @@
+"""Progress events for long-running searches.
+
+A round-trip :meth:`SearchFlights.search` issues one outbound request and
+then one request per expanded outbound. A long :meth:`SearchDates.search`
+issues one request per calendar chunk. Both accept an ``on_progress``
+callback that receives a :class:`SearchProgress` each time one of those
+requests completes. The event carries whatever that request produced, so
+callers can show or act on early results before the search returns.
+
+Callbacks run on whichever thread finished the request (often a worker of
+the shared executor), one at a time. They must be quick and must not
+block on the search they observe.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+ProgressKind = Literal["outbound", "expansion", "chunk"]
+
+
+@dataclass(frozen=True)
+class SearchProgress:
+    """One completed request of a search.
+
+    Attributes:
+        kind: ``"outbound"`` for the first leg of a flight search,
+            ``"expansion"`` for a next-leg request, ``"chunk"`` for a calendar
+            chunk of a date search.
+        completed: Requests completed so far, this one included.
+        total: Requests known so far. A flight search only learns how many
+            expansions it needs once its outbound request completes, so
+            ``total`` can grow.
+        description: Human-readable label of the request (a date range, an
+            outbound flight, …).
+        results: What this request produced. For ``"outbound"``, the
+            outbound :class:`FlightResult` list. For ``"expansion"``, the
+            complete itineraries (tuples) it contributes. For ``"chunk"``,
+            a :class:`DatePriceArray`. Empty when the request failed or
+            found nothing.
+
+    """
+
+    kind: ProgressKind
+    completed: int
+    total: int
+    description: str = ""
+    results: Sequence[Any] = ()
+
+
+class _ProgressTracker:
+    """Counts planned / completed requests and emits :class:`SearchProgress` events."""
+
+    __slots__ = ("_callback", "_lock", "_completed", "_total")
+
+    def __init__(self, callback: Callable[[SearchProgress], None]):
+        """Wrap ``callback``; counters start at zero."""
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._total = 0
+
+    def plan(self, requests: int) -> None:
+        """Add ``requests`` to the known total."""
+        with self._lock:
+            self._total += requests
+
+    def step(self, kind: ProgressKind, description: str = "", results: Sequence[Any] = ()) -> None:
+        """Record one completed request and emit its event."""
+        # Emitting under the lock keeps ``completed`` strictly increasing
+        # across the callbacks, whichever threads the requests finish on.
+        with self._lock:
+            self._completed += 1
+            self._callback(
+                SearchProgress(
+                    kind=kind,
+                    completed=self._completed,
+                    total=max(self._total, self._completed),
+                    description=description,
+                    results=results,
+                )
+            )
+
+
+def progress_tracker(
+    on_progress: Callable[[SearchProgress], None] | None,
+) -> _ProgressTracker | None:
+    """Return a tracker for ``on_progress``, or None when no callback is given."""
+    return _ProgressTracker(on_progress) if on_progress is not None else None
@@ -0,0 +1,244 @@
+"""Process-wide, TTL-bound LRU cache for whole search results.
+
+:class:`~fli.search.CalendarPriceStore` caches calendar prices per day. This
+cache sits one level up: it maps a normalised query key to the finished
+result of a search (a list of flights, a serialised tool response, …), so
+an identical repeat query never reaches Google while the entry is fresh.
+
+* Entries are fresh for ``ttl`` seconds after they were stored. With a
+  longer ``hard_ttl``, they are then kept as *stale* until ``hard_ttl``:
+  :meth:`ResultCache.get` ignores them, but :meth:`ResultCache.lookup`
+  returns them with their age, for stale-while-revalidate callers (see
+  :class:`~fli.search.SearchResultCache`).
+* The cache holds at most ``max_bytes`` of (estimated) payload. Storing past
+  that evicts the least recently *used* entries first; expired entries are
+  dropped as they are found.
+* Hit / miss / eviction counters are exposed via :meth:`ResultCache.stats`.
+
+Sizes come from a *sizer* callable. The default, :func:`approx_size`, walks
+dicts, lists, tuples, sets and Pydantic models and sums
+:func:`sys.getsizeof` over them. That
+is rough, but cheap and good enough to keep a budget. Cached values are
+shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def approx_size(value: Any) -> int:
+    """Return an approximate deep size of ``value`` in bytes.
+
+    Containers (dict, list, tuple, set, frozenset) and Pydantic models
+    (through their field values) are walked recursively; everything else
+    counts its :func:`sys.getsizeof`. Objects shared between several places
+    are counted once per reference.
+    """
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset):
+            stack.extend(item)
+        elif hasattr(type(item), "__pydantic_fields__"):
+            stack.extend(vars(item).values())
+    return size
+
+
+@dataclass(frozen=True)
+class CacheEntry(Generic[V]):
+    """A value returned by :meth:`ResultCache.lookup`.
+
+    ``age`` is the number of seconds since the value was stored. ``stale`` is
+    true once the age has passed the cache's ``ttl``.
+    """
+
+    value: V
+    age: float
+    stale: bool
+
+
+@dataclass(frozen=True)
+class ResultCacheStats:
+    """Point-in-time counters for a :class:`ResultCache`.
+
+    ``hits`` counts fresh hits only; ``stale_hits`` counts stale entries
+    returned by :meth:`ResultCache.lookup`.
+    """
+
+    entries: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    stale_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache(Generic[K, V]):
+    """Thread-safe TTL + LRU cache with a memory budget.
+
+    Args:
+        ttl: Seconds an entry stays fresh after it is stored.
+        max_bytes: Budget for the summed sizes of all entries. A single value
+            larger than the whole budget is not cached at all.
+        hard_ttl: Seconds an entry is kept after it is stored, at least
+            ``ttl``. Between ``ttl`` and ``hard_ttl`` only :meth:`lookup`
+            returns it. Defaults to ``ttl``.
+        sizer: Estimates a value's size in bytes. Defaults to
+            :func:`approx_size`.
+        clock: Monotonic time source, in seconds (overridable for tests).
+
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_bytes: int,
+        *,
+        hard_ttl: float | None = None,
+        sizer: Callable[[V], int] = approx_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create an empty cache."""
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if hard_ttl is not None and hard_ttl < ttl:
+            raise ValueError("hard_ttl must not be shorter than ttl")
+        self.ttl = ttl
+        self.hard_ttl = ttl if hard_ttl is None else hard_ttl
+        self.max_bytes = max_bytes
+        self._sizer = sizer
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key → (stored_at, size, value); order is least → most recently used.
+        self._entries: OrderedDict[K, tuple[float, int, V]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._stale_hits = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries (fresh or not)."""
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the fresh value stored under ``key``, or ``default``."""
+        entry = self.lookup(key, stale=False)
+        return default if entry is None else entry.value
+
+    def lookup(self, key: K, *, stale: bool = True) -> CacheEntry[V] | None:
+        """Return the entry stored under ``key`` with its age, or None.
+
+        Stale entries (older than ``ttl`` but not ``hard_ttl``) are returned
+        too unless ``stale`` is false. Unlike :meth:`get`, a stored ``None``
+        value is distinguishable from a miss.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            age = now - entry[0]
+            if age >= self.hard_ttl:
+                self._drop(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            is_stale = age >= self.ttl
+            if is_stale and not stale:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if is_stale:
+                self._stale_hits += 1
+            else:
+                self._hits += 1
+            return CacheEntry(entry[2], age, is_stale)
+
+    def put(self, key: K, value: V) -> None:
+        """Store ``value`` under ``key``, evicting least recently used entries as needed."""
+        size = self._sizer(value)
+        if size > self.max_bytes:
+            return
+        stored_at = self._clock()
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (stored_at, size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+
+    def expires_in(self, key: K) -> float | None:
+        """Return the seconds until ``key`` goes stale, or None if it is not cached or stale.
+
+        Unlike :meth:`get`, this neither counts as a lookup nor marks the
+        entry as recently used.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry[0] + self.ttl - now
+        return remaining if remaining > 0 else None
+
+    def invalidate(self, key: K) -> None:
+        """Forget ``key`` if it is cached."""
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> ResultCacheStats:
+        """Return a snapshot of the cache's size and counters."""
+        with self._lock:
+            return ResultCacheStats(
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                stale_hits=self._stale_hits,
+            )
+
+    def _drop(self, key: K) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
@@ -0,0 +1,168 @@
+"""Stale-while-revalidate result caching for ``SearchFlights`` and ``SearchDates``.
+
+A :class:`SearchResultCache` is a :class:`~fli.search.ResultCache` with two
+lifetimes per entry:
+
+* for ``ttl`` seconds the entry is *fresh* and is served as is;
+* from ``ttl`` until ``hard_ttl`` it is *stale*. It is still served at once,
+  but the search that produced it is re-run in the background on the shared
+  executor, and the new result replaces it;
+* past ``hard_ttl`` it is dropped and the next call searches synchronously.
+
+Hot routes are therefore answered from memory while their prices are
+refreshed behind them, and a slow or failing Google response never blocks a
+caller that has a recent enough answer. Each search records what happened in
+``last_cache_status`` (a :class:`CacheStatus`), including the age of the
+result it returned, so callers can decide whether it is recent enough.
+
+Only complete results are cached: a ``partial=True`` search with failed
+sub-requests is returned but not stored. A failed revalidation keeps the
+stale entry until its hard TTL.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from fli.search._concurrency import _submit, get_executor
+from fli.search._result_cache import CacheEntry, ResultCache
+
+logger = logging.getLogger(__name__)
+
+# Defaults: fresh for five minutes, served stale for up to an hour.
+DEFAULT_TTL = 5 * 60
+DEFAULT_HARD_TTL = 60 * 60
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheStatus:
+    """How a search call's result was obtained.
+
+    ``hit`` is true when it came from the cache and ``age_s`` is its age in
+    seconds (0 for a result searched by this call). ``stale`` marks a hit
+    past the fresh TTL, and ``revalidating`` that a background refresh is
+    running for it.
+    """
+
+    hit: bool
+    age_s: float = 0.0
+    stale: bool = False
+    revalidating: bool = False
+
+    @classmethod
+    def miss(cls) -> CacheStatus:
+        """Return the status of a result searched by the call itself."""
+        return cls(hit=False)
+
+
+@dataclass(frozen=True)
+class SearchCacheStats:
+    """Point-in-time background refresh counters for a :class:`SearchResultCache`."""
+
+    revalidations: int
+    revalidation_failures: int
+    revalidating: int
+
+
+class SearchResultCache(ResultCache[Hashable, Any]):
+    """Search results kept fresh by background revalidation.
+
+    Pass one to :class:`~fli.search.SearchFlights` or
+    :class:`~fli.search.SearchDates` (``cache=``); it may be shared by
+    several instances and threads. Cached results are shared between
+    callers and must be treated as read-only.
+
+    Args:
+        ttl: Seconds a result is served without revalidation.
+        hard_ttl: Seconds a result is served at all; stale results between
+            ``ttl`` and ``hard_ttl`` trigger a background refresh.
+        max_bytes: Memory budget for the cached results.
+        clock: Monotonic time source, in seconds (overridable for tests).
+
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        hard_ttl: float = DEFAULT_HARD_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create an empty cache."""
+        super().__init__(ttl, max_bytes, hard_ttl=hard_ttl, clock=clock)
+        self._refresh_lock = threading.Lock()
+        self._refreshing: set[Hashable] = set()
+        self._revalidations = 0
+        self._revalidation_failures = 0
+
+    def serve(
+        self, key: Hashable, refresh: Callable[[], Any]
+    ) -> tuple[CacheEntry | None, CacheStatus]:
+        """Look up ``key`` and start a background ``refresh`` if it is stale.
+
+        Returns:
+            The entry and its :class:`CacheStatus`, or ``(None, miss)`` when
+            nothing usable is cached.
+
+        """
+        entry = self.lookup(key)
+        if entry is None:
+            return None, CacheStatus.miss()
+        revalidating = self.revalidate(key, refresh) if entry.stale else False
+        return entry, CacheStatus(
+            hit=True, age_s=entry.age, stale=entry.stale, revalidating=revalidating
+        )
+
+    def revalidate(self, key: Hashable, refresh: Callable[[], Any]) -> bool:
+        """Run ``refresh`` on the shared executor and store its result under ``key``.
+
+        At most one refresh per key runs at a time. ``refresh`` returns the
+        new value, or raises to keep the current entry.
+
+        Returns:
+            True if a refresh for ``key`` is running (started now or earlier).
+
+        """
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return True
+            self._refreshing.add(key)
+        try:
+            _submit(get_executor(), self._refresh, key, refresh)
+        except Exception:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+            logger.warning("Could not schedule a search cache refresh", exc_info=True)
+            return False
+        return True
+
+    def _refresh(self, key: Hashable, refresh: Callable[[], Any]) -> None:
+        try:
+            value = refresh()
+        except Exception:
+            logger.warning("Background search cache refresh failed", exc_info=True)
+            with self._refresh_lock:
+                self._revalidation_failures += 1
+        else:
+            self.put(key, value)
+            with self._refresh_lock:
+                self._revalidations += 1
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    def refresh_stats(self) -> SearchCacheStats:
+        """Return a snapshot of the background refresh counters."""
+        with self._refresh_lock:
+            return SearchCacheStats(
+                revalidations=self._revalidations,
+                revalidation_failures=self._revalidation_failures,
+                revalidating=len(self._refreshing),
+            )
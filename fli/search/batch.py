@@ -0,0 +1,187 @@
+"""Batch scheduling for many independent flight searches.
+
+:meth:`fli.search.SearchFlights.search_many` is the entry point; this
+module holds the result / statistics types it yields and the iterator that
+drives the work.
+
+Scheduling is delegated to :func:`~fli.search._concurrency.parallel_imap`
+on the shared executor: batch jobs routinely submit thousands of
+queries, so the query source is consumed lazily and at most
+``max_in_flight`` queries are outstanding at once. Each round-trip query
+still fans out its own expansion requests; those nested calls run
+caller-runs on the query's worker, so they can never starve the pool.
+Every HTTP call goes through the client's shared
+:class:`TokenBucketRateLimiter`, so the batch runs at the full
+sustainable request rate and no faster.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from fli.search._concurrency import CancellationToken, parallel_imap
+from fli.search.exceptions import SearchCancelledError
+
+if TYPE_CHECKING:
+    from fli.models import FlightResult, FlightSearchFilters
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one query in a :meth:`SearchFlights.search_many` batch.
+
+    Exactly one of ``flights`` / ``error`` is meaningful: a failed query
+    carries the raised exception in ``error`` and ``flights`` is ``None``.
+    A successful query with no matches also has ``flights=None`` but
+    ``error=None``. ``session_id`` is the shopping session of the query's
+    response; pass it to :meth:`SearchFlights.get_booking_options` to book
+    one of its flights.
+    """
+
+    index: int
+    filters: FlightSearchFilters
+    flights: list[FlightResult | tuple[FlightResult, ...]] | None = None
+    error: BaseException | None = None
+    elapsed_s: float = 0.0
+    session_id: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """``True`` when the query completed without raising."""
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    """Aggregate throughput numbers for a batch, updated as results arrive."""
+
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed_s: float = 0.0
+    total_query_s: float = 0.0
+    max_in_flight: int = 0
+    started_at: float | None = field(default=None, repr=False)
+
+    @property
+    def completed(self) -> int:
+        """Number of queries that finished, successfully or not."""
+        return self.succeeded + self.failed
+
+    @property
+    def queries_per_second(self) -> float:
+        """Completed queries per wall-clock second since the batch started."""
+        return self.completed / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def mean_query_s(self) -> float:
+        """Mean per-query latency (submission to completion) in seconds."""
+        return self.total_query_s / self.completed if self.completed else 0.0
+
+
+class BatchSearch:
+    """Iterator over :class:`BatchResult` objects in completion order.
+
+    Work is scheduled lazily on first iteration: at most ``max_in_flight``
+    queries are outstanding at any moment, and ``queries`` is consumed
+    only as slots free up, so arbitrarily long (or generated) inputs run
+    in constant memory. Breaking out of the loop cancels every query that
+    has not started yet; cancelling ``cancel_token`` additionally stops
+    running queries at their next request and makes iteration raise
+    :class:`~fli.search.exceptions.SearchCancelledError`.
+
+    ``on_result`` is invoked on the iterating thread — never on a worker —
+    immediately before each result is yielded, so callbacks do not need to
+    be thread-safe.
+    """
+
+    def __init__(
+        self,
+        run_one: Callable[[FlightSearchFilters, Callable[[str], None]], list | None],
+        queries: Iterable[FlightSearchFilters],
+        *,
+        max_in_flight: int,
+        on_result: Callable[[BatchResult], None] | None = None,
+        cancel_token: CancellationToken | None = None,
+    ):
+        """Capture the per-query worker and the (lazy) query source.
+
+        ``run_one(filters, on_session)`` runs one query and reports its
+        shopping session id through ``on_session``.
+        """
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        self._run_one = run_one
+        self._queries = queries
+        self._max_in_flight = max_in_flight
+        self._on_result = on_result
+        self._cancel_token = cancel_token
+        self.stats = BatchStats(max_in_flight=max_in_flight)
+        self._started = False
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        """Run the batch, yielding each result as soon as it completes."""
+        if self._started:
+            raise RuntimeError("A BatchSearch can only be iterated once")
+        self._started = True
+        return self._drive()
+
+    def collect(self) -> list[BatchResult]:
+        """Run the whole batch and return every result in input order."""
+        return sorted(self, key=lambda r: r.index)
+
+    def _execute(self, index: int, filters: FlightSearchFilters) -> BatchResult:
+        t0 = time.perf_counter()
+        sessions: list[str] = []
+        try:
+            flights = self._run_one(filters, sessions.append)
+        except SearchCancelledError:
+            raise  # ends the whole batch, not just this query
+        except Exception as exc:  # noqa: BLE001 — isolated per query, surfaced on the result
+            return BatchResult(
+                index=index, filters=filters, error=exc, elapsed_s=time.perf_counter() - t0
+            )
+        return BatchResult(
+            index=index,
+            filters=filters,
+            flights=flights,
+            elapsed_s=time.perf_counter() - t0,
+            session_id=sessions[0] if sessions else None,
+        )
+
+    def _record(self, result: BatchResult) -> None:
+        stats = self.stats
+        if result.ok:
+            stats.succeeded += 1
+        else:
+            stats.failed += 1
+        stats.total_query_s += result.elapsed_s
+        stats.elapsed_s = time.perf_counter() - (stats.started_at or 0.0)
+
+    def _pull(self) -> Iterator[tuple[int, FlightSearchFilters]]:
+        for index, filters in enumerate(self._queries):
+            self.stats.submitted += 1
+            yield index, filters
+
+    def _drive(self) -> Iterator[BatchResult]:
+        stats = self.stats
+        stats.started_at = time.perf_counter()
+        results = parallel_imap(
+            lambda job: self._execute(*job),
+            self._pull(),
+            window=self._max_in_flight,
+            max_workers=self._max_in_flight,
+            cancel_token=self._cancel_token,
+        )
+        try:
+            for result in results:
+                self._record(result)
+                if self._on_result is not None:
+                    self._on_result(result)
+                yield result
+        finally:
+            results.close()
+            stats.elapsed_s = time.perf_counter() - stats.started_at
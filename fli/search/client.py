@@ -4,7 +4,9 @@ This module provides a robust HTTP client that handles:
 
 - User agent impersonation (to mimic a browser)
 - Rate limiting (10 requests per second, *globally* across threads)
+- Optional per-caller request budgets (:func:`~fli.search.request_budget`)
 - Automatic retries with exponential backoff
+- Cooperative cancellation (``cancel_token``) of the rate-limit wait and retries
 - Thread-safe session management (one ``curl_cffi`` session per worker thread)
 - Error handling
 
@@ -22,15 +24,30 @@ from __future__ import annotations
 
 import os
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
-from fli.search._concurrency import TokenBucketRateLimiter
+from fli.search._concurrency import (
+    CancellationToken,
+    LimiterStats,
+    TokenBucketRateLimiter,
+    current_request_budget,
+)
+from fli.search._metrics import ClientStats, _ClientMetrics
 from fli.search.exceptions import (
+    SearchCancelledError,
     SearchClientError,
     SearchConnectionError,
     SearchHTTPError,
+    SearchQuotaError,
     SearchTimeoutError,
 )
 
@@ -73,6 +90,32 @@ else:
     REQUEST_TIMEOUT = DEFAULT_TIMEOUT
 
 
+def _stop_when_cancelled(retry_state: RetryCallState) -> bool:
+    """Tenacity stop condition: give up retrying once the call's token fires."""
+    token = retry_state.kwargs.get("cancel_token")
+    return token is not None and token.cancelled
+
+
+def _count_retry(retry_state: RetryCallState) -> None:
+    """Tenacity ``before_sleep`` hook: count the retry on the calling client."""
+    client = retry_state.args[0] if retry_state.args else None
+    if isinstance(client, Client):
+        client._metrics.retry()
+
+
+# Shared retry policy for both verbs: three attempts with exponential
+# backoff, but never retry a cancelled request (or start one after the
+# caller cancelled during the backoff sleep), nor one refused by the
+# caller's request budget.
+_retry_policy = retry(
+    stop=stop_after_attempt(3) | _stop_when_cancelled,
+    wait=wait_exponential(),
+    retry=retry_if_not_exception_type((SearchCancelledError, SearchQuotaError)),
+    before_sleep=_count_retry,
+    reraise=True,
+)
+
+
 class Client:
     """HTTP client with built-in rate limiting, retry and user agent impersonation functionality.
 
@@ -94,6 +137,7 @@ class Client:
         """Initialise the shared rate limiter and per-thread session storage."""
         self._sessions = threading.local()
         self._rate_limiter = TokenBucketRateLimiter(calls=calls_per_second, period=1.0)
+        self._metrics = _ClientMetrics()
 
     def _session(self) -> Session:
         """Return this thread's ``Session``, creating it on first use."""
@@ -118,33 +162,85 @@ class Client:
             except Exception:  # noqa: BLE001 — destruction-time best effort
                 pass
 
+    @property
+    def requests_per_second(self) -> float:
+        """Sustained request rate the shared limiter allows."""
+        return self._rate_limiter.rate
+
+    def limiter_stats(self) -> LimiterStats:
+        """Return a snapshot of the rate limiter's grant / wait counters."""
+        return self._rate_limiter.stats()
+
+    def stats(self) -> ClientStats:
+        """Return a snapshot of request counts by outcome, retries and request latency."""
+        return self._metrics.stats()
+
     # ------------------------------------------------------------------
     # Request entry points
     # ------------------------------------------------------------------
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(), reraise=True)
-    def get(self, url: str, **kwargs: Any) -> Response:
-        """Make a rate-limited GET request with automatic retries."""
-        self._rate_limiter.acquire()
+    @_retry_policy
+    def get(
+        self, url: str, *, cancel_token: CancellationToken | None = None, **kwargs: Any
+    ) -> Response:
+        """Make a rate-limited GET request with automatic retries.
+
+        ``cancel_token`` aborts the rate-limit wait and any further retries
+        with :class:`SearchCancelledError`. Inside a
+        :func:`~fli.search.request_budget` block, the request is charged to
+        that budget first.
+        """
+        self._acquire(cancel_token)
         kwargs.setdefault("timeout", REQUEST_TIMEOUT)
-        try:
-            response = self._session().get(url, **kwargs)
-            response.raise_for_status()
-            return response
-        except Exception as e:
-            raise _wrap_request_error("GET", url, e) from e
-
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(), reraise=True)
-    def post(self, url: str, **kwargs: Any) -> Response:
-        """Make a rate-limited POST request with automatic retries."""
-        self._rate_limiter.acquire()
+        return self._send("GET", url, kwargs)
+
+    @_retry_policy
+    def post(
+        self, url: str, *, cancel_token: CancellationToken | None = None, **kwargs: Any
+    ) -> Response:
+        """Make a rate-limited POST request with automatic retries.
+
+        ``cancel_token`` aborts the rate-limit wait and any further retries
+        with :class:`SearchCancelledError`. Inside a
+        :func:`~fli.search.request_budget` block, the request is charged to
+        that budget first.
+        """
+        self._acquire(cancel_token)
         kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        return self._send("POST", url, kwargs)
+
+    def _acquire(self, cancel_token: CancellationToken | None) -> None:
+        """Take a token from the caller's request budget, if any, then the shared limiter."""
+        budget = current_request_budget()
+        if budget is not None:
+            budget.acquire(cancel_token)
+        self._rate_limiter.acquire(cancel_token=cancel_token)
+
+    def _send(self, method: str, url: str, kwargs: dict[str, Any]) -> Response:
+        """Send one attempt of a request and record its outcome and latency."""
+        started = time.perf_counter()
         try:
-            response = self._session().post(url, **kwargs)
+            session = self._session()
+            send = session.get if method == "GET" else session.post
+            response = send(url, **kwargs)
             response.raise_for_status()
-            return response
         except Exception as e:
-            raise _wrap_request_error("POST", url, e) from e
+            error = _wrap_request_error(method, url, e)
+            self._metrics.request(method, _outcome(error), time.perf_counter() - started)
+            raise error from e
+        self._metrics.request(method, "ok", time.perf_counter() - started)
+        return response
+
+
+def _outcome(error: SearchClientError) -> str:
+    """Label a failed attempt for :class:`ClientStats`."""
+    if isinstance(error, SearchTimeoutError):
+        return "timeout"
+    if isinstance(error, SearchConnectionError):
+        return "connection"
+    if isinstance(error, SearchHTTPError) and error.status_code:
+        return f"http_{error.status_code}"
+    return "error"
 
 
 def _wrap_request_error(method: str, url: str, exc: BaseException) -> SearchClientError:
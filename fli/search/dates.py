@@ -5,19 +5,32 @@ It uses Google Flights' calendar view API to find the best prices for each date.
 It is intended to be used for finding the cheapest dates to fly, not the cheapest flights.
 """
 
+import json
 import logging
+import sys
+import time
+import warnings
+from array import array
+from collections.abc import Callable, Iterable, Iterator
 from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from typing import Any
 
 from pydantic import BaseModel
 
 from fli.core import extract_currency_from_price_token
 from fli.models import DateSearchFilters
 from fli.models.google_flights.base import TripType
-from fli.search._concurrency import parallel_map
+from fli.search._calendar_store import CalendarPriceStore
+from fli.search._chunk_planner import MAX_DAYS_PER_CHUNK, plan_chunks
+from fli.search._concurrency import CancellationToken, parallel_imap, parallel_map
+from fli.search._metrics import record_decode
+from fli.search._progress import SearchProgress, _ProgressTracker, progress_tracker
+from fli.search._search_cache import CacheStatus, SearchResultCache
 from fli.search._urls import with_locale_params
 from fli.search._wire import parse_first_wrb_payload
 from fli.search.client import get_client
+from fli.search.exceptions import SubRequestFailure
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +43,231 @@ class DatePrice(BaseModel):
     currency: str | None = None
 
 
+# A stored calendar cell: (price, return-day ordinal or None, currency).
+_Cell = tuple[float, int | None, str | None]
+
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Freshness of the private store behind the deprecated ``reuse_cells=True``.
+_REUSE_CELLS_TTL = 15 * 60
+
+
+class DatePriceArray:
+    """Column-oriented calendar prices, decoded in one pass.
+
+    Holds departure / return days as proleptic Gregorian ordinals
+    (:meth:`datetime.date.toordinal`) and prices as C doubles in
+    :class:`array.array` columns, so a 305-day sweep is three compact
+    buffers instead of hundreds of Pydantic models. :class:`DatePrice`
+    objects are only built when indexed or iterated; :meth:`to_numpy`
+    hands the columns to NumPy when it is installed.
+    """
+
+    __slots__ = ("departures", "returns", "prices", "currencies")
+
+    def __init__(
+        self,
+        departures: array,
+        prices: array,
+        currencies: list[str | None],
+        returns: array | None = None,
+    ):
+        """Wrap pre-built columns (all the same length; ``returns`` only for round trips)."""
+        self.departures = departures
+        self.returns = returns
+        self.prices = prices
+        self.currencies = currencies
+
+    @classmethod
+    def empty(cls, round_trip: bool = False) -> "DatePriceArray":
+        """Return an array with no cells."""
+        return cls(array("i"), array("d"), [], array("i") if round_trip else None)
+
+    @classmethod
+    def _from_cells(cls, cells: Iterable[tuple[date, _Cell]], round_trip: bool) -> "DatePriceArray":
+        out = cls.empty(round_trip)
+        for day, (price, return_ordinal, currency) in cells:
+            if out.returns is not None:
+                # Decoding skips round-trip rows without a return day, so a
+                # cell lacking one was stored for a one-way search.
+                if return_ordinal is None:
+                    raise ValueError(f"Round-trip cell for {day} has no return date")
+                out.returns.append(return_ordinal)
+            out.departures.append(day.toordinal())
+            out.prices.append(price)
+            out.currencies.append(currency)
+        return out
+
+    @property
+    def round_trip(self) -> bool:
+        """Whether cells carry a return day."""
+        return self.returns is not None
+
+    def __sizeof__(self) -> int:
+        """Return the size of the columns too, for memory-bounded caches."""
+        size = object.__sizeof__(self) + sys.getsizeof(self.departures)
+        size += sys.getsizeof(self.prices) + sys.getsizeof(self.currencies)
+        if self.returns is not None:
+            size += sys.getsizeof(self.returns)
+        return size
+
+    def __len__(self) -> int:
+        """Return the number of priced cells."""
+        return len(self.prices)
+
+    def __getitem__(self, index: int) -> DatePrice:
+        """Build the :class:`DatePrice` for cell ``index``."""
+        departure = datetime.fromordinal(self.departures[index])
+        dates: tuple[datetime] | tuple[datetime, datetime] = (
+            (departure, datetime.fromordinal(self.returns[index]))
+            if self.returns is not None
+            else (departure,)
+        )
+        return DatePrice.model_construct(
+            date=dates, price=self.prices[index], currency=self.currencies[index]
+        )
+
+    def __iter__(self) -> Iterator[DatePrice]:
+        """Yield a :class:`DatePrice` per cell, building each on demand."""
+        return (self[i] for i in range(len(self)))
+
+    def to_date_prices(self) -> list[DatePrice]:
+        """Materialise every cell as a :class:`DatePrice`."""
+        return list(self)
+
+    def departure_dates(self) -> list[date]:
+        """Return the departure day of every cell."""
+        return [date.fromordinal(d) for d in self.departures]
+
+    def cheapest(self, k: int = 1) -> list[DatePrice]:
+        """Return the ``k`` cheapest cells, cheapest first, building only those."""
+        order = sorted(range(len(self)), key=self.prices.__getitem__)[:k]
+        return [self[i] for i in order]
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return the columns as NumPy arrays.
+
+        Returns:
+            ``{"departure": datetime64[D], "price": float64}``, plus
+            ``"return": datetime64[D]`` for round trips.
+
+        Raises:
+            ImportError: When NumPy isn't installed.
+
+        """
+        try:
+            import numpy as np
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "DatePriceArray.to_numpy requires NumPy. Install with:\n  pip install numpy"
+            ) from e
+
+        def days(column: array) -> Any:
+            return (np.asarray(column, dtype=np.int64) - _UNIX_EPOCH_ORDINAL).astype(
+                "datetime64[D]"
+            )
+
+        out = {"departure": days(self.departures), "price": np.asarray(self.prices)}
+        if self.returns is not None:
+            out["return"] = days(self.returns)
+        return out
+
+    def _cells(self) -> Iterator[tuple[date, _Cell]]:
+        returns = self.returns
+        for i, departure in enumerate(self.departures):
+            yield (
+                date.fromordinal(departure),
+                (
+                    self.prices[i],
+                    returns[i] if returns is not None else None,
+                    self.currencies[i],
+                ),
+            )
+
+
+def _parse_price(item: list[list] | list | None) -> float | None:
+    """Parse price data from a calendar row.
+
+    Args:
+        item: Raw date data from the API response
+
+    Returns:
+        Float price value if valid, None if invalid or missing
+
+    """
+    try:
+        if item and isinstance(item, list) and len(item) > 2:
+            if isinstance(item[2], list) and len(item[2]) > 0:
+                if isinstance(item[2][0], list) and len(item[2][0]) > 1:
+                    return float(item[2][0][1])
+    except (IndexError, TypeError, ValueError):
+        pass
+
+    return None
+
+
+def _parse_currency(item: list[list] | list | None) -> str | None:
+    """Parse the returned currency code from a calendar row."""
+    try:
+        if item and isinstance(item, list) and len(item) > 2:
+            if isinstance(item[2], list) and len(item[2]) > 1:
+                return extract_currency_from_price_token(item[2][1])
+    except (IndexError, TypeError, ValueError):
+        pass
+
+    return None
+
+
+def _decode_calendar_response(body: str, round_trip: bool) -> DatePriceArray | None:
+    """Decode a ``GetCalendarGraph`` response body; None when it has no calendar payload."""
+    data = parse_first_wrb_payload(body)
+    if data is None:
+        return None
+
+    try:
+        items = data[-1]
+    except (IndexError, TypeError):
+        logger.warning("Date search response shape unexpected: no terminal array")
+        return None
+
+    if not isinstance(items, list):
+        return None
+
+    return _decode_calendar(items, round_trip=round_trip)
+
+
+def _decode_calendar(items: list, round_trip: bool) -> DatePriceArray:
+    """Decode ``GetCalendarGraph`` rows into a :class:`DatePriceArray` in one pass.
+
+    Each row is ``[departure, return | None, [[_, price], price_token]]``.
+    Every row is parsed once; rows without a (non-zero) price, or with
+    unparseable dates, are skipped.
+    """
+    out = DatePriceArray.empty(round_trip)
+    departures, returns, prices, currencies = (
+        out.departures,
+        out.returns,
+        out.prices,
+        out.currencies,
+    )
+    from_iso = date.fromisoformat
+    for item in items:
+        price = _parse_price(item)
+        if not price:
+            continue
+        try:
+            departure = from_iso(item[0]).toordinal()
+            return_day = from_iso(item[1]).toordinal() if round_trip else 0
+        except (IndexError, TypeError, ValueError):
+            continue
+        departures.append(departure)
+        prices.append(price)
+        currencies.append(_parse_currency(item))
+        if returns is not None:
+            returns.append(return_day)
+    return out
+
+
 class SearchDates:
     """Date-based flight search implementation.
 
@@ -41,11 +279,55 @@ class SearchDates:
     DEFAULT_HEADERS = {
         "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
     }
-    MAX_DAYS_PER_SEARCH = 61
+    MAX_DAYS_PER_SEARCH = MAX_DAYS_PER_CHUNK
+    # Row parsers, kept on the class for callers that parse raw rows.
+    __parse_price = staticmethod(_parse_price)
+    __parse_currency = staticmethod(_parse_currency)
+
+    # Furthest departure Google will price, in days from today.
+    SEARCH_HORIZON_DAYS = 305
+
+    def __init__(
+        self,
+        store: CalendarPriceStore | None = None,
+        cache: SearchResultCache | None = None,
+        *,
+        reuse_cells: bool = False,
+    ):
+        """Initialize the search client for date-based searches.
+
+        Args:
+            store: Optional per-day price store, shareable across instances.
+                With a store, :meth:`search` only requests the days that are
+                missing or stale in it, and pads chunks onto a global grid
+                so neighbouring queries fill each other's cells.
+            cache: Optional whole-result cache, shareable across instances.
+                With a cache, :meth:`search` serves fresh results from it,
+                serves stale ones while re-running the search in the
+                background, and stores every complete result it fetches.
+            reuse_cells: Deprecated; pass ``store=CalendarPriceStore()``
+                instead. Without a ``store``, it gives this instance a
+                private store whose days stay fresh for 15 minutes.
 
-    def __init__(self):
-        """Initialize the search client for date-based searches."""
+        """
+        if reuse_cells:
+            warnings.warn(
+                "SearchDates(reuse_cells=True) is deprecated; pass "
+                "store=CalendarPriceStore() instead, which can be shared across instances.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            if store is None:
+                store = CalendarPriceStore(lambda lead_days: _REUSE_CELLS_TTL)
         self.client = get_client()
+        self.store = store
+        self.cache = cache
+        # Chunks that failed during the most recent ``partial=True``
+        # :meth:`search` call. Empty after a fully successful search.
+        self.last_failures: list[SubRequestFailure] = []
+        # How the most recent :meth:`search` result was obtained; None until
+        # a search on an instance with a :attr:`cache` returns.
+        self.last_cache_status: CacheStatus | None = None
 
     def search(
         self,
@@ -53,6 +335,9 @@ class SearchDates:
         currency: str | None = None,
         language: str | None = None,
         country: str | None = None,
+        partial: bool = False,
+        cancel_token: CancellationToken | None = None,
+        on_progress: Callable[[SearchProgress], None] | None = None,
     ) -> list[DatePrice] | None:
         """Search for flight prices across a date range and search parameters.
 
@@ -61,47 +346,282 @@ class SearchDates:
             currency: Optional ISO 4217 currency code (e.g. ``"EUR"``) to bill prices in.
             language: Optional BCP-47 language code passed via the ``hl`` URL param.
             country: Optional ISO 3166-1 alpha-2 country code passed via the ``gl`` URL param.
+            partial: Keep the prices from successful chunks when some chunk
+                requests fail, instead of raising. Failed chunks are listed in
+                :attr:`last_failures`.
+            cancel_token: Abandon the search from another thread; pending
+                chunk requests are dropped.
+            on_progress: Called with a :class:`SearchProgress` as each chunk
+                request completes, carrying that chunk's prices as a
+                :class:`DatePriceArray`. May be called from worker threads.
 
         Returns:
             List of DatePrice objects containing date and price pairs, or None if no results
 
         Raises:
-            Exception: If the search fails or returns invalid data
+            Exception: If the search fails or returns invalid data (with
+                ``partial=True``, only when a single-chunk range fails)
+            SearchCancelledError: ``cancel_token`` was cancelled before the
+                search finished.
 
         Notes:
-            - For date ranges larger than 61 days, splits into multiple searches.
+            - Ranges larger than 61 days are split into the fewest chunks of
+              near-equal length (see :mod:`fli.search._chunk_planner`).
+            - With a :attr:`store`, only days missing or stale in it are
+              requested; fetched days (priced or not) are written back.
             - We can't search more than 305 days in the future.
 
         """
-        from_date = datetime.strptime(filters.from_date, "%Y-%m-%d")
-        to_date = datetime.strptime(filters.to_date, "%Y-%m-%d")
-        date_range = (to_date - from_date).days + 1
+        prices = self.search_array(
+            filters,
+            currency=currency,
+            language=language,
+            country=country,
+            partial=partial,
+            cancel_token=cancel_token,
+            on_progress=on_progress,
+        )
+        return prices.to_date_prices() or None
 
-        if date_range <= self.MAX_DAYS_PER_SEARCH:
-            return self._search_chunk(
-                filters, currency=currency, language=language, country=country
+    def search_array(
+        self,
+        filters: DateSearchFilters,
+        currency: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+        partial: bool = False,
+        cancel_token: CancellationToken | None = None,
+        on_progress: Callable[[SearchProgress], None] | None = None,
+    ) -> DatePriceArray:
+        """Search a date range and return the prices as a :class:`DatePriceArray`.
+
+        Same as :meth:`search`, but no :class:`DatePrice` objects are built
+        unless the caller asks for them; prefer it for long sweeps.
+
+        Args:
+            filters: Search parameters including date range, airports, and preferences
+            currency: Optional ISO 4217 currency code (e.g. ``"EUR"``) to bill prices in.
+            language: Optional BCP-47 language code passed via the ``hl`` URL param.
+            country: Optional ISO 3166-1 alpha-2 country code passed via the ``gl`` URL param.
+            partial: Keep the prices from successful chunks when some chunk
+                requests fail, instead of raising. Failed chunks are listed in
+                :attr:`last_failures`.
+            cancel_token: Abandon the search from another thread; pending
+                chunk requests are dropped.
+            on_progress: Same as :meth:`search`.
+
+        Returns:
+            Priced cells in departure order (empty if Google returned none).
+
+        Raises:
+            Exception: If the search fails or returns invalid data (with
+                ``partial=True``, only when a single-chunk range fails)
+            SearchCancelledError: ``cancel_token`` was cancelled before the
+                search finished.
+
+        Notes:
+            - Ranges larger than 61 days are split into the fewest chunks of
+              near-equal length (see :mod:`fli.search._chunk_planner`).
+            - With a :attr:`store`, only days missing or stale in it are
+              requested; fetched days (priced or not) are written back.
+            - With a :attr:`cache`, a cached result is returned without
+              calling ``on_progress`` (see :attr:`last_cache_status`); it is
+              shared with other callers and must not be modified.
+            - We can't search more than 305 days in the future.
+
+        """
+        failures: list[SubRequestFailure] | None = [] if partial else None
+        self.last_failures = []
+        self.last_cache_status = None
+        cache = self.cache
+        if cache is not None:
+            key = ("SearchDates", filters.model_dump_json(), currency, language, country)
+            entry, status = cache.serve(
+                key,
+                lambda: self._search_array(
+                    filters, currency=currency, language=language, country=country
+                ),
             )
+            if entry is not None:
+                self.last_cache_status = status
+                return entry.value
+        prices = self._search_array(
+            filters,
+            currency=currency,
+            language=language,
+            country=country,
+            failures=failures,
+            cancel_token=cancel_token,
+            progress=progress_tracker(on_progress),
+        )
+        self.last_failures = failures or []
+        if cache is not None:
+            if not self.last_failures:
+                cache.put(key, prices)
+            self.last_cache_status = CacheStatus.miss()
+        return prices
+
+    def _search_array(
+        self,
+        filters: DateSearchFilters,
+        *,
+        currency: str | None,
+        language: str | None,
+        country: str | None,
+        failures: list[SubRequestFailure] | None = None,
+        cancel_token: CancellationToken | None = None,
+        progress: _ProgressTracker | None = None,
+    ) -> DatePriceArray:
+        """Body of :meth:`search_array`, also run by background cache refreshes.
+
+        ``failures`` switches a multi-chunk search into partial mode: failed
+        chunk requests are appended to it instead of being raised. It never
+        touches instance state, so it is safe to run on another thread.
+        """
+        from_day = filters.parsed_from_date.date()
+        to_day = filters.parsed_to_date.date()
+
+        store = self.store
+        stay_days = self._stay_days(filters)
+        round_trip = filters.trip_type != TripType.ONE_WAY
+        known: dict[date, _Cell | None] = {}
+        pad_bounds = None
+        if store is not None:
+            scope = self._cell_scope(filters, currency, language, country)
+            known = store.fresh(scope, from_day, to_day, stay_days)
+            pad_bounds = self._pad_bounds(filters)
+        plan = plan_chunks(from_day, to_day, known=known, pad_bounds=pad_bounds)
+        if progress is not None:
+            progress.plan(len(plan))
+
+        def fetch(chunk_filters: DateSearchFilters) -> DatePriceArray | None:
+            label = f"{chunk_filters.from_date}..{chunk_filters.to_date}"
+            try:
+                result = self._search_chunk_array(
+                    chunk_filters,
+                    currency=currency,
+                    language=language,
+                    country=country,
+                    cancel_token=cancel_token,
+                )
+            except Exception:
+                if progress is not None:
+                    progress.step("chunk", f"{label} (failed)")
+                raise
+            if progress is not None:
+                progress.step("chunk", label, result or DatePriceArray.empty(round_trip))
+            return result
+
+        if store is None and len(plan) == 1:
+            single = fetch(filters)
+            return single if single is not None else DatePriceArray.empty(round_trip)
 
         # Build every chunk descriptor up front so the per-chunk requests
-        # share no mutable state. This both enables parallel execution and
-        # fixes a latent bug in the previous sequential version: each chunk
-        # rewrote ``filters.flight_segments[*].travel_date`` in place, so
-        # the second-and-later chunks had segment dates that no longer
-        # matched ``current_from``.
-        chunk_filters = self._build_chunk_filters(filters, from_date, to_date)
+        # share no mutable state and can run in parallel.
+        chunk_filters = self._chunk_filters_for(filters, from_day, plan)
 
         chunk_results = parallel_map(
-            lambda cf: self._search_chunk(
-                cf, currency=currency, language=language, country=country
-            ),
+            fetch,
             chunk_filters,
+            return_exceptions=failures is not None and len(plan) > 1,
+            cancel_token=cancel_token,
         )
 
-        all_results: list[DatePrice] = []
-        for r in chunk_results:
-            if r:
-                all_results.extend(r)
-        return all_results if all_results else None
+        cells: dict[date, _Cell | None] = dict(known)
+        for (first, last), cf, r in zip(plan, chunk_filters, chunk_results, strict=True):
+            if isinstance(r, Exception):
+                failures.append(
+                    SubRequestFailure(
+                        kind="chunk", description=f"{cf.from_date}..{cf.to_date}", error=r
+                    )
+                )
+                continue
+            # Every day of a fetched chunk gets a cell; unpriced days are None.
+            chunk: dict[date, _Cell | None] = {
+                first + timedelta(days=i): None for i in range((last - first).days + 1)
+            }
+            if r is not None:
+                chunk.update(r._cells())
+            cells.update(chunk)
+            if store is not None:
+                store.put(scope, chunk.items(), stay_days)
+
+        in_range = (
+            (day, cell)
+            for day, cell in sorted(cells.items())
+            if cell is not None and from_day <= day <= to_day
+        )
+        return DatePriceArray._from_cells(in_range, round_trip)
+
+    def search_durations(
+        self,
+        filters: DateSearchFilters,
+        durations: Iterable[int],
+        currency: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+    ) -> dict[datetime, dict[int, DatePrice]]:
+        """Sweep a range of round-trip durations in one parallel batch.
+
+        Every (duration × date chunk) ``GetCalendarGraph`` request is fed
+        through a single :func:`parallel_imap` stream, so the whole sweep
+        shares one rate-limit budget, requests are built only as slots free
+        up, and each response is folded into the matrix as soon as it lands.
+
+        Args:
+            filters: Round-trip search parameters. ``duration`` and the return
+                segment's date are overridden per swept duration.
+            durations: Trip lengths in days, e.g. ``range(3, 11)``.
+            currency: Optional ISO 4217 currency code (e.g. ``"EUR"``) to bill prices in.
+            language: Optional BCP-47 language code passed via the ``hl`` URL param.
+            country: Optional ISO 3166-1 alpha-2 country code passed via the ``gl`` URL param.
+
+        Returns:
+            A depart-date × duration matrix: ``{depart_date: {duration: DatePrice}}``,
+            ordered by departure date. Cells Google returned no price for are absent.
+
+        Raises:
+            ValueError: ``filters`` is not a round trip, or a duration is not positive.
+
+        """
+        if filters.trip_type != TripType.ROUND_TRIP:
+            raise ValueError("Duration sweeps require round-trip filters")
+        swept = sorted(set(durations))
+        if not swept or swept[0] <= 0:
+            raise ValueError("durations must be a non-empty collection of positive integers")
+
+        from_date = datetime.strptime(filters.from_date, "%Y-%m-%d")
+        to_date = datetime.strptime(filters.to_date, "%Y-%m-%d")
+        requests = (
+            (duration, chunk)
+            for duration in swept
+            for chunk in self._build_chunk_filters(
+                self._with_duration(filters, duration), from_date, to_date
+            )
+        )
+
+        responses = parallel_imap(
+            lambda req: (
+                req[0],
+                self._search_chunk(req[1], currency=currency, language=language, country=country),
+            ),
+            requests,
+        )
+
+        matrix: dict[datetime, dict[int, DatePrice]] = {}
+        for duration, prices in responses:
+            for date_price in prices or ():
+                matrix.setdefault(date_price.date[0], {})[duration] = date_price
+        return dict(sorted(matrix.items()))
+
+    @staticmethod
+    def _with_duration(filters: DateSearchFilters, duration: int) -> DateSearchFilters:
+        """Copy round-trip ``filters`` with ``duration`` and the return date adjusted."""
+        segments = deepcopy(filters.flight_segments)
+        segments[1].travel_date = (
+            segments[0].parsed_travel_date + timedelta(days=duration)
+        ).strftime("%Y-%m-%d")
+        return filters.model_copy(update={"flight_segments": segments, "duration": duration})
 
     def _build_chunk_filters(
         self,
@@ -111,50 +631,83 @@ class SearchDates:
     ) -> list[DateSearchFilters]:
         """Split ``filters``' date range into independent per-chunk filter copies.
 
+        Uses a cold-start plan: the fewest chunks of near-equal length.
+        """
+        plan = plan_chunks(from_date.date(), to_date.date(), max_days=self.MAX_DAYS_PER_SEARCH)
+        return self._chunk_filters_for(filters, from_date.date(), plan)
+
+    @staticmethod
+    def _chunk_filters_for(
+        filters: DateSearchFilters,
+        from_day: date,
+        plan: list[tuple[date, date]],
+    ) -> list[DateSearchFilters]:
+        """Build one filter copy per planned ``(first, last)`` chunk.
+
         The flight segments are deep-copied per chunk and their
-        ``travel_date`` advanced by the chunk offset so each chunk
-        represents a distinct, self-contained search.
+        ``travel_date`` moved by the chunk's offset from ``from_day`` so each
+        chunk represents a distinct, self-contained search. Every other
+        filter field is carried over unchanged.
         """
         chunks: list[DateSearchFilters] = []
-        current_from = from_date
-        chunk_index = 0
-        while current_from <= to_date:
-            current_to = min(current_from + timedelta(days=self.MAX_DAYS_PER_SEARCH - 1), to_date)
+        for first, last in plan:
+            shift = first - from_day
             segments = deepcopy(filters.flight_segments)
-            if chunk_index > 0:
-                shift = self.MAX_DAYS_PER_SEARCH * chunk_index
+            if shift:
                 for segment in segments:
-                    segment.travel_date = (
-                        datetime.strptime(segment.travel_date, "%Y-%m-%d") + timedelta(days=shift)
-                    ).strftime("%Y-%m-%d")
+                    segment.travel_date = (segment.parsed_travel_date + shift).strftime("%Y-%m-%d")
             chunks.append(
-                DateSearchFilters(
-                    trip_type=filters.trip_type,
-                    passenger_info=filters.passenger_info,
-                    flight_segments=segments,
-                    stops=filters.stops,
-                    seat_type=filters.seat_type,
-                    price_limit=filters.price_limit,
-                    airlines=filters.airlines,
-                    max_duration=filters.max_duration,
-                    layover_restrictions=filters.layover_restrictions,
-                    emissions=filters.emissions,
-                    bags=filters.bags,
-                    from_date=current_from.strftime("%Y-%m-%d"),
-                    to_date=current_to.strftime("%Y-%m-%d"),
-                    duration=filters.duration,
+                filters.model_copy(
+                    update={
+                        "flight_segments": segments,
+                        "from_date": first.strftime("%Y-%m-%d"),
+                        "to_date": last.strftime("%Y-%m-%d"),
+                    }
                 )
             )
-            current_from = current_to + timedelta(days=1)
-            chunk_index += 1
         return chunks
 
+    # ------------------------------------------------------------------
+    # Calendar store keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cell_scope(
+        filters: DateSearchFilters,
+        currency: str | None,
+        language: str | None,
+        country: str | None,
+    ) -> str:
+        """Fingerprint the route, filters and locale of ``filters`` for the store.
+
+        The date range and segment travel dates are left out (chunks shift
+        them), and so is ``duration``: a round-trip cell is keyed by its
+        return day instead, so every stay length shares one scope.
+        """
+        fields = filters.model_dump(mode="json", exclude={"from_date", "to_date", "duration"})
+        for segment in fields["flight_segments"]:
+            segment.pop("travel_date", None)
+        locale = [(currency or "").upper(), language or "", (country or "").upper()]
+        return json.dumps([fields, locale], sort_keys=True, default=str)
+
+    @staticmethod
+    def _stay_days(filters: DateSearchFilters) -> int | None:
+        """Return the round-trip length keyed into store cells, or None for one-way."""
+        return filters.duration if filters.trip_type == TripType.ROUND_TRIP else None
+
+    def _pad_bounds(self, filters: DateSearchFilters) -> tuple[date, date]:
+        """Days a padded chunk may reach: today through the pricing horizon."""
+        today = datetime.now().date()
+        horizon = self.SEARCH_HORIZON_DAYS - (filters.duration or 0)
+        return today, today + timedelta(days=max(horizon, 0))
+
     def _search_chunk(
         self,
         filters: DateSearchFilters,
         currency: str | None = None,
         language: str | None = None,
         country: str | None = None,
+        cancel_token: CancellationToken | None = None,
     ) -> list[DatePrice] | None:
         """Search for flight prices for a single date range chunk.
 
@@ -163,6 +716,7 @@ class SearchDates:
             currency: Optional ISO 4217 currency code passed via the ``curr`` URL param.
             language: Optional BCP-47 language code passed via the ``hl`` URL param.
             country: Optional ISO 3166-1 alpha-2 country code passed via the ``gl`` URL param.
+            cancel_token: Optional token that aborts the rate-limit wait.
 
         Returns:
             List of DatePrice objects containing date and price pairs, or None if no results
@@ -170,6 +724,27 @@ class SearchDates:
         Raises:
             Exception: If the search fails or returns invalid data
 
+        """
+        prices = self._search_chunk_array(
+            filters,
+            currency=currency,
+            language=language,
+            country=country,
+            cancel_token=cancel_token,
+        )
+        return None if prices is None else prices.to_date_prices()
+
+    def _search_chunk_array(
+        self,
+        filters: DateSearchFilters,
+        currency: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+        cancel_token: CancellationToken | None = None,
+    ) -> DatePriceArray | None:
+        """Fetch one chunk and decode it straight into a :class:`DatePriceArray`.
+
+        Returns None when the response carries no calendar payload.
         """
         encoded_filters = filters.encode()
         url = with_locale_params(self.BASE_URL, currency, language, country)
@@ -179,84 +754,17 @@ class SearchDates:
             data=f"f.req={encoded_filters}",
             impersonate="chrome",
             allow_redirects=True,
+            cancel_token=cancel_token,
         )
         response.raise_for_status()
 
-        data = parse_first_wrb_payload(response.text)
-        if data is None:
-            return None
-
+        started = time.perf_counter()
         try:
-            items = data[-1]
-        except (IndexError, TypeError):
-            logger.warning("Date search response shape unexpected: no terminal array")
-            return None
-
-        if not isinstance(items, list):
-            return None
-
-        dates_data = [
-            DatePrice(
-                date=self.__parse_date(item, filters.trip_type),
-                price=self.__parse_price(item),
-                currency=self.__parse_currency(item),
+            decoded = _decode_calendar_response(
+                response.text, round_trip=filters.trip_type != TripType.ONE_WAY
             )
-            for item in items
-            if self.__parse_price(item)
-        ]
-        return dates_data
-
-    @staticmethod
-    def __parse_date(
-        item: list[list] | list | None, trip_type: TripType
-    ) -> tuple[datetime] | tuple[datetime, datetime]:
-        """Parse date data from the API response.
-
-        Args:
-            item: Raw date data from the API response
-            trip_type: Trip type (one-way or round-trip)
-
-        Returns:
-            Tuple of datetime objects
-
-        """
-        if trip_type == TripType.ONE_WAY:
-            return (datetime.strptime(item[0], "%Y-%m-%d"),)
-        else:
-            return (
-                datetime.strptime(item[0], "%Y-%m-%d"),
-                datetime.strptime(item[1], "%Y-%m-%d"),
-            )
-
-    @staticmethod
-    def __parse_price(item: list[list] | list | None) -> float | None:
-        """Parse price data from the API response.
-
-        Args:
-            item: Raw price data from the API response
-
-        Returns:
-            Float price value if valid, None if invalid or missing
-
-        """
-        try:
-            if item and isinstance(item, list) and len(item) > 2:
-                if isinstance(item[2], list) and len(item[2]) > 0:
-                    if isinstance(item[2][0], list) and len(item[2][0]) > 1:
-                        return float(item[2][0][1])
-        except (IndexError, TypeError, ValueError):
-            pass
-
-        return None
-
-    @staticmethod
-    def __parse_currency(item: list[list] | list | None) -> str | None:
-        """Parse the returned currency code from the API response."""
-        try:
-            if item and isinstance(item, list) and len(item) > 2:
-                if isinstance(item[2], list) and len(item[2]) > 1:
-                    return extract_currency_from_price_token(item[2][1])
-        except (IndexError, TypeError, ValueError):
-            pass
-
-        return None
+        except Exception:
+            record_decode("decode_calendar_response", time.perf_counter() - started, failed=True)
+            raise
+        record_decode("decode_calendar_response", time.perf_counter() - started)
+        return decoded
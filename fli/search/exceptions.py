@@ -8,6 +8,8 @@ exception is kept as ``__cause__`` for logging.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 
 class SearchClientError(Exception):
     """Base class for errors talking to the Google Flights backend."""
@@ -28,3 +30,37 @@ class SearchHTTPError(SearchClientError):
         """Store the HTTP status alongside the message for richer logging."""
         super().__init__(message)
         self.status_code = status_code
+
+
+class SearchCancelledError(Exception):
+    """The search was abandoned through its :class:`CancellationToken`.
+
+    Deliberately *not* a :class:`SearchClientError`: nothing went wrong
+    talking to Google, the caller simply stopped wanting the answer.
+    """
+
+
+class SearchQuotaError(Exception):
+    """The caller's :class:`~fli.search.RequestBudget` stayed exhausted too long.
+
+    Like :class:`SearchCancelledError`, this is not a
+    :class:`SearchClientError` and is never retried: no request was sent,
+    the caller had used up its share of the request budget.
+    """
+
+
+@dataclass
+class SubRequestFailure:
+    """One failed sub-request of a search run with ``partial=True``.
+
+    Partial searches keep every successful sub-result and report each
+    failed sub-request here instead of raising. ``kind`` is
+    ``"expansion"`` for a round-trip / multi-city follow-up search and
+    ``"chunk"`` for one date-range chunk of a calendar search;
+    ``description`` identifies which one (an outbound itinerary or a date
+    range) in a form suitable for logs.
+    """
+
+    kind: str
+    description: str
+    error: Exception
@@ -0,0 +1,305 @@
+"""One-origin, many-destination calendar exploration.
+
+"Where can I fly cheaply from JFK in March?" means pricing every day of a
+window for dozens or hundreds of destinations. Calling
+:meth:`SearchDates.search` once per destination works, but each call is
+sequential with respect to the others, re-validates its filters and
+re-plans its chunks, and the per-destination fan-out never fills the
+shared request budget.
+
+:class:`SearchExplore` validates the template filters once and builds each
+destination's chunk filters by copying it. It then feeds every
+destination × chunk ``GetCalendarGraph`` request through a single
+:func:`parallel_imap` stream, so all of them share one rate limiter and
+one bounded in-flight window. Requests are issued destination by
+destination, so each destination's prices are yielded as soon as its
+last chunk lands (:meth:`SearchExplore.stream`). :meth:`SearchExplore.search`
+collects the stream into a table ranked by cheapest fare.
+
+A destination whose request fails is reported with its ``error`` set
+rather than failing the whole exploration. Cancellation still aborts
+everything.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator, Iterable
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import date
+
+from fli.models import Airport, DateSearchFilters
+from fli.models.google_flights.base import TripType
+from fli.search._chunk_planner import plan_chunks
+from fli.search._concurrency import CancellationToken, parallel_imap
+from fli.search.dates import DatePrice, DatePriceArray, SearchDates, _Cell
+from fli.search.exceptions import SearchCancelledError
+
+
+@dataclass
+class DestinationFares:
+    """Calendar prices for one destination of an exploration."""
+
+    destination: Airport
+    prices: DatePriceArray
+    error: BaseException | None = None
+
+    @property
+    def cheapest(self) -> DatePrice | None:
+        """Cheapest priced day (or date pair), or None if nothing was priced."""
+        best = self.prices.cheapest(1)
+        return best[0] if best else None
+
+    @property
+    def cheapest_price(self) -> float | None:
+        """Price of :attr:`cheapest`, without building a :class:`DatePrice`."""
+        return min(self.prices.prices) if len(self.prices) else None
+
+
+@dataclass
+class ExploreResult:
+    """Every destination's calendar from one :meth:`SearchExplore.search` call."""
+
+    origin: list[Airport]
+    fares: dict[Airport, DestinationFares] = field(default_factory=dict)
+    requests: int = 0
+
+    def ranked(self) -> list[DestinationFares]:
+        """Return destinations cheapest first; unpriced or failed ones last."""
+        return sorted(self.fares.values(), key=_rank_key)
+
+    def table(self, k: int = 1) -> list[tuple[Airport, DatePrice]]:
+        """Return the ``k`` cheapest dates of each destination, in ranked order."""
+        return [
+            (fares.destination, dp) for fares in self.ranked() for dp in fares.prices.cheapest(k)
+        ]
+
+
+class SearchExplore:
+    """Price one date window from one origin to many destinations.
+
+    Example:
+    -------
+    >>> result = SearchExplore().search(march_filters, [Airport.LAX, Airport.MIA, Airport.DEN])
+    >>> for destination, cheapest in result.table():
+    ...     print(destination.name, cheapest.date[0], cheapest.price)
+
+    """
+
+    def __init__(self, dates: SearchDates | None = None):
+        """Wrap a :class:`SearchDates` instance (a fresh one by default).
+
+        Its client, and its :attr:`~SearchDates.store` when set, are used
+        for every request.
+        """
+        self.dates = dates or SearchDates()
+        # ``GetCalendarGraph`` requests issued by the most recent exploration.
+        self.last_requests = 0
+
+    def search(
+        self,
+        filters: DateSearchFilters,
+        destinations: Iterable[Airport],
+        *,
+        currency: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+        max_in_flight: int | None = None,
+        cancel_token: CancellationToken | None = None,
+        on_result: Callable[[DestinationFares], None] | None = None,
+    ) -> ExploreResult:
+        """Explore every destination and return them ranked by cheapest fare.
+
+        Args:
+            filters: Template date filters. The first segment's departure
+                airport(s) are the origin; its arrival airport is replaced by
+                each destination (and, for round trips, the return segment is
+                mirrored). Every other filter applies to all destinations.
+            destinations: Airports to price. Duplicates are ignored.
+            currency: Optional ISO 4217 currency code applied to every request.
+            language: Optional BCP-47 language code applied to every request.
+            country: Optional ISO 3166-1 alpha-2 country code applied to every request.
+            max_in_flight: Requests kept in flight at once. Defaults to the
+                shared executor's worker cap.
+            cancel_token: Abandon the exploration from another thread.
+            on_result: Called with each destination as soon as it completes.
+
+        Returns:
+            An :class:`ExploreResult`; see :meth:`ExploreResult.ranked`.
+
+        Raises:
+            ValueError: ``filters`` does not have one segment (one-way) or
+                two (round trip), or ``destinations`` is empty.
+            SearchCancelledError: ``cancel_token`` was cancelled.
+
+        """
+        stream = self.stream(
+            filters,
+            destinations,
+            currency=currency,
+            language=language,
+            country=country,
+            max_in_flight=max_in_flight,
+            cancel_token=cancel_token,
+        )
+        result = ExploreResult(origin=[a for a, _ in filters.flight_segments[0].departure_airport])
+        try:
+            for fares in stream:
+                result.fares[fares.destination] = fares
+                if on_result is not None:
+                    on_result(fares)
+        finally:
+            stream.close()
+        result.requests = self.last_requests
+        return result
+
+    def stream(
+        self,
+        filters: DateSearchFilters,
+        destinations: Iterable[Airport],
+        *,
+        currency: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+        max_in_flight: int | None = None,
+        cancel_token: CancellationToken | None = None,
+    ) -> Generator[DestinationFares, None, None]:
+        """Yield each destination's :class:`DestinationFares` as soon as it completes.
+
+        Takes the same arguments as :meth:`search` except ``on_result``. Closing the generator
+        early drops every request that has not started.
+        """
+        targets = list(dict.fromkeys(destinations))
+        if not targets:
+            raise ValueError("destinations must not be empty")
+        if filters.trip_type == TripType.ROUND_TRIP:
+            if len(filters.flight_segments) != 2:
+                raise ValueError("Round-trip exploration requires exactly two segments")
+        elif len(filters.flight_segments) != 1:
+            raise ValueError("One-way exploration requires a single segment")
+
+        dates = self.dates
+        store = dates.store
+        from_day = filters.parsed_from_date.date()
+        to_day = filters.parsed_to_date.date()
+        round_trip = filters.trip_type != TripType.ONE_WAY
+        stay_days = dates._stay_days(filters)
+        pad_bounds = dates._pad_bounds(filters) if store is not None else None
+        # Without a store every destination shares the same plan.
+        shared_plan = plan_chunks(from_day, to_day) if store is None else None
+        pending: dict[Airport, _Pending] = {}
+        self.last_requests = 0
+
+        def jobs() -> Generator[_Job, None, None]:
+            for destination in targets:
+                dest_filters = _for_destination(filters, destination)
+                state = _Pending()
+                if store is not None:
+                    state.scope = dates._cell_scope(dest_filters, currency, language, country)
+                    state.cells = dict(store.fresh(state.scope, from_day, to_day, stay_days))
+                    plan = plan_chunks(from_day, to_day, known=state.cells, pad_bounds=pad_bounds)
+                else:
+                    plan = shared_plan or []
+                pending[destination] = state
+                if not plan:
+                    state.remaining = 1
+                    yield destination, None, None
+                    continue
+                state.remaining = len(plan)
+                chunk_filters = dates._chunk_filters_for(dest_filters, from_day, plan)
+                for span, chunk in zip(plan, chunk_filters, strict=True):
+                    yield destination, span, chunk
+
+        def fetch(job: _Job) -> tuple[_Job, DatePriceArray | Exception | None]:
+            destination, span, chunk = job
+            if chunk is None:
+                return job, None
+            try:
+                return job, dates._search_chunk_array(
+                    chunk,
+                    currency=currency,
+                    language=language,
+                    country=country,
+                    cancel_token=cancel_token,
+                )
+            except SearchCancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001 — reported on the destination
+                return job, e
+
+        responses = parallel_imap(
+            fetch,
+            jobs(),
+            window=max_in_flight,
+            max_workers=max_in_flight,
+            cancel_token=cancel_token,
+        )
+        try:
+            for (destination, span, chunk), response in responses:
+                state = pending[destination]
+                if chunk is not None:
+                    self.last_requests += 1
+                if isinstance(response, Exception):
+                    state.error = state.error or response
+                elif span is not None:
+                    first, last = span
+                    fetched: dict[date, _Cell | None] = {
+                        date.fromordinal(d): None
+                        for d in range(first.toordinal(), last.toordinal() + 1)
+                    }
+                    if response is not None:
+                        fetched.update(response._cells())
+                    state.cells.update(fetched)
+                    if store is not None:
+                        store.put(state.scope, fetched.items(), stay_days)
+                state.remaining -= 1
+                if state.remaining == 0:
+                    del pending[destination]
+                    yield DestinationFares(
+                        destination=destination,
+                        prices=DatePriceArray._from_cells(
+                            (
+                                (day, cell)
+                                for day, cell in sorted(state.cells.items())
+                                if cell is not None and from_day <= day <= to_day
+                            ),
+                            round_trip,
+                        ),
+                        error=state.error,
+                    )
+        finally:
+            responses.close()
+
+
+# (destination, planned chunk span, chunk filters); span and filters are
+# None for a destination whose every day is already fresh in the store.
+_Job = tuple[Airport, "tuple[date, date] | None", "DateSearchFilters | None"]
+
+
+@dataclass
+class _Pending:
+    """Per-destination bookkeeping while its chunks are in flight."""
+
+    remaining: int = 0
+    scope: str = ""
+    cells: dict[date, _Cell | None] = field(default_factory=dict)
+    error: BaseException | None = None
+
+
+def _for_destination(filters: DateSearchFilters, destination: Airport) -> DateSearchFilters:
+    """Copy the template ``filters`` with the first segment's arrival set to ``destination``.
+
+    For round trips the return segment departs from ``destination`` and
+    arrives at the outbound origin. The copy is not re-validated.
+    """
+    segments = deepcopy(filters.flight_segments)
+    segments[0].arrival_airport = [[destination, 0]]
+    if len(segments) > 1:
+        segments[1].departure_airport = [[destination, 0]]
+        segments[1].arrival_airport = deepcopy(segments[0].departure_airport)
+    return filters.model_copy(update={"flight_segments": segments})
+
+
+def _rank_key(fares: DestinationFares) -> tuple[int, float]:
+    price = fares.cheapest_price
+    return (1, 0.0) if price is None else (0, price)
@@ -0,0 +1,147 @@
+"""Flexible-date itinerary search built on the calendar and shopping endpoints.
+
+Finding the best itinerary across a date window by brute force costs one
+``GetShoppingResults`` call (plus round-trip expansions) per candidate
+date. :class:`SearchFlexible` replaces that with a two-stage pipeline:
+
+1. **Calendar sweep** — :meth:`SearchDates.search` prices every date (or
+   date pair, for round trips) in the window with a handful of
+   ``GetCalendarGraph`` requests.
+2. **Targeted fan-out** — only the ``top_k`` cheapest dates are searched
+   in full, concurrently, via :meth:`SearchFlights.search_many`.
+
+The result is a ranked list of :class:`FlexibleItinerary` objects.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from fli.models import DateSearchFilters, FlightResult, FlightSearchFilters, SortBy
+from fli.search.dates import DatePrice, SearchDates
+from fli.search.flights import SearchFlights
+
+
+@dataclass
+class FlexibleItinerary:
+    """Full itinerary search results for one candidate date (or date pair)."""
+
+    dates: tuple[datetime] | tuple[datetime, datetime]
+    calendar_price: float
+    currency: str | None = None
+    flights: list[FlightResult | tuple[FlightResult, ...]] = field(default_factory=list)
+    error: BaseException | None = None
+
+    @property
+    def price(self) -> float:
+        """Cheapest itinerary price found, falling back to the calendar price."""
+        prices = [p for p in (_itinerary_price(f) for f in self.flights) if p is not None]
+        return min(prices) if prices else self.calendar_price
+
+
+class SearchFlexible:
+    """Rank full itineraries over a date window with far fewer requests than brute force.
+
+    Example:
+    -------
+    >>> itineraries = SearchFlexible().search(date_filters, top_k=3)
+    >>> best = itineraries[0]
+    >>> best.dates, best.price, best.flights[0]
+
+    """
+
+    def __init__(self, flights: SearchFlights | None = None, dates: SearchDates | None = None):
+        """Wrap :class:`SearchFlights` / :class:`SearchDates` (fresh ones by default)."""
+        self.flights = flights or SearchFlights()
+        self.dates = dates or SearchDates()
+
+    def search(
+        self,
+        filters: DateSearchFilters,
+        *,
+        top_k: int = 5,
+        top_n: int = 5,
+        sort_by: SortBy = SortBy.CHEAPEST,
+        currency: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+    ) -> list[FlexibleItinerary]:
+        """Sweep the calendar, then search the ``top_k`` cheapest dates in full.
+
+        Args:
+            filters: Date-range filters. For round trips ``duration`` fixes
+                the return date of each candidate.
+            top_k: Number of cheapest calendar dates to search in full.
+            top_n: Outbound options expanded per round-trip search.
+            sort_by: Sort order requested for each full itinerary search.
+            currency: Optional ISO 4217 currency code applied to every request.
+            language: Optional BCP-47 language code applied to every request.
+            country: Optional ISO 3166-1 alpha-2 country code applied to every request.
+
+        Returns:
+            Itineraries ranked by their cheapest price (calendar price when a
+            full search returned nothing). Empty when the calendar has no
+            priced dates. Dates whose full search failed keep their calendar
+            price and carry the exception in ``error``.
+
+        """
+        if top_k <= 0:
+            raise ValueError("top_k must be positive")
+
+        calendar = self.dates.search(filters, currency=currency, language=language, country=country)
+        if not calendar:
+            return []
+
+        candidates = sorted(calendar, key=lambda dp: (dp.price, dp.date))[:top_k]
+        itineraries = [
+            FlexibleItinerary(dates=dp.date, calendar_price=dp.price, currency=dp.currency)
+            for dp in candidates
+        ]
+        batch = self.flights.search_many(
+            (self._flight_filters(filters, dp, sort_by) for dp in candidates),
+            top_n=top_n,
+            currency=currency,
+            language=language,
+            country=country,
+        )
+        for result in batch:
+            itinerary = itineraries[result.index]
+            itinerary.flights = list(result.flights or [])
+            itinerary.error = result.error
+
+        return sorted(itineraries, key=lambda it: (it.price, it.dates))
+
+    @staticmethod
+    def _flight_filters(
+        filters: DateSearchFilters, date_price: DatePrice, sort_by: SortBy
+    ) -> FlightSearchFilters:
+        """Turn a date-range search plus one calendar cell into itinerary filters."""
+        segments = deepcopy(filters.flight_segments)
+        for segment, date in zip(segments, date_price.date, strict=False):
+            segment.travel_date = date.strftime("%Y-%m-%d")
+        return FlightSearchFilters(
+            trip_type=filters.trip_type,
+            passenger_info=filters.passenger_info,
+            flight_segments=segments,
+            stops=filters.stops,
+            seat_type=filters.seat_type,
+            price_limit=filters.price_limit,
+            airlines=filters.airlines,
+            airlines_exclude=filters.airlines_exclude,
+            alliances=filters.alliances,
+            alliances_exclude=filters.alliances_exclude,
+            max_duration=filters.max_duration,
+            layover_restrictions=filters.layover_restrictions,
+            sort_by=sort_by,
+            emissions=filters.emissions,
+            bags=filters.bags,
+        )
+
+
+def _itinerary_price(flight: FlightResult | tuple[FlightResult, ...]) -> float | None:
+    """Total price of a search result (round trips carry it on the outbound)."""
+    if isinstance(flight, tuple):
+        return flight[0].price if flight else None
+    return flight.price
@@ -11,6 +11,7 @@ from __future__ import annotations
 import json
 import logging
 import urllib.parse
+from collections.abc import Callable, Iterable
 from copy import deepcopy
 
 from fli.models import (
@@ -19,16 +20,29 @@ from fli.models import (
     FlightSearchFilters,
 )
 from fli.models.google_flights.base import TripType
-from fli.search._concurrency import parallel_map
+from fli.search._concurrency import (
+    CancellationToken,
+    parallel_map,
+    process_parsing_enabled,
+    run_decoder,
+)
 from fli.search._decoders import (
+    ShoppingDecode,
     _try_parse_booking_row,  # noqa: F401 — back-compat re-export for tests
+    decode_booking_response,
+    decode_shopping_response,
     parse_booking_chunk,
     parse_flight_row,
 )
+from fli.search._metrics import record_parse_error, record_rows
+from fli.search._progress import SearchProgress, _ProgressTracker, progress_tracker
+from fli.search._search_cache import CacheStatus, SearchResultCache
 from fli.search._urls import with_locale_params
 from fli.search._urls import with_locale_params as _with_locale_params  # noqa: F401
-from fli.search._wire import iter_wrb_chunks, parse_first_wrb_payload
-from fli.search.client import get_client
+from fli.search._wire import iter_wrb_chunks
+from fli.search.batch import BatchResult, BatchSearch
+from fli.search.client import DEFAULT_CALLS_PER_SECOND, get_client
+from fli.search.exceptions import SubRequestFailure
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +63,8 @@ class SearchFlights:
 
     - :meth:`search` — issue a GetShoppingResults call and return the
       parsed flights.
+    - :meth:`search_many` — run a large batch of independent searches
+      concurrently and stream the results as they complete.
     - :meth:`get_booking_options` — follow up with GetBookingResults to
       surface bookable fares for a selected itinerary. See the method
       docstring for the live-token limitation.
@@ -65,6 +81,12 @@ class SearchFlights:
         ``session_id`` returned by your own session bookkeeping into
         :meth:`get_booking_options` explicitly (the kwarg overrides the
         cached value).
+
+    Caching:
+        With a :class:`~fli.search.SearchResultCache`, :meth:`search` answers
+        repeated queries from memory and refreshes stale results in the
+        background; :attr:`last_cache_status` reports whether the last
+        result was cached and how old it is.
     """
 
     BASE_URL = (
@@ -79,15 +101,30 @@ class SearchFlights:
         "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
     }
 
-    def __init__(self):
-        """Initialize the search client."""
+    def __init__(self, cache: SearchResultCache | None = None):
+        """Initialize the search client.
+
+        Args:
+            cache: Optional result cache, shareable across instances. With a
+                cache, :meth:`search` serves fresh results from it, serves
+                stale ones while re-running the search in the background,
+                and stores every complete result it fetches.
+
+        """
         self.client = get_client()
+        self.cache = cache
         # Last successful search response's ``inner[0][4]`` — the shopping
         # session id used to authenticate the follow-up GetBookingResults
         # call. Captured automatically by :meth:`search` so that
         # :meth:`get_booking_options` can derive the booking token without
         # the caller having to pass anything.
         self._last_session_id: str | None = None
+        # Sub-requests that failed during the most recent ``partial=True``
+        # :meth:`search` call. Empty after a fully successful search.
+        self.last_failures: list[SubRequestFailure] = []
+        # How the most recent :meth:`search` result was obtained; None until
+        # a search on an instance with a :attr:`cache` returns.
+        self.last_cache_status: CacheStatus | None = None
 
     # ------------------------------------------------------------------
     # Public search API
@@ -100,6 +137,9 @@ class SearchFlights:
         currency: str | None = None,
         language: str | None = None,
         country: str | None = None,
+        partial: bool = False,
+        cancel_token: CancellationToken | None = None,
+        on_progress: Callable[[SearchProgress], None] | None = None,
     ) -> list[FlightResult | tuple[FlightResult, ...]] | None:
         """Search for flights using the given :class:`FlightSearchFilters`.
 
@@ -110,6 +150,16 @@ class SearchFlights:
             currency: Optional ISO 4217 currency code (``curr`` URL param).
             language: Optional BCP-47 language code (``hl`` URL param).
             country: Optional ISO 3166-1 alpha-2 country code (``gl`` URL param).
+            partial: Keep the successful round-trip / multi-city combos when
+                some expansion requests fail, instead of raising. The failed
+                expansions are listed in :attr:`last_failures`.
+            cancel_token: Abandon the search from another thread. Queued
+                expansion requests are dropped and the call raises
+                :class:`~fli.search.exceptions.SearchCancelledError` promptly.
+            on_progress: Called with a :class:`SearchProgress` as the outbound
+                request and then each expansion request completes, carrying
+                that request's flights or itineraries. May be called from
+                worker threads.
 
         Returns:
             For one-way trips, a list of :class:`FlightResult`. For
@@ -118,16 +168,161 @@ class SearchFlights:
             when no results.
 
         Raises:
-            Exception: HTTP failure or unparseable response.
+            Exception: HTTP failure or unparseable response. With
+                ``partial=True`` only a failure of the initial outbound
+                request is raised — there is nothing to salvage without it.
+            SearchCancelledError: ``cancel_token`` was cancelled before the
+                search finished.
+
+        Notes:
+            With a :attr:`cache`, a cached result is returned without calling
+            ``on_progress`` and without updating the session id used by
+            :meth:`get_booking_options`. Results with failed expansions are
+            not cached.
 
         """
-        flights = self._fetch_flights(
+        failures: list[SubRequestFailure] | None = [] if partial else None
+        self.last_failures = []
+        self.last_cache_status = None
+        cache = self.cache
+        if cache is not None:
+            key = ("SearchFlights", filters.model_dump_json(), top_n, currency, language, country)
+            entry, status = cache.serve(
+                key,
+                lambda: self._search(
+                    filters,
+                    top_n=top_n,
+                    currency=currency,
+                    language=language,
+                    country=country,
+                    capture_session=False,
+                ),
+            )
+            if entry is not None:
+                self.last_cache_status = status
+                return entry.value
+        results = self._search(
             filters,
+            top_n=top_n,
             currency=currency,
             language=language,
             country=country,
             capture_session=True,
+            failures=failures,
+            cancel_token=cancel_token,
+            progress=progress_tracker(on_progress),
+        )
+        self.last_failures = failures or []
+        if cache is not None:
+            if not self.last_failures:
+                cache.put(key, results)
+            self.last_cache_status = CacheStatus.miss()
+        return results
+
+    def search_many(
+        self,
+        queries: Iterable[FlightSearchFilters],
+        *,
+        max_in_flight: int | None = None,
+        on_result: Callable[[BatchResult], None] | None = None,
+        top_n: int = 5,
+        currency: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+        cancel_token: CancellationToken | None = None,
+    ) -> BatchSearch:
+        """Run many independent searches concurrently, yielding results as they complete.
+
+        Every query goes through the same rate-limited client as
+        :meth:`search`, so the batch runs at Google's sustainable request
+        rate without any per-query executor or filter set-up in the
+        caller's loop. A query that raises does not affect its siblings —
+        the exception is reported on that query's :class:`BatchResult`.
+
+        Args:
+            queries: Filters to search, one per query. Consumed lazily, so a
+                generator of thousands of queries is fine.
+            max_in_flight: Maximum number of queries outstanding at once.
+                Defaults to the client's per-second request budget. A value
+                above the shared executor's worker cap grows the pool.
+            on_result: Optional callback invoked with each
+                :class:`BatchResult` on the iterating thread.
+            top_n: Same as :meth:`search`; applied to every query.
+            currency: Optional ISO 4217 currency code applied to every query.
+            language: Optional BCP-47 language code applied to every query.
+            country: Optional ISO 3166-1 alpha-2 country code applied to every query.
+            cancel_token: Cancels the whole batch: no further queries start,
+                running ones stop at their next request, and iteration raises
+                :class:`~fli.search.exceptions.SearchCancelledError`.
+
+        Returns:
+            A :class:`BatchSearch`. Iterate it to drive the batch (results
+            arrive in completion order; use ``BatchResult.index`` to map
+            back to the input), or call :meth:`BatchSearch.collect` for an
+            input-ordered list. ``BatchSearch.stats`` holds the aggregate
+            throughput numbers.
+
+        Notes:
+            Batch queries never update the cached session id used by
+            :meth:`get_booking_options`. Each successful result carries its
+            own in ``BatchResult.session_id``; pass it as ``session_id``
+            when booking a batch result.
+
+        """
+        return BatchSearch(
+            lambda filters, on_session: self._search(
+                filters,
+                top_n=top_n,
+                currency=currency,
+                language=language,
+                country=country,
+                capture_session=False,
+                on_session=on_session,
+                cancel_token=cancel_token,
+            ),
+            queries,
+            max_in_flight=(DEFAULT_CALLS_PER_SECOND if max_in_flight is None else max_in_flight),
+            on_result=on_result,
+            cancel_token=cancel_token,
         )
+
+    def _search(
+        self,
+        filters: FlightSearchFilters,
+        *,
+        top_n: int,
+        currency: str | None,
+        language: str | None,
+        country: str | None,
+        capture_session: bool,
+        on_session: Callable[[str], None] | None = None,
+        failures: list[SubRequestFailure] | None = None,
+        cancel_token: CancellationToken | None = None,
+        progress: _ProgressTracker | None = None,
+    ) -> list[FlightResult | tuple[FlightResult, ...]] | None:
+        """Shared body of :meth:`search` and :meth:`search_many`.
+
+        ``on_session`` receives the outbound response's session id without
+        touching instance state. ``failures`` switches expansion into
+        partial mode: failed expansion requests are appended to it instead
+        of being raised. ``progress`` receives one step per completed
+        request.
+        """
+        if progress is not None:
+            progress.plan(1)
+        flights = self._fetch_flights(
+            filters,
+            currency=currency,
+            language=language,
+            country=country,
+            capture_session=capture_session,
+            on_session=on_session,
+            cancel_token=cancel_token,
+        )
+        if progress is not None:
+            if flights and filters.trip_type != TripType.ONE_WAY:
+                progress.plan(self._expansion_count(flights, filters, top_n))
+            progress.step("outbound", _describe_segment(filters), flights or ())
         if flights is None:
             return None
         if filters.trip_type == TripType.ONE_WAY:
@@ -139,6 +334,9 @@ class SearchFlights:
             currency=currency,
             language=language,
             country=country,
+            failures=failures,
+            cancel_token=cancel_token,
+            progress=progress,
         )
 
     def _fetch_flights(
@@ -149,6 +347,8 @@ class SearchFlights:
         language: str | None,
         country: str | None,
         capture_session: bool,
+        on_session: Callable[[str], None] | None = None,
+        cancel_token: CancellationToken | None = None,
     ) -> list[FlightResult] | None:
         """Issue one ``GetShoppingResults`` call and decode the flight rows.
 
@@ -159,6 +359,7 @@ class SearchFlights:
         not write to that field — both because the writes would race and
         because the user-visible session id should describe the original
         shopping query, not whichever expansion completed last.
+        ``on_session``, if given, is called with the session id instead.
         """
         encoded = filters.encode()
         url = with_locale_params(self.BASE_URL, currency, language, country)
@@ -168,51 +369,40 @@ class SearchFlights:
             data=f"f.req={encoded}",
             impersonate="chrome",
             allow_redirects=True,
+            cancel_token=cancel_token,
         )
         response.raise_for_status()
 
-        inner = parse_first_wrb_payload(response.text)
-        if inner is None:
+        decoded = run_decoder(decode_shopping_response, response.text)
+        if not decoded.has_payload:
             return None
 
         if capture_session:
-            self._capture_session_id(inner)
-
-        try:
-            flights_raw = [
-                item for i in (2, 3) if isinstance(inner[i], list) for item in inner[i][0]
-            ]
-        except (IndexError, TypeError) as e:
+            self._capture_session_id(decoded)
+        session_id = decoded.session_id
+        if on_session is not None and isinstance(session_id, str) and session_id:
+            on_session(session_id)
+
+        record_rows(decoded.row_count, decoded.failed_rows)
+        if decoded.shape_error is not None:
+            record_parse_error()
+            e = decoded.shape_error
             raise SearchParseError(
-                f"Shopping response shape changed — no flights array at inner[2]/[3]: {e}"
+                "Shopping response shape changed — no flights array at inner[2]/[3]: "
+                f"{type(e).__name__}: {e}"
             ) from e
 
-        flights: list[FlightResult] = []
-        # Bounded ring of unique failure reasons — we only surface the
-        # first few in the SearchParseError below, and Google's response
-        # rarely tops 100 rows, but capping at construction keeps memory
-        # constant regardless of how large a future response gets.
-        failure_samples: list[str] = []
-        any_failure = False
-        for row in flights_raw:
-            try:
-                flights.append(parse_flight_row(row))
-            except (AttributeError, KeyError, ValueError, TypeError) as e:
-                reason = f"{type(e).__name__}: {e}"
-                any_failure = True
-                if reason not in failure_samples and len(failure_samples) < 3:
-                    failure_samples.append(reason)
-                logger.debug("Skipping flight with unparseable data: %s", reason)
-
-        if flights_raw and any_failure and not flights:
+        flights = decoded.flights
+        if decoded.row_count and decoded.failed_rows and not flights:
             # Every row failed to parse — likely a wire-format change.
             # Surface the failure reasons so the error isn't blindly
             # blamed on "shape change" when the cause is something else
             # (e.g. all rows hit a known structural quirk we haven't yet
             # handled in the decoder).
-            sample = "; ".join(failure_samples)
+            sample = "; ".join(decoded.failure_samples)
+            record_parse_error()
             raise SearchParseError(
-                f"Parsed 0/{len(flights_raw)} flight rows — "
+                f"Parsed 0/{decoded.row_count} flight rows — "
                 f"Google response shape may have changed (sample reasons: {sample})"
             )
 
@@ -336,6 +526,9 @@ class SearchFlights:
         )
         response.raise_for_status()
 
+        if process_parsing_enabled():
+            return run_decoder(decode_booking_response, response.text)
+
         # Booking responses are typically split into two wrb.fr chunks
         # (vendor list + price refinements). Materialise both before
         # parsing so we can parse them in parallel — each chunk is a few
@@ -350,22 +543,21 @@ class SearchFlights:
             options.extend(chunk_options)
         return options
 
-    def _capture_session_id(self, inner: list) -> None:
-        """Cache the shopping session id from ``inner[0][4]`` of a search response.
+    def _capture_session_id(self, decoded: ShoppingDecode) -> None:
+        """Cache the shopping session id (``inner[0][4]``) of a decoded search response.
 
         The session id is used by :meth:`get_booking_options` to derive a
         booking token automatically. A shape change here means booking
         calls will fall back to "missing token" errors, so we log a
         warning rather than silently leaving the cache untouched.
         """
-        try:
-            session_id = inner[0][4]
-        except (IndexError, TypeError):
+        session_id = decoded.session_id
+        if decoded.session_id_missing:
             logger.warning(
                 "Failed to capture shopping session id from search response; "
                 "subsequent get_booking_options() calls without an explicit "
                 "session_id will fail.",
-                exc_info=True,
+                exc_info=decoded.session_id_error,
             )
             return
         if isinstance(session_id, str) and session_id:
@@ -390,6 +582,10 @@ class SearchFlights:
         currency: str | None,
         language: str | None,
         country: str | None,
+        failures: list[SubRequestFailure] | None = None,
+        cancel_token: CancellationToken | None = None,
+        progress: _ProgressTracker | None = None,
+        selected: tuple[FlightResult, ...] = (),
     ) -> list[tuple[FlightResult, ...]] | list[FlightResult]:
         """Fetch next-leg options for round-trip / multi-city in parallel.
 
@@ -409,6 +605,15 @@ class SearchFlights:
         :meth:`get_booking_options` should use; letting expansion workers
         race over it would yield non-deterministic results and violate
         the "one session per visible search" contract.
+
+        When ``failures`` is a list, a failed expansion is recorded there
+        as a :class:`SubRequestFailure` and its outbound is dropped; the
+        combos from every other expansion are still returned. Nested
+        (multi-city ≥ 3) expansions share the same list. ``cancel_token``
+        reaches every nested request and :func:`parallel_map` call, and
+        ``progress`` gets one step per expansion request with the complete
+        itineraries it produced, prefixed with the already ``selected``
+        legs (nested requests are counted as they are discovered).
         """
         num_segments = len(filters.flight_segments)
         selected_count = sum(1 for s in filters.flight_segments if s.selected_flight is not None)
@@ -423,19 +628,37 @@ class SearchFlights:
         def expand(outbound: FlightResult):
             next_filters = deepcopy(filters)
             next_filters.flight_segments[selected_count].selected_flight = outbound
-            sub_flights = self._fetch_flights(
-                next_filters,
-                currency=currency,
-                language=language,
-                country=country,
-                capture_session=False,
-            )
+            label = f"after {_describe_flight(outbound)}"
+            try:
+                sub_flights = self._fetch_flights(
+                    next_filters,
+                    currency=currency,
+                    language=language,
+                    country=country,
+                    capture_session=False,
+                    cancel_token=cancel_token,
+                )
+            except Exception:
+                if progress is not None:
+                    progress.step("expansion", f"{label} (failed)")
+                raise
+            nested = sub_flights is not None and selected_count + 1 < num_segments - 1
+            if progress is not None:
+                if nested:
+                    progress.plan(self._expansion_count(sub_flights, next_filters, top_n))
+                # Nested itineraries are reported by the nested expansions.
+                combos = (
+                    [selected + combo for combo in _combine(outbound, sub_flights)]
+                    if sub_flights and not nested
+                    else ()
+                )
+                progress.step("expansion", label, combos)
             if sub_flights is None:
                 return outbound, None
             # If more segments remain unselected (multi-city ≥ 3), keep
             # expanding. Otherwise return the flat list of next-leg
             # candidates and let the caller assemble tuples.
-            if selected_count + 1 < num_segments - 1:
+            if nested:
                 return outbound, self._expand_multi_leg(
                     sub_flights,
                     next_filters,
@@ -443,22 +666,49 @@ class SearchFlights:
                     currency=currency,
                     language=language,
                     country=country,
+                    failures=failures,
+                    cancel_token=cancel_token,
+                    progress=progress,
+                    selected=selected + (outbound,),
                 )
             return outbound, sub_flights
 
-        expansions = parallel_map(expand, candidates)
+        if failures is None:
+            expansions = parallel_map(expand, candidates, cancel_token=cancel_token)
+        else:
+            expansions = []
+            outcomes = parallel_map(
+                expand, candidates, return_exceptions=True, cancel_token=cancel_token
+            )
+            for outbound, outcome in zip(candidates, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    failures.append(
+                        SubRequestFailure(
+                            kind="expansion",
+                            description=f"outbound {_describe_flight(outbound)}",
+                            error=outcome,
+                        )
+                    )
+                else:
+                    expansions.append(outcome)
 
         combos: list[tuple[FlightResult, ...]] = []
         for outbound, next_results in expansions:
-            if next_results is None:
-                continue
-            for nxt in next_results:
-                if isinstance(nxt, tuple):
-                    combos.append((outbound,) + nxt)
-                else:
-                    combos.append((outbound, nxt))
+            if next_results is not None:
+                combos.extend(_combine(outbound, next_results))
         return combos
 
+    @staticmethod
+    def _expansion_count(
+        flights: list[FlightResult], filters: FlightSearchFilters, top_n: int
+    ) -> int:
+        """Return how many requests :meth:`_expand_multi_leg` issues for ``flights``."""
+        num_segments = len(filters.flight_segments)
+        selected_count = sum(1 for s in filters.flight_segments if s.selected_flight is not None)
+        if selected_count >= num_segments - 1:
+            return 0
+        return len(flights[:top_n])
+
     # ------------------------------------------------------------------
     # Booking-payload construction
     # ------------------------------------------------------------------
@@ -526,3 +776,37 @@ class SearchFlights:
         from fli.search._decoders import _parse_price_info as _impl
 
         return _impl(row)[1]
+
+
+def _combine(
+    outbound: FlightResult, next_results: list[FlightResult] | list[tuple[FlightResult, ...]]
+) -> list[tuple[FlightResult, ...]]:
+    """Prefix each next-leg option (or partial itinerary) with ``outbound``."""
+    return [
+        (outbound,) + nxt if isinstance(nxt, tuple) else (outbound, nxt) for nxt in next_results
+    ]
+
+
+def _describe_segment(filters: FlightSearchFilters) -> str:
+    """Describe the first unselected segment, e.g. ``JFK-LHR 2026-11-02``."""
+    segment = next(
+        (s for s in filters.flight_segments if s.selected_flight is None),
+        filters.flight_segments[0],
+    )
+    origins = ",".join(a.name.removeprefix("_") for a, _ in segment.departure_airport)
+    destinations = ",".join(a.name.removeprefix("_") for a, _ in segment.arrival_airport)
+    return f"{origins}-{destinations} {segment.travel_date}"
+
+
+def _describe_flight(flight: FlightResult) -> str:
+    """Short human-readable identifier for an itinerary, e.g. ``AA100+AA2 JFK-SFO``."""
+    if not flight.legs:
+        return "<no legs>"
+    numbers = "+".join(
+        f"{leg.airline.name.removeprefix('_')}{leg.flight_number}" for leg in flight.legs
+    )
+    first, last = flight.legs[0], flight.legs[-1]
+    return (
+        f"{numbers} {first.departure_airport.name.removeprefix('_')}-"
+        f"{last.arrival_airport.name.removeprefix('_')}"
+    )
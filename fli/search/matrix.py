@@ -0,0 +1,211 @@
+"""Origin × destination matrix search with automatic request packing.
+
+``FlightSegment.departure_airport`` / ``arrival_airport`` accept several
+airports at once, and Google answers such a query with flights between any
+of the listed pairs. That is the cheapest way to cover an N × M airport
+matrix — but the combined answer is capped at Google's usual result count,
+so sparse or expensive pairs can be crowded out by popular ones.
+
+:class:`SearchMatrix` therefore works in two passes:
+
+1. **Packed pass** — the origins and destinations are split into blocks of
+   at most :data:`MAX_AIRPORTS_PER_SIDE` airports, and one request is
+   issued per block pair (a single request for typical city-to-city
+   workloads such as "any NYC airport to any London airport").
+2. **Refinement pass** — pairs that the packed pass did not cover are
+   regrouped so origins sharing the same set of uncovered destinations
+   travel together, and one more request is issued per regrouped block.
+
+Every flight is attributed to a pair by its first leg's departure airport
+and last leg's arrival airport, and the cheapest fare per pair is kept.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from copy import deepcopy
+from dataclasses import dataclass, field
+
+from fli.models import Airport, FlightResult, FlightSearchFilters
+from fli.models.google_flights.base import TripType
+from fli.search._concurrency import parallel_map
+from fli.search.flights import SearchFlights
+
+# Google Flights' UI lets the user pick at most seven airports per side;
+# larger lists are split into blocks of this size.
+MAX_AIRPORTS_PER_SIDE = 7
+
+Pair = tuple[Airport, Airport]
+
+
+@dataclass
+class MatrixResult:
+    """Cheapest fare per (origin, destination) pair from a matrix search."""
+
+    origins: list[Airport]
+    destinations: list[Airport]
+    fares: dict[Pair, FlightResult] = field(default_factory=dict)
+    requests: int = 0
+
+    def cheapest(self, origin: Airport, destination: Airport) -> FlightResult | None:
+        """Return the cheapest flight found for a pair, or None."""
+        return self.fares.get((origin, destination))
+
+    @property
+    def missing(self) -> list[Pair]:
+        """Pairs for which no priced flight was found."""
+        return [pair for pair in _pairs(self.origins, self.destinations) if pair not in self.fares]
+
+    def table(self) -> list[list[float | None]]:
+        """Return a price grid: one row per origin, one column per destination."""
+        rows: list[list[float | None]] = []
+        for origin in self.origins:
+            row: list[float | None] = []
+            for destination in self.destinations:
+                flight = self.fares.get((origin, destination))
+                row.append(flight.price if flight is not None else None)
+            rows.append(row)
+        return rows
+
+
+class SearchMatrix:
+    """Search every origin × destination pair with as few requests as possible.
+
+    Example:
+    -------
+    >>> segments, _ = build_flight_segments(
+    ...     [Airport.JFK, Airport.LGA, Airport.EWR], [Airport.LHR, Airport.LGW], "2026-12-01"
+    ... )
+    >>> filters = FlightSearchFilters(passenger_info=PassengerInfo(), flight_segments=segments)
+    >>> result = SearchMatrix().search(filters)
+    >>> result.table()  # rows = origins, columns = destinations
+
+    """
+
+    def __init__(self, search: SearchFlights | None = None):
+        """Wrap a :class:`SearchFlights` instance (a fresh one by default)."""
+        self.flights = search or SearchFlights()
+
+    def search(
+        self,
+        filters: FlightSearchFilters,
+        *,
+        refine: bool = True,
+        currency: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+    ) -> MatrixResult:
+        """Find the cheapest fare for every origin × destination pair.
+
+        Args:
+            filters: One-way filters with a single segment. The segment's
+                ``departure_airport`` and ``arrival_airport`` lists define
+                the matrix; every other filter applies to all pairs.
+            refine: Issue the refinement pass for pairs the packed pass
+                did not cover. Disable to cap the cost at the packed pass.
+            currency: Optional ISO 4217 currency code (``curr`` URL param).
+            language: Optional BCP-47 language code (``hl`` URL param).
+            country: Optional ISO 3166-1 alpha-2 country code (``gl`` URL param).
+
+        Returns:
+            A :class:`MatrixResult` with the cheapest flight per pair and the
+            number of requests issued.
+
+        Raises:
+            ValueError: ``filters`` is not a single-segment one-way search.
+
+        """
+        if filters.trip_type != TripType.ONE_WAY or len(filters.flight_segments) != 1:
+            raise ValueError("Matrix search requires one-way filters with a single segment")
+
+        segment = filters.flight_segments[0]
+        origins = _unique(airport for airport, _ in segment.departure_airport)
+        destinations = _unique(airport for airport, _ in segment.arrival_airport)
+        result = MatrixResult(origins=origins, destinations=destinations)
+        wanted = set(_pairs(origins, destinations))
+
+        def run(blocks: list[tuple[list[Airport], list[Airport]]]) -> None:
+            packed = [self._block_filters(filters, o, d) for o, d in blocks]
+            responses = parallel_map(
+                lambda f: self.flights._fetch_flights(
+                    f,
+                    currency=currency,
+                    language=language,
+                    country=country,
+                    capture_session=False,
+                ),
+                packed,
+            )
+            result.requests += len(packed)
+            for flights in responses:
+                for flight in flights or ():
+                    _record(result.fares, wanted, flight)
+
+        run(_pack(origins, destinations))
+
+        if refine:
+            missing = [pair for pair in _pairs(origins, destinations) if pair not in result.fares]
+            if missing:
+                run(_regroup(missing))
+
+        return result
+
+    @staticmethod
+    def _block_filters(
+        filters: FlightSearchFilters,
+        origins: list[Airport],
+        destinations: list[Airport],
+    ) -> FlightSearchFilters:
+        """Copy ``filters`` with the segment restricted to one airport block."""
+        block = deepcopy(filters)
+        segment = block.flight_segments[0]
+        segment.departure_airport = [[airport, 0] for airport in origins]
+        segment.arrival_airport = [[airport, 0] for airport in destinations]
+        return block
+
+
+def _unique(airports) -> list[Airport]:
+    """De-duplicate while preserving the caller's order."""
+    return list(dict.fromkeys(airports))
+
+
+def _pairs(origins: list[Airport], destinations: list[Airport]) -> list[Pair]:
+    return [(o, d) for o in origins for d in destinations if o != d]
+
+
+def _chunk(airports: list[Airport]) -> list[list[Airport]]:
+    step = MAX_AIRPORTS_PER_SIDE
+    return [airports[i : i + step] for i in range(0, len(airports), step)]
+
+
+def _pack(
+    origins: list[Airport], destinations: list[Airport]
+) -> list[tuple[list[Airport], list[Airport]]]:
+    """Split the full matrix into block pairs of at most ``MAX_AIRPORTS_PER_SIDE``."""
+    return [(o, d) for o in _chunk(origins) for d in _chunk(destinations)]
+
+
+def _regroup(missing: list[Pair]) -> list[tuple[list[Airport], list[Airport]]]:
+    """Pack uncovered pairs: origins with identical missing sets share requests."""
+    by_origin: dict[Airport, list[Airport]] = defaultdict(list)
+    for origin, destination in missing:
+        by_origin[origin].append(destination)
+    by_dest_set: dict[tuple[Airport, ...], list[Airport]] = defaultdict(list)
+    for origin, dests in by_origin.items():
+        by_dest_set[tuple(dests)].append(origin)
+    blocks: list[tuple[list[Airport], list[Airport]]] = []
+    for dests, origins in by_dest_set.items():
+        blocks.extend(_pack(origins, list(dests)))
+    return blocks
+
+
+def _record(fares: dict[Pair, FlightResult], wanted: set[Pair], flight: FlightResult) -> None:
+    """Keep ``flight`` if it is the cheapest priced option seen for its pair."""
+    if not flight.legs or flight.price is None:
+        return
+    pair = (flight.legs[0].departure_airport, flight.legs[-1].arrival_airport)
+    if pair not in wanted:
+        return
+    best = fares.get(pair)
+    if best is None or flight.price < best.price:
+        fares[pair] = flight
@@ -2,7 +2,7 @@
 
 Each scenario is deterministic — it replays a real or synthetic fixture
 through the same parser code production uses, with HTTP swapped for a
-controlled-latency stub. The output is grouped into five sections so
+controlled-latency stub. The output is grouped into seven sections so
 regressions are easy to spot:
 
 1. **Parsing (CPU only)** — scales rows from 1 → 1000 to expose the
@@ -10,11 +10,19 @@ regressions are easy to spot:
 2. **Wire-format reading** — single vs multi-chunk responses, the
    currency-token cache, booking decode at multiple vendor counts.
 3. **End-to-end search (I/O bound, mocked HTTP)** — one-way at three
-   latencies, round-trip across ``top_n`` ∈ {2, 5, 10}, multi-city.
+   latencies, round-trip across ``top_n`` ∈ {2, 5, 10}, multi-city with
+   3–5 segments (nested fan-out on the shared pool).
 4. **Date-range chunking** — 30 / 90 / 180 / 305-day ranges to verify
    parallelism scales with chunk count.
 5. **Concurrency primitives** — bare-metal numbers for
    ``parallel_map`` and ``TokenBucketRateLimiter``.
+6. **Decode throughput: threads vs processes** — a batch of large
+   shopping responses decoded by eight I/O threads, first in-thread
+   (GIL-bound), then via the optional process-pool stage. Run on a host
+   with 8+ cores to see the process stage scale.
+7. **Parse scaling across threads** — the same row-parsing workload split
+   over 1 / 2 / 4 / 8 threads. Flat on a GIL build; on a free-threaded
+   (3.13t / 3.14t) build it should scale with cores.
 
 Usage:
 
@@ -24,6 +32,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import threading
 import time
@@ -42,12 +51,21 @@ from fli.models import (  # noqa: E402
     PassengerInfo,
     TripType,
 )
-from fli.search import SearchDates, SearchFlights  # noqa: E402
+from fli.search import SearchDates, SearchExplore, SearchFlights  # noqa: E402
 from fli.search._concurrency import (  # noqa: E402
     TokenBucketRateLimiter,
+    configure_process_parsing,
+    executor_stats,
+    gil_enabled,
+    parallel_imap,
     parallel_map,
+    run_decoder,
+)
+from fli.search._decoders import (  # noqa: E402
+    decode_shopping_response,
+    parse_booking_chunk,
+    parse_flight_row,
 )
-from fli.search._decoders import parse_booking_chunk, parse_flight_row  # noqa: E402
 from fli.search._wire import iter_wrb_chunks, parse_first_wrb_payload  # noqa: E402
 from scripts.benchmarks._fixtures import (  # noqa: E402
     synthetic_booking_response,
@@ -325,6 +343,10 @@ def bench_search_section(iters: int) -> list[BenchResult]:
     results.append(make_round_trip(top_n=5))
     results.append(make_round_trip(top_n=10))
     results.append(make_multi_city(n_segments=3))
+    # 4- and 5-segment trips recurse through nested parallel_map calls on
+    # the shared pool — a stress test for starvation-free nesting.
+    results.append(make_multi_city(n_segments=4))
+    results.append(make_multi_city(n_segments=5))
 
     return results
 
@@ -362,6 +384,29 @@ def bench_dates_section(iters: int) -> list[BenchResult]:
     results.append(make(244))  # 4 chunks
     results.append(make(305))  # 5 chunks (max range)
 
+    # Explore: 20 destinations × 2 chunks through one request stream, versus
+    # the same calendars fetched one SearchDates.search call at a time.
+    destinations = [a for a in Airport if a != Airport.JFK][:20]
+
+    def explore_run(fake: FakeClient):
+        dates = SearchDates()
+        dates.client = fake
+        return SearchExplore(dates).search(_date_filters(90), destinations)
+
+    def sequential_run(fake: FakeClient):
+        search = SearchDates()
+        search.client = fake
+        return [search.search(_date_filters(90)) for _ in destinations]
+
+    for name, run_fn in (
+        ("explore 20 dest × 90d", explore_run),
+        ("sequential 20 dest × 90d", sequential_run),
+    ):
+        fake = FakeClient(date_body, latency_ms=120.0)
+        res = time_callable(lambda fn=run_fn, f=fake: fn(f), iterations=iters, name=name)
+        res.payload = _wrap({}, fake)
+        results.append(res)
+
     return results
 
 
@@ -386,6 +431,12 @@ def bench_concurrency_section(iters: int) -> list[BenchResult]:
 
     results.append(time_callable(pmap_large, iterations=iters, name="parallel_map: 20x5ms"))
 
+    # parallel_imap: same workload, streamed through a 10-wide window
+    def pimap_large():
+        return list(parallel_imap(lambda x: time.sleep(0.005) or x, iter(range(20)), window=10))
+
+    results.append(time_callable(pimap_large, iterations=iters, name="parallel_imap: 20x5ms"))
+
     # parallel_map: synchronous fast path
     def pmap_sync():
         return parallel_map(lambda x: x * 2, [42])
@@ -429,13 +480,69 @@ def bench_concurrency_section(iters: int) -> list[BenchResult]:
     return results
 
 
+# ---------------------------------------------------------------------------
+# Section 6 — Decode throughput: threads vs processes
+# ---------------------------------------------------------------------------
+
+
+def bench_process_parsing_section(iters: int) -> list[BenchResult]:
+    """Decode a batch of 200-row responses from 8 threads, in-thread vs in processes."""
+    bodies = [synthetic_flight_response(rows=200)] * 32
+    cores = os.cpu_count() or 1
+    results: list[BenchResult] = []
+
+    def decode_batch():
+        return parallel_map(
+            lambda body: run_decoder(decode_shopping_response, body), bodies, max_workers=8
+        )
+
+    def make(workers: int, label: str) -> BenchResult:
+        configure_process_parsing(workers)
+        try:
+            decode_batch()  # warm-up: spawns the pool outside the timed runs
+            res = time_callable(decode_batch, iterations=iters, name=label)
+        finally:
+            configure_process_parsing(0)
+        res.payload = {"responses": len(bodies), "rows": 200 * len(bodies)}
+        return res
+
+    results.append(make(0, "decode 32x200 rows, 8 threads"))
+    results.append(make(cores, f"decode 32x200 rows, {cores} processes"))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Section 7 — Parse scaling across threads (GIL vs free-threaded)
+# ---------------------------------------------------------------------------
+
+
+def bench_thread_scaling_section(iters: int) -> list[BenchResult]:
+    """Parse 1600 rows split over N threads; speedup vs 1 thread shows GIL contention."""
+    rows = _rows_from_fixture(synthetic_flight_response(rows=200)) * 8
+    mode = "GIL" if gil_enabled() else "free-threaded"
+    results: list[BenchResult] = []
+
+    for threads in (1, 2, 4, 8):
+        shards = [rows[i::threads] for i in range(threads)]
+
+        def run(shards=shards, threads=threads):
+            return parallel_map(
+                lambda shard: [parse_flight_row(r) for r in shard], shards, max_workers=threads
+            )
+
+        res = time_callable(run, iterations=iters, name=f"parse 1600 rows, {threads}T ({mode})")
+        res.payload = {"rows": len(rows), "threads": threads}
+        results.append(res)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
 
 def main() -> int:
-    """Run all five sections and print a single combined report."""
+    """Run all seven sections and print a single combined report."""
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--iterations", type=int, default=5)
     parser.add_argument(
@@ -454,6 +561,8 @@ def main() -> int:
         ("Section 3 — End-to-end search (mocked HTTP)", bench_search_section(iters)),
         ("Section 4 — Date-range chunking", bench_dates_section(iters)),
         ("Section 5 — Concurrency primitives", bench_concurrency_section(iters)),
+        ("Section 6 — Decode: threads vs processes", bench_process_parsing_section(iters)),
+        ("Section 7 — Parse scaling across threads", bench_thread_scaling_section(iters)),
     ]
 
     total = sum(len(r) for _, r in sections)
@@ -474,13 +583,21 @@ def main() -> int:
     # Top-level throughput summary.
     print("\nKey throughput metrics:")
     for title, results in sections:
-        if "Section 1" in title:
+        if "Section 1" in title or "Section 6" in title or "Section 7" in title:
             for r in results:
                 rows = (r.payload or {}).get("rows", 0)
                 if rows and r.wall_mean > 0:
                     throughput = rows * 1000.0 / r.wall_mean
                     print(f"  {r.name:30s}  {throughput:>12,.0f} rows/sec")
 
+    pool = executor_stats()
+    print("\nShared executor over the whole run:")
+    print(
+        f"  tasks={pool.completed} peak running={pool.max_running}/{pool.max_workers} "
+        f"peak queued={pool.max_queued} mean queue={pool.mean_queue_s * 1000:.2f}ms "
+        f"mean run={pool.mean_run_s * 1000:.2f}ms"
+    )
+
     return 0
 
 
@@ -493,6 +610,8 @@ __all__ = [
     "bench_concurrency_section",
     "bench_dates_section",
     "bench_parsing_section",
+    "bench_process_parsing_section",
     "bench_search_section",
+    "bench_thread_scaling_section",
     "bench_wire_section",
 ]
@@ -0,0 +1,120 @@
+"""Cold-start benchmark for the MCP server, with an enforceable budget.
+
+Every sample runs in a fresh interpreter, so nothing is already imported.
+Scenarios:
+
+1. ``import fli.mcp.server`` from nothing. This is what a serverless or
+   Railway cold start pays before it can answer the MCP handshake.
+2. The same import with the server's third-party dependencies (fastmcp,
+   pydantic-settings, griffe) imported beforehand. What remains is the
+   cost of ``fli`` itself, and it is the figure the budget applies to.
+3. Loading the modules the server defers (``fli.core``, ``fli.models``,
+   the search classes) after the server is imported. The first tool call
+   pays this, unless ``run()``'s background warm-up has already done so.
+
+The script exits with status 1 when the p50 of scenario 2 is over
+``--budget-ms``, or when importing the server pulls in a deferred module.
+
+Usage:
+
+    uv run python scripts/benchmarks/import_time.py [--iterations N] [--budget-ms MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from scripts.benchmarks._harness import BenchResult, print_table  # noqa: E402
+
+DEFAULT_BUDGET_MS = 250.0
+
+# Modules that must not be imported by ``import fli.mcp.server``.
+DEFERRED = ("fli.core", "fli.models", "fli.search.flights", "fli.search.dates", "babel")
+
+_PRELOAD_DEPS = "import fastmcp, fastmcp.server.context, griffe, mcp.types, pydantic_settings"
+
+_CHILD = """
+import json, sys, time
+{preload}
+wall, cpu = time.perf_counter(), time.process_time()
+{statement}
+print(json.dumps({{
+    "wall_ms": (time.perf_counter() - wall) * 1000,
+    "cpu_ms": (time.process_time() - cpu) * 1000,
+    "loaded": [m for m in {deferred!r} if m in sys.modules],
+}}))
+"""
+
+
+def _sample(statement: str, preload: str = "") -> dict:
+    code = _CHILD.format(preload=preload, statement=statement, deferred=DEFERRED)
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _scenario(name: str, iterations: int, statement: str, preload: str = "") -> BenchResult:
+    _sample(statement, preload)  # Warm the OS file cache and .pyc files.
+    result = BenchResult(name=name, iterations=iterations)
+    loaded: set[str] = set()
+    for _ in range(iterations):
+        sample = _sample(statement, preload)
+        result.wall_ms.append(sample["wall_ms"])
+        result.cpu_ms.append(sample["cpu_ms"])
+        loaded.update(sample["loaded"])
+    result.payload = sorted(loaded)
+    return result
+
+
+def main() -> int:
+    """Run the scenarios, print a report and check the budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=7)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Maximum p50 of fli's own share of the server import.",
+    )
+    args = parser.parse_args()
+
+    cold = _scenario("import fli.mcp.server (cold)", args.iterations, "import fli.mcp.server")
+    own = _scenario(
+        "import fli.mcp.server (deps loaded)",
+        args.iterations,
+        "import fli.mcp.server",
+        preload=_PRELOAD_DEPS,
+    )
+    deferred = _scenario(
+        "deferred modules (first tool call)",
+        args.iterations,
+        "server._warm_up()",
+        preload="import fli.mcp.server as server",
+    )
+    print_table("MCP server cold start", [cold, own, deferred])
+
+    failures = []
+    if own.wall_p50 > args.budget_ms:
+        failures.append(f"fli share p50 {own.wall_p50:.1f} ms > budget {args.budget_ms:.1f} ms")
+    for result in (cold, own):
+        if result.payload:
+            failures.append(f"{result.name} imported deferred modules: {result.payload}")
+    print()
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        return 1
+    print(f"OK: fli share p50 {own.wall_p50:.1f} ms within {args.budget_ms:.1f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
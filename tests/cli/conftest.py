@@ -1,3 +1,4 @@
+import importlib
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
@@ -97,8 +98,11 @@ def mock_search_flights(monkeypatch):
             "total_price": 599.98,
         }
     ]
-    monkeypatch.setattr("fli.search.flights.SearchFlights.__new__", lambda cls: mock)
-    monkeypatch.setattr("fli.search.SearchFlights.__new__", lambda cls: mock)
+    # Patch the names the commands look up rather than ``SearchFlights.__new__``
+    # (see ``mock_search_dates``).
+    for command in ("flights", "multi"):
+        module = importlib.import_module(f"fli.cli.commands.{command}")
+        monkeypatch.setattr(module, "SearchFlights", lambda *args, **kwargs: mock)
     return mock
 
 
@@ -106,8 +110,11 @@ def mock_search_flights(monkeypatch):
 def mock_search_dates(monkeypatch):
     """Mock SearchDates class."""
     mock = MagicMock()
-    monkeypatch.setattr("fli.search.dates.SearchDates.__new__", lambda cls: mock)
-    monkeypatch.setattr("fli.search.SearchDates.__new__", lambda cls: mock)
+    # Patch the name the command looks up rather than ``SearchDates.__new__``:
+    # restoring an inherited ``__new__`` leaves the class rejecting
+    # constructor arguments for the rest of the session.
+    dates_command = importlib.import_module("fli.cli.commands.dates")
+    monkeypatch.setattr(dates_command, "SearchDates", lambda *args, **kwargs: mock)
     return mock
 
 
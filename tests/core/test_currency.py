@@ -1,3 +1,6 @@
+import threading
+
+from fli.core import currency as currency_module
 from fli.core import extract_currency_from_price_token, format_price, format_price_axis_label
 
 SHOPPING_TOKEN = (
@@ -16,6 +19,35 @@ def test_extract_currency_from_price_token_invalid():
     assert extract_currency_from_price_token("not-a-valid-token") is None
 
 
+def test_extract_currency_cache_is_bounded():
+    """The token cache resets instead of growing past its bound."""
+    for i in range(currency_module._TOKEN_CACHE_MAX + 10):
+        extract_currency_from_price_token(f"bogus-token-{i}")
+    assert len(currency_module._TOKEN_CACHE) <= currency_module._TOKEN_CACHE_MAX
+    assert extract_currency_from_price_token(SHOPPING_TOKEN) == "USD"
+
+
+def test_extract_currency_concurrent_callers_agree():
+    """Hammering the cache from many threads never yields a wrong or torn value."""
+    errors = []
+    barrier = threading.Barrier(8)
+
+    def worker(offset: int) -> None:
+        barrier.wait()
+        for i in range(500):
+            token = SHOPPING_TOKEN if i % 2 else f"bad-{offset}-{i % 300}"
+            expected = "USD" if i % 2 else None
+            if extract_currency_from_price_token(token) != expected:
+                errors.append((offset, i))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
 def test_format_price_uses_currency_code():
     """Price formatting should use ISO currency codes for symbols."""
     assert format_price(118, "HKD") == "HK$118.00"
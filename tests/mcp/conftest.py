@@ -0,0 +1,27 @@
+"""Test doubles shared by the MCP server tests.
+
+Tool-call tests patch ``server._execute_flight_search`` (or the date
+equivalent) with a plain function taking ``(params, on_progress=None)``, so
+no request reaches Google.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from tests.search.conftest import FakeClock
+
+__all__ = ["FLIGHT_ARGS", "FakeClock", "empty_flight_result", "empty_flight_search"]
+
+# Arguments of a valid ``search_flights`` tool call.
+FLIGHT_ARGS = {"origin": "JFK", "destination": "LHR", "departure_date": "2099-01-01"}
+
+
+def empty_flight_result() -> dict[str, Any]:
+    """Return a successful one-way search response without flights."""
+    return {"success": True, "flights": [], "count": 0, "trip_type": "ONE_WAY"}
+
+
+def empty_flight_search(params: Any, on_progress: Any = None) -> dict[str, Any]:
+    """Stand-in for ``server._execute_flight_search`` that finds no flights."""
+    return empty_flight_result()
@@ -0,0 +1,187 @@
+"""Tests for background cache warming of popular MCP searches."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client
+
+from fli.mcp import server
+from fli.mcp._cache_warmer import CacheWarmer, QueryPopularity
+from fli.search import RequestBudget, ResultCache
+from fli.search._concurrency import TokenBucketRateLimiter, current_request_budget
+from tests.mcp.conftest import FLIGHT_ARGS, FakeClock, empty_flight_search
+
+
+class TestQueryPopularity:
+    def test_ranks_by_decayed_count(self):
+        clock = FakeClock()
+        popularity = QueryPopularity(half_life=10.0, clock=clock)
+        for _ in range(3):
+            popularity.record("old", "q-old")
+        clock.now += 20.0  # "old" is now worth 3 / 4
+        popularity.record("new", "q-new")
+        assert [(key, query) for key, query, _ in popularity.top(5)] == [
+            ("new", "q-new"),
+            ("old", "q-old"),
+        ]
+        assert popularity.top(5)[1][2] == pytest.approx(0.75)
+        assert [key for key, _, _ in popularity.top(1)] == ["new"]
+
+    def test_forgets_the_least_popular_past_the_limit(self):
+        popularity = QueryPopularity(half_life=60.0, max_queries=4, clock=FakeClock())
+        for i in range(4):
+            for _ in range(i + 1):
+                popularity.record(i, i)
+        for i in range(4, 10):  # one hit each
+            popularity.record(i, i)
+        # Pruned back to four whenever it grows past six; the hits decide who stays.
+        assert len(popularity) == 4
+        assert {1, 2, 3} <= {key for key, _, _ in popularity.top(10)}
+        popularity.forget(3)
+        assert 3 not in {key for key, _, _ in popularity.top(10)}
+
+
+def _record(popularity, key, query, hits=2):
+    for _ in range(hits):
+        popularity.record(key, query)
+
+
+def _warmer(refresh, *, idle=lambda: True, ttl=60.0, refresh_ahead=10.0):
+    clock = FakeClock()
+    cache = ResultCache(ttl, 1_000_000, clock=clock)
+    popularity = QueryPopularity(half_life=3600.0, clock=clock)
+    budget = RequestBudget(TokenBucketRateLimiter(calls=10, period=1.0), owner="the cache warmer")
+    warmer = CacheWarmer(
+        cache,
+        popularity,
+        refresh,
+        budget=budget,
+        interval=0.01,
+        top_n=10,
+        refresh_ahead=refresh_ahead,
+        idle=idle,
+    )
+    return warmer, cache, popularity, clock
+
+
+class TestCacheWarmer:
+    def test_refreshes_missing_and_expiring_entries_only(self):
+        refreshed = []
+
+        def refresh(query):
+            refreshed.append((query, current_request_budget().owner))
+            return {"success": True, "query": query}
+
+        warmer, cache, popularity, clock = _warmer(refresh)
+        for key in ("a", "b", "c"):
+            _record(popularity, key, key.upper(), hits=3)
+        cache.put("a", {"success": True})
+        cache.put("b", {"success": True})
+        clock.now += 55.0  # "a" and "b" expire in 5 s
+        cache.put("b", {"success": True})  # "b" is fresh again
+
+        assert warmer.run_once() == 2
+        assert sorted(refreshed) == [("A", "the cache warmer"), ("C", "the cache warmer")]
+        assert cache.get("c") == {"success": True, "query": "C"}
+        assert cache.expires_in("a") == pytest.approx(60.0)
+
+    def test_stops_when_interactive_traffic_needs_capacity(self):
+        calls = []
+        busy = iter([True, False])
+        warmer, _, popularity, _ = _warmer(
+            lambda q: calls.append(q) or {"success": True}, idle=lambda: next(busy)
+        )
+        _record(popularity, "a", "A")
+        _record(popularity, "b", "B")
+        assert warmer.run_once() == 1
+        stats = warmer.stats()
+        assert (stats.rounds, stats.rounds_cut_short, stats.refreshed) == (1, 1, 1)
+
+    def test_failures_are_counted_and_passed_queries_dropped(self):
+        def refresh(query):
+            if query == "boom":
+                raise RuntimeError("boom")
+            if query == "past":
+                return None
+            return {"success": False, "error": "Search failed"}
+
+        warmer, cache, popularity, _ = _warmer(refresh)
+        for query in ("boom", "past", "error"):
+            _record(popularity, query, query)
+        assert warmer.run_once() == 0
+        stats = warmer.stats()
+        assert (stats.failed, stats.refreshed, stats.tracked) == (2, 0, 2)
+        assert len(cache) == 0
+
+    def test_queries_asked_once_are_not_warmed(self):
+        refreshed = []
+        warmer, _, popularity, _ = _warmer(lambda q: refreshed.append(q) or {"success": True})
+        _record(popularity, "once", "ONCE", hits=1)
+        _record(popularity, "twice", "TWICE")
+        assert warmer.run_once() == 1
+        assert refreshed == ["TWICE"]
+
+    def test_failing_queries_back_off(self):
+        attempts = []
+
+        def refresh(query):
+            attempts.append(query)
+            return {"success": False, "error": "Search failed"}
+
+        warmer, _, popularity, _ = _warmer(refresh)
+        _record(popularity, "bad", "BAD")
+        for _ in range(12):
+            warmer.run_once()
+        # Tried in rounds 0, 2 and 6 of 0-11: 1, then 3, then 7 rounds are skipped.
+        assert len(attempts) == 3
+        assert warmer.stats().failed == 3
+
+    def test_background_thread_runs_rounds_until_stopped(self):
+        done = threading.Event()
+
+        def refresh(query):
+            done.set()
+            return {"success": True}
+
+        warmer, _, popularity, _ = _warmer(refresh)
+        _record(popularity, "a", "A")
+        warmer.start()
+        assert done.wait(5)
+        warmer.stop(timeout=5)
+        assert warmer.stats().refreshed >= 1
+
+
+class TestServerIntegration:
+    @pytest.mark.asyncio
+    async def test_tool_calls_count_towards_popularity(self):
+
+        popularity = QueryPopularity(half_life=3600.0)
+        with (
+            patch.object(server, "QUERY_POPULARITY", popularity),
+            patch.object(server, "RESULT_CACHE", ResultCache(ttl=60, max_bytes=1_000_000)),
+            patch.object(server, "_execute_flight_search", empty_flight_search),
+        ):
+            async with Client(server.mcp) as client:
+                await client.call_tool("search_flights", FLIGHT_ARGS)
+                await client.call_tool("search_flights", {**FLIGHT_ARGS, "origin": "jfk"})
+                await client.call_tool("search_flights", {**FLIGHT_ARGS, "destination": "CDG"})
+
+        (first_key, first_query, score), (_, _, other) = popularity.top(2)
+        assert first_key == server._cache_key(first_query)
+        assert first_query.destination == "LHR"
+        assert (round(score), round(other)) == (2, 1)
+
+    def test_refresh_drops_searches_whose_date_has_passed(self):
+        past = server.FlightSearchParams(
+            origin="JFK", destination="LHR", departure_date="2000-01-01"
+        )
+        assert server._refresh_cached(past) is None
+
+        future = server.DateSearchParams(
+            origin="JFK", destination="LHR", start_date="2099-01-01", end_date="2099-01-31"
+        )
+        with patch.object(server, "_execute_date_search", return_value={"success": True}):
+            assert server._refresh_cached(future) == {"success": True}
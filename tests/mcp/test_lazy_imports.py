@@ -0,0 +1,51 @@
+"""Tests for the MCP server's deferred imports."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from unittest.mock import patch
+
+from fli.mcp import server
+
+DEFERRED = ["fli.core", "fli.models", "fli.search.flights", "fli.search.dates", "babel"]
+
+
+def _run(code: str) -> list[str]:
+    report = f"print(json.dumps([m for m in {DEFERRED!r} if m in sys.modules]))"
+    probe = f"import json, sys\n{code}\n{report}"
+    out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+class TestDeferredImports:
+    def test_importing_the_server_skips_heavy_modules(self):
+        assert _run("import fli.mcp.server") == []
+
+    def test_warm_up_loads_them_in_the_background(self):
+        code = (
+            "import threading, fli.mcp.server as s\n"
+            "s._start_warm_up()\n"
+            "[t.join() for t in threading.enumerate() if t.name == 'fli-mcp-warm-up']"
+        )
+        assert sorted(_run(code)) == sorted(DEFERRED)
+
+    def test_search_classes_stay_available_and_patchable(self):
+        from fli.search import SearchFlights
+
+        assert server.SearchFlights is SearchFlights
+
+        class FakeSearch:
+            def search(self, filters, **kwargs):
+                return []
+
+        params = server.FlightSearchParams(
+            origin="JFK", destination="LHR", departure_date="2099-01-01"
+        )
+        with patch.object(server, "SearchFlights", FakeSearch):
+            result = server._execute_flight_search(params)
+        assert result == {"success": True, "flights": [], "count": 0, "trip_type": "ONE_WAY"}
+
+    def test_config_schema_is_built_on_first_access(self):
+        assert server.CONFIG_SCHEMA["title"] == "FlightSearchConfig"
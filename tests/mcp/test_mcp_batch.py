@@ -0,0 +1,161 @@
+"""Tests for the ``search_flights_batch`` MCP tool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client
+
+from fli.mcp import server
+from fli.mcp._tenants import Tenant
+from fli.mcp._tool_pool import ToolPool
+
+
+class FakeSearch:
+    """Stands in for ``_execute_flight_search``; records calls and peak concurrency."""
+
+    def __init__(self, latency_s: float = 0.0):
+        """Configure the simulated search latency."""
+        self.latency_s = latency_s
+        self.calls: list[str] = []
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, params, on_progress=None):
+        with self._lock:
+            self.calls.append(f"{params.origin}-{params.destination}")
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(self.latency_s)
+        finally:
+            with self._lock:
+                self.running -= 1
+        if params.destination == "XXX":
+            return {"success": False, "error": "No valid airport codes", "flights": []}
+        return {
+            "success": True,
+            "flights": [{"price": 100.0, "route": f"{params.origin}-{params.destination}"}],
+            "count": 1,
+            "trip_type": "ONE_WAY",
+        }
+
+
+def _query(origin: str, destination: str, **extra) -> dict:
+    return {"origin": origin, "destination": destination, "departure_date": "2099-01-01", **extra}
+
+
+async def _call_batch(fake: FakeSearch, queries: list[dict], **client_kwargs) -> dict:
+    with (
+        patch.object(server, "RESULT_CACHE", None),
+        patch.object(server, "_execute_flight_search", fake),
+    ):
+        async with Client(server.mcp) as client:
+            result = await client.call_tool(
+                "search_flights_batch", {"queries": queries}, **client_kwargs
+            )
+    return result.data
+
+
+class TestSearchFlightsBatch:
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        fake = FakeSearch()
+        queries = [_query("JFK", "LHR"), _query("SFO", "NRT"), _query("BOS", "CDG")]
+        data = await _call_batch(fake, queries)
+
+        assert data["success"] is True
+        assert data["count"] == 3
+        assert [entry["index"] for entry in data["results"]] == [0, 1, 2]
+        routes = [entry["flights"][0]["route"] for entry in data["results"]]
+        assert routes == ["JFK-LHR", "SFO-NRT", "BOS-CDG"]
+        assert all(entry["elapsed_ms"] >= 0 for entry in data["results"])
+        assert data["elapsed_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_identical_queries_are_searched_once(self):
+        fake = FakeSearch()
+        queries = [
+            _query("JFK", "LHR"),
+            _query("SFO", "NRT"),
+            _query("jfk", "lhr", cabin_class="economy"),
+        ]
+        data = await _call_batch(fake, queries)
+
+        assert sorted(fake.calls) == ["JFK-LHR", "SFO-NRT"]
+        assert data["unique_queries"] == 2
+        duplicate = data["results"][2]
+        assert duplicate["duplicate_of"] == 0
+        assert duplicate["flights"] == data["results"][0]["flights"]
+        assert "duplicate_of" not in data["results"][0]
+
+    @pytest.mark.asyncio
+    async def test_queries_run_concurrently_within_the_batch_window(self):
+        fake = FakeSearch(latency_s=0.05)
+        queries = [_query("JFK", code) for code in ("LHR", "CDG", "NRT", "SFO", "LAX", "MIA")]
+        with patch.object(server.CONFIG, "batch_max_in_flight", 3):
+            data = await _call_batch(fake, queries)
+
+        assert data["succeeded"] == 6
+        assert fake.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_queries_wait_for_the_tenants_other_searches(self):
+        fake = FakeSearch(latency_s=0.05)
+        pool = ToolPool(max_workers=4, max_queued=10, max_per_tenant=2)
+        release = threading.Event()
+        tenant = Tenant("key:abc", "this API key")
+        queries = [_query("JFK", code) for code in ("LHR", "CDG", "NRT")]
+        with (
+            patch.object(server, "TOOL_POOL", pool),
+            patch.object(server, "identify_tenant", return_value=tenant),
+        ):
+            # The tenant's own single search holds one of its two slots.
+            other = asyncio.ensure_future(pool.run(release.wait, 5, tenant=tenant.id))
+            await asyncio.sleep(0.05)
+            batch = asyncio.ensure_future(_call_batch(fake, queries))
+            await asyncio.sleep(0.2)
+            release.set()
+            data = await batch
+            await other
+
+        assert data["succeeded"] == 3
+        assert fake.peak == 1
+        assert pool.stats().quota_rejected == 0
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_query_does_not_fail_the_batch(self):
+        data = await _call_batch(FakeSearch(), [_query("JFK", "LHR"), _query("JFK", "XXX")])
+
+        assert data["success"] is True
+        assert data["succeeded"] == 1
+        assert data["results"][1]["success"] is False
+        assert "No valid airport codes" in data["results"][1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batches(self):
+        fake = FakeSearch()
+        with patch.object(server.CONFIG, "batch_max_queries", 2):
+            data = await _call_batch(fake, [_query("JFK", "LHR")] * 3)
+
+        assert data["success"] is False
+        assert "maximum 2" in data["error"]
+        assert fake.calls == []
+
+    @pytest.mark.asyncio
+    async def test_reports_progress_per_distinct_query(self):
+        progress = []
+
+        async def on_progress(value, total, message):
+            progress.append((value, total))
+
+        queries = [_query("JFK", "LHR"), _query("JFK", "LHR"), _query("SFO", "NRT")]
+        await _call_batch(FakeSearch(), queries, progress_handler=on_progress)
+
+        assert progress == [(1, 2), (2, 2)]
@@ -0,0 +1,128 @@
+"""Tests for the MCP server's shared result cache."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client
+
+from fli.mcp import server
+from fli.mcp.server import DateSearchParams, FlightSearchParams, _cache_key
+from fli.search import ResultCache
+from tests.mcp.conftest import FLIGHT_ARGS, empty_flight_result
+
+
+class TestCacheKey:
+    def test_equivalent_flight_params_share_a_key(self):
+        a = FlightSearchParams(
+            origin="jfk, LGA",
+            destination="LHR",
+            departure_date="2099-01-01",
+            airlines=["ba", "AA"],
+            cabin_class="economy",
+        )
+        b = FlightSearchParams(
+            origin="LGA,JFK",
+            destination="lhr",
+            departure_date="2099-01-01",
+            airlines=["AA", "BA"],
+            cabin_class="ECONOMY",
+        )
+        assert _cache_key(a) == _cache_key(b)
+
+    def test_different_queries_differ(self):
+        base = FLIGHT_ARGS
+        assert _cache_key(FlightSearchParams(**base)) != _cache_key(
+            FlightSearchParams(**base, return_date="2099-01-08")
+        )
+        assert _cache_key(FlightSearchParams(**base)) != _cache_key(
+            FlightSearchParams(**base, passengers=2)
+        )
+
+    def test_one_way_date_search_ignores_trip_duration(self):
+        base = {
+            "origin": "JFK",
+            "destination": "LHR",
+            "start_date": "2099-01-01",
+            "end_date": "2099-01-31",
+        }
+        assert _cache_key(DateSearchParams(**base, trip_duration=3)) == _cache_key(
+            DateSearchParams(**base, trip_duration=7)
+        )
+        assert _cache_key(DateSearchParams(**base, trip_duration=3, is_round_trip=True)) != (
+            _cache_key(DateSearchParams(**base, trip_duration=7, is_round_trip=True))
+        )
+
+    def test_flight_and_date_params_never_collide(self):
+        flight = _cache_key(
+            FlightSearchParams(origin="JFK", destination="LHR", departure_date="2099-01-01")
+        )
+        dates = _cache_key(
+            DateSearchParams(
+                origin="JFK", destination="LHR", start_date="2099-01-01", end_date="2099-01-02"
+            )
+        )
+        assert flight[0] != dates[0]
+
+
+class TestToolCaching:
+    @pytest.mark.asyncio
+    async def test_repeat_calls_are_served_from_the_cache(self):
+        calls = []
+
+        def search(params, on_progress=None):
+            calls.append(params)
+            return empty_flight_result()
+
+        cache = ResultCache(ttl=60, max_bytes=1_000_000)
+        first = FLIGHT_ARGS
+        second = {**first, "origin": "jfk"}
+        with (
+            patch.object(server, "RESULT_CACHE", cache),
+            patch.object(server, "_execute_flight_search", search),
+        ):
+            async with Client(server.mcp) as client:
+                await client.call_tool("search_flights", first)
+                result = await client.call_tool("search_flights", second)
+                resource = await client.read_resource("resource://fli-mcp/configuration")
+
+        assert len(calls) == 1
+        assert result.data["success"] is True
+        stats = json.loads(resource[0].text)["cache"]
+        assert stats["enabled"] is True
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        calls = []
+
+        def search(params, on_progress=None):
+            calls.append(params)
+            return {"success": False, "error": "Search failed: boom", "dates": []}
+
+        cache = ResultCache(ttl=60, max_bytes=1_000_000)
+        args = {
+            "origin": "JFK",
+            "destination": "LHR",
+            "start_date": "2099-01-01",
+            "end_date": "2099-01-10",
+        }
+        with (
+            patch.object(server, "RESULT_CACHE", cache),
+            patch.object(server, "_execute_date_search", search),
+        ):
+            async with Client(server.mcp) as client:
+                await client.call_tool("search_dates", args)
+                await client.call_tool("search_dates", args)
+
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_is_reported(self):
+        with patch.object(server, "RESULT_CACHE", None):
+            payload = json.loads(server.configuration_resource())
+        assert payload["cache"] == {"enabled": False}
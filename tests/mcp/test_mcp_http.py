@@ -14,7 +14,13 @@ from fastmcp import Client
 
 from fli.mcp.server import mcp
 
-EXPECTED_TOOLS = {"search_flights", "search_dates", "find_airports"}
+EXPECTED_TOOLS = {
+    "search_flights",
+    "search_flights_batch",
+    "search_dates",
+    "get_results_page",
+    "find_airports",
+}
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,79 @@
+"""Tests for the MCP server's Prometheus ``/metrics`` endpoint."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client
+from starlette.testclient import TestClient
+
+from fli.mcp import server
+from fli.mcp._metrics import CONTENT_TYPE, Exposition, ToolMetrics
+from fli.search import HistogramSnapshot, ResultCache
+from tests.mcp.conftest import FLIGHT_ARGS, empty_flight_search
+
+
+class TestExposition:
+    def test_histogram_buckets_are_cumulative(self):
+        out = Exposition()
+        snapshot = HistogramSnapshot(
+            bounds=(0.1, 1.0, float("inf")), counts=(2, 0, 1), count=3, sum=4.5
+        )
+        out.histogram("x_seconds", "Help.", snapshot, {"tool": "t"})
+        assert out.render().splitlines() == [
+            "# HELP x_seconds Help.",
+            "# TYPE x_seconds histogram",
+            'x_seconds_bucket{tool="t",le="0.1"} 2',
+            'x_seconds_bucket{tool="t",le="1"} 2',
+            'x_seconds_bucket{tool="t",le="+Inf"} 3',
+            'x_seconds_sum{tool="t"} 4.5',
+            'x_seconds_count{tool="t"} 3',
+        ]
+
+    def test_samples_of_one_name_share_help_and_type(self):
+        out = Exposition()
+        out.counter("y_total", "Help.", 1, {"k": "a"})
+        out.counter("y_total", "Help.", 2, {"k": 'b"\n'})
+        text = out.render()
+        assert text.count("# TYPE y_total counter") == 1
+        assert 'y_total{k="b\\"\\n"} 2' in text
+
+
+class TestToolMetrics:
+    @pytest.mark.asyncio
+    async def test_calls_are_recorded_by_tool_and_outcome(self):
+
+        metrics = ToolMetrics()
+        with (
+            patch.object(server, "TOOL_METRICS", metrics),
+            patch.object(server, "RESULT_CACHE", ResultCache(ttl=60, max_bytes=1_000_000)),
+            patch.object(server, "_execute_flight_search", empty_flight_search),
+        ):
+            async with Client(server.mcp) as client:
+                await client.call_tool("search_flights", FLIGHT_ARGS)
+                await client.call_tool("search_flights", FLIGHT_ARGS)
+
+        counts = {key: snapshot.count for key, snapshot in metrics.snapshot().items()}
+        assert counts == {("search_flights", "cached"): 1, ("search_flights", "ok"): 1}
+
+
+class TestMetricsEndpoint:
+    def test_disabled_by_default(self):
+        with patch.object(server.CONFIG, "metrics", False):
+            response = TestClient(server.mcp.http_app()).get("/metrics")
+        assert response.status_code == 404
+
+    def test_serves_prometheus_text_when_enabled(self):
+        with patch.object(server.CONFIG, "metrics", True):
+            response = TestClient(server.mcp.http_app()).get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        for family in (
+            "fli_mcp_tool_pool_workers",
+            "fli_google_retries_total",
+            "fli_rate_limiter_wait_seconds",
+            "fli_executor_workers",
+            "fli_parse_errors_total",
+        ):
+            assert f"# TYPE {family} " in response.text
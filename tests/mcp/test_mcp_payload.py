@@ -0,0 +1,168 @@
+"""Tests for field projection, table encoding and pagination of MCP responses."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client
+
+from fli.mcp import server
+from fli.mcp._payload import CursorError, PageStore, project, tabulate
+from tests.mcp.conftest import FLIGHT_ARGS
+
+FLIGHTS = [
+    {
+        "price": 100.0 + i,
+        "currency": "USD",
+        "legs": [
+            {"flight_number": f"{i}1", "airline_code": "AA", "aircraft": "A320"},
+            {"flight_number": f"{i}2", "airline_code": "BA"},
+        ],
+        **({"layovers": [{"airport": "ORD", "duration": 90}]} if i % 2 else {}),
+    }
+    for i in range(5)
+]
+
+
+class TestProject:
+    def test_keeps_requested_fields_in_order(self):
+        assert project(FLIGHTS[:1], ["currency", "price"]) == [{"currency": "USD", "price": 100.0}]
+
+    def test_dotted_paths_reach_into_lists(self):
+        projected = project(FLIGHTS[:1], ["price", "legs.flight_number"])
+        assert projected == [
+            {"price": 100.0, "legs": [{"flight_number": "01"}, {"flight_number": "02"}]}
+        ]
+
+    def test_whole_field_wins_over_a_path_inside_it(self):
+        for fields in (["legs", "legs.flight_number"], ["legs.flight_number", "legs"]):
+            assert project(FLIGHTS[:1], fields) == [{"legs": FLIGHTS[0]["legs"]}]
+
+    def test_missing_fields_are_skipped(self):
+        assert project(FLIGHTS[:2], ["layovers.airport"]) == [
+            {},
+            {"layovers": [{"airport": "ORD"}]},
+        ]
+
+
+class TestTabulate:
+    def test_columns_are_the_union_of_keys(self):
+        table = tabulate(FLIGHTS[:2])
+        assert table["columns"] == ["price", "currency", "legs", "layovers"]
+        assert table["rows"][0][3] is None
+
+    def test_lists_of_objects_get_subcolumns(self):
+        table = tabulate(FLIGHTS[:2])
+        assert table["subcolumns"]["legs"] == ["flight_number", "airline_code", "aircraft"]
+        assert table["rows"][1][2] == [["11", "AA", "A320"], ["12", "BA", None]]
+        assert table["rows"][1][3] == [["ORD", 90]]
+
+    def test_table_is_smaller_than_records(self):
+        assert len(json.dumps(tabulate(FLIGHTS))) < len(json.dumps(FLIGHTS))
+
+
+class TestPageStore:
+    def test_walks_all_pages_with_cursors(self):
+        store = PageStore(ttl=60, max_bytes=1 << 20)
+        page = store.first_page(FLIGHTS, page_size=2, fields=["price"], key="flights")
+        prices = [f["price"] for f in page["flights"]]
+        assert (page["count"], page["offset"], page["total"]) == (2, 0, 5)
+        while page["next_cursor"]:
+            page = store.page(page["next_cursor"])
+            prices += [f["price"] for f in page["flights"]]
+        assert prices == [f["price"] for f in FLIGHTS]
+        assert page["count"] == 1
+
+    def test_single_page_is_not_stored(self):
+        store = PageStore(ttl=60, max_bytes=1 << 20)
+        page = store.first_page(FLIGHTS, page_size=10)
+        assert page["next_cursor"] is None
+        assert store.stats().entries == 0
+
+    def test_large_lists_are_evicted_within_the_budget(self):
+        store = PageStore(ttl=60, max_bytes=200_000)
+        records = [{"name": "x" * 1000} for _ in range(50)]
+        for _ in range(20):
+            store.first_page(records, page_size=10)
+        stats = store.stats()
+        assert stats.bytes <= 200_000
+        assert stats.evictions > 0
+        assert stats.entries < 20
+
+    def test_expired_and_bad_cursors_raise(self):
+        now = [0.0]
+        store = PageStore(ttl=60, max_bytes=1 << 20)
+        store._cache._clock = lambda: now[0]
+        cursor = store.first_page(FLIGHTS, page_size=2)["next_cursor"]
+        for bad in ("nonsense", cursor.replace(":2", ":x"), cursor.replace(":2", ":99")):
+            with pytest.raises(CursorError):
+                store.page(bad)
+        now[0] = 61
+        with pytest.raises(CursorError, match="expired"):
+            store.page(cursor)
+
+
+def _fake_search(params, on_progress=None):
+    return {"success": True, "flights": FLIGHTS, "count": len(FLIGHTS), "trip_type": "ONE_WAY"}
+
+
+ARGS = FLIGHT_ARGS
+
+
+class TestSearchToolShaping:
+    @pytest.mark.asyncio
+    async def test_default_response_is_unchanged(self):
+        with (
+            patch.object(server, "RESULT_CACHE", None),
+            patch.object(server, "_execute_flight_search", _fake_search),
+        ):
+            async with Client(server.mcp) as client:
+                data = (await client.call_tool("search_flights", ARGS)).data
+        assert data["flights"] == FLIGHTS
+        assert "next_cursor" not in data
+
+    @pytest.mark.asyncio
+    async def test_pages_keep_fields_and_format(self):
+        with (
+            patch.object(server, "RESULT_CACHE", None),
+            patch.object(server, "PAGE_STORE", PageStore(ttl=60, max_bytes=1 << 20)),
+            patch.object(server, "_execute_flight_search", _fake_search),
+        ):
+            async with Client(server.mcp) as client:
+                first = await client.call_tool(
+                    "search_flights",
+                    {
+                        **ARGS,
+                        "fields": ["price", "legs.flight_number"],
+                        "format": "table",
+                        "page_size": 3,
+                    },
+                )
+                second = await client.call_tool(
+                    "get_results_page", {"cursor": first.data["next_cursor"]}
+                )
+                stale = await client.call_tool("get_results_page", {"cursor": "gone:3"})
+
+        flights = first.data["flights"]
+        assert flights["columns"] == ["price", "legs"]
+        assert flights["subcolumns"] == {"legs": ["flight_number"]}
+        assert first.data["trip_type"] == "ONE_WAY"
+        assert (first.data["count"], first.data["total"]) == (3, 5)
+        page = second.data
+        assert page["success"] is True and page["next_cursor"] is None
+        assert page["flights"]["rows"] == [[103.0, [["31"], ["32"]]], [104.0, [["41"], ["42"]]]]
+        assert stale.data["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_cached_response_is_not_modified_by_shaping(self):
+        cache = server.ResultCache(60, 1 << 20)
+        with (
+            patch.object(server, "RESULT_CACHE", cache),
+            patch.object(server, "_execute_flight_search", _fake_search),
+        ):
+            async with Client(server.mcp) as client:
+                await client.call_tool("search_flights", {**ARGS, "fields": ["price"]})
+                data = (await client.call_tool("search_flights", ARGS)).data
+        assert data["flights"] == FLIGHTS
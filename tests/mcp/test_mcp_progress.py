@@ -0,0 +1,129 @@
+"""Tests for MCP progress notifications and partial result batches."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client
+
+from fli.mcp import server
+from fli.models import Airline, Airport, FlightLeg, FlightResult
+from fli.search import DatePrice, SearchProgress
+
+
+def _flight(number: str, price: float) -> FlightResult:
+    departure = datetime.now().replace(microsecond=0) + timedelta(days=30)
+    return FlightResult(
+        legs=[
+            FlightLeg(
+                airline=Airline.AA,
+                flight_number=number,
+                departure_airport=Airport.JFK,
+                arrival_airport=Airport.LHR,
+                departure_datetime=departure,
+                arrival_datetime=departure + timedelta(hours=7),
+                duration=420,
+            )
+        ],
+        price=price,
+        currency="USD",
+        duration=420,
+        stops=0,
+    )
+
+
+def _round_trip_search(params, on_progress=None):
+    outbound = [_flight("1", 500), _flight("2", 650)]
+    on_progress(SearchProgress("outbound", 1, 3, "JFK-LHR", outbound))
+    for i, out in enumerate(outbound, start=2):
+        on_progress(SearchProgress("expansion", i, 3, "after AA", [(out, _flight("9", 0))]))
+    return {"success": True, "flights": [], "count": 0, "trip_type": "ROUND_TRIP"}
+
+
+def _date_search(params, on_progress=None):
+    day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    chunk = [DatePrice(date=(day + timedelta(days=40),), price=123.0, currency="USD")]
+    on_progress(SearchProgress("chunk", 1, 2, "2099-01-01..2099-03-01", chunk))
+    on_progress(SearchProgress("chunk", 2, 2, "2099-03-02..2099-04-30", []))
+    return {"success": True, "dates": [], "count": 0, "trip_type": "ONE_WAY"}
+
+
+FLIGHT_ARGS = {
+    "origin": "JFK",
+    "destination": "LHR",
+    "departure_date": "2099-01-01",
+    "return_date": "2099-01-08",
+}
+DATE_ARGS = {
+    "origin": "JFK",
+    "destination": "LHR",
+    "start_date": "2099-01-01",
+    "end_date": "2099-04-30",
+}
+
+
+class TestProgressNotifications:
+    @pytest.mark.asyncio
+    async def test_progress_reaches_the_client_before_the_response(self):
+        progress = []
+
+        async def on_progress(value, total, message):
+            progress.append((value, total, message))
+
+        with (
+            patch.object(server, "RESULT_CACHE", None),
+            patch.object(server, "_execute_flight_search", _round_trip_search),
+        ):
+            async with Client(server.mcp) as client:
+                result = await client.call_tool(
+                    "search_flights", FLIGHT_ARGS, progress_handler=on_progress
+                )
+
+        assert result.data["success"] is True
+        assert [(value, total) for value, total, _ in progress] == [(1, 3), (2, 3), (3, 3)]
+        assert progress[0][2] == "outbound 1/3: JFK-LHR"
+
+    @pytest.mark.asyncio
+    async def test_partial_results_are_opt_in_log_batches(self):
+        logs = []
+
+        async def on_log(message):
+            logs.append(message)
+
+        with (
+            patch.object(server, "RESULT_CACHE", None),
+            patch.object(server, "_execute_date_search", _date_search),
+        ):
+            async with Client(server.mcp, log_handler=on_log) as client:
+                await client.call_tool("search_dates", DATE_ARGS)
+                assert logs == []
+                await client.call_tool("search_dates", {**DATE_ARGS, "partial_results": True})
+
+        # Only the chunk with prices produces a batch.
+        assert len(logs) == 1
+        assert logs[0].logger == "fli.partial_results"
+        batch = logs[0].data["extra"]
+        assert (batch["kind"], batch["completed"], batch["total"]) == ("chunk", 1, 2)
+        assert batch["results"][0]["price"] == 123.0
+
+    @pytest.mark.asyncio
+    async def test_flight_batches_serialise_itineraries(self):
+        logs = []
+
+        async def on_log(message):
+            logs.append(message)
+
+        with (
+            patch.object(server, "RESULT_CACHE", None),
+            patch.object(server, "_execute_flight_search", _round_trip_search),
+        ):
+            async with Client(server.mcp, log_handler=on_log) as client:
+                await client.call_tool("search_flights", {**FLIGHT_ARGS, "partial_results": True})
+
+        kinds = [log.data["extra"]["kind"] for log in logs]
+        assert kinds == ["outbound", "expansion", "expansion"]
+        itinerary = logs[1].data["extra"]["results"][0]
+        assert itinerary["price"] == 500
+        assert len(itinerary["legs"]) == 2
@@ -0,0 +1,78 @@
+"""Tests for tenant identity and per-tenant request budgets."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from fli.mcp import _tenants
+from fli.mcp._tenants import Tenant, TenantBudgets, identify_tenant
+
+
+def _request(headers: dict[str, str], host: str | None = "10.0.0.7"):
+    client = SimpleNamespace(host=host) if host else None
+    return patch.object(
+        _tenants, "get_http_request", return_value=SimpleNamespace(headers=headers, client=client)
+    )
+
+
+class TestIdentifyTenant:
+    def test_api_key_header_wins_and_is_hashed(self):
+        with _request({"x-api-key": "secret", "mcp-session-id": "abc"}):
+            tenant = identify_tenant("X-API-Key")
+        with _request({"x-api-key": "secret"}):
+            again = identify_tenant("x-api-key")
+        assert tenant.id.startswith("key:")
+        assert "secret" not in tenant.id
+        assert tenant == again
+        assert tenant.owner == "this API key"
+
+    def test_requests_without_the_header_share_one_tenant(self):
+        with _request({"mcp-session-id": "abc"}):
+            first = identify_tenant("x-api-key")
+        with _request({"mcp-session-id": "def"}, host="10.0.0.8"):
+            second = identify_tenant("x-api-key")
+        assert first == second == Tenant("anonymous", "requests without an API key")
+
+    def test_without_a_header_falls_back_to_the_session_then_the_address(self):
+        with _request({"x-api-key": "secret", "mcp-session-id": "abc"}):
+            assert identify_tenant("") == Tenant("session:abc", "this session")
+        with _request({}):
+            assert identify_tenant("").id == "address:10.0.0.7"
+        with _request({}, host=None):
+            assert identify_tenant("") is None
+
+    def test_calls_outside_http_have_no_tenant(self):
+        assert identify_tenant("x-api-key") is None
+
+
+class TestTenantBudgets:
+    def test_one_budget_per_tenant_with_a_share_of_the_rate(self):
+        budgets = TenantBudgets(share=0.25, max_wait=5.0)
+        a, b = Tenant("session:a", "this session"), Tenant("key:b", "this API key")
+        budget = budgets.budget(a)
+        assert budgets.budget(a) is budget
+        assert budgets.budget(b) is not budget
+        assert budget.limiter.rate == pytest.approx(2.5)
+        assert (budget.max_wait, budget.owner) == (5.0, "this session")
+        assert len(budgets) == 2
+
+    def test_least_recently_used_budget_is_dropped(self):
+        budgets = TenantBudgets(share=0.5, max_wait=1.0, max_tenants=2)
+        a, b, c = (Tenant(name, "this session") for name in "abc")
+        first_a = budgets.budget(a)
+        budgets.budget(b)
+        budgets.budget(a)
+        budgets.budget(c)
+        assert len(budgets) == 2
+        assert budgets.budget(a) is first_a
+        assert budgets.budget(b) is not None
+        assert len(budgets) == 2
+
+    def test_rejects_bad_share(self):
+        with pytest.raises(ValueError):
+            TenantBudgets(share=0, max_wait=1.0)
+        with pytest.raises(ValueError):
+            TenantBudgets(share=1.5, max_wait=1.0)
@@ -0,0 +1,310 @@
+"""Tests for the bounded MCP tool pool, its tenant quotas and the search tools that use it."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client
+
+from fli.mcp import server
+from fli.mcp._tenants import Tenant
+from fli.mcp._tool_pool import TenantQuotaError, ToolPool, ToolPoolFullError
+from fli.search._concurrency import current_request_budget
+from tests.mcp.conftest import FLIGHT_ARGS, empty_flight_result
+
+REQUEST_ID = contextvars.ContextVar("REQUEST_ID", default=None)
+
+
+class TestToolPool:
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self):
+        pool = ToolPool(max_workers=2, max_queued=0)
+        loop_thread = threading.current_thread()
+        worker = await pool.run(threading.current_thread)
+        assert worker is not loop_thread
+        assert worker.name.startswith("fli-mcp-tool")
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrency_and_queues(self):
+        pool = ToolPool(max_workers=3, max_queued=10)
+        lock = threading.Lock()
+        running = peak = 0
+
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(pool.run(work) for _ in range(12)))
+        stats = pool.stats()
+        assert peak == 3
+        assert (stats.completed, stats.rejected, stats.running, stats.queued) == (12, 0, 0, 0)
+        assert 3 <= stats.peak_in_flight <= 12
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self):
+        pool = ToolPool(max_workers=1, max_queued=1)
+        release = threading.Event()
+        first = asyncio.ensure_future(pool.run(release.wait, 5))
+        second = asyncio.ensure_future(pool.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        assert pool.stats().queued == 1
+
+        with pytest.raises(ToolPoolFullError, match="Server busy"):
+            await pool.run(release.wait, 5)
+        release.set()
+        assert await asyncio.gather(first, second) == [True, True]
+        assert pool.stats().rejected == 1
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_drops_its_queued_call(self):
+        pool = ToolPool(max_workers=1, max_queued=5)
+        release = threading.Event()
+        calls = []
+        blocker = asyncio.ensure_future(pool.run(release.wait, 5))
+        queued = asyncio.ensure_future(pool.run(calls.append, "ran"))
+        await asyncio.sleep(0.05)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await blocker
+        assert calls == []
+        assert pool.stats().queued == 0
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_context_variables_reach_the_worker(self):
+        pool = ToolPool(max_workers=1, max_queued=0)
+        REQUEST_ID.set("abc")
+        assert await pool.run(REQUEST_ID.get) == "abc"
+        pool.shutdown()
+
+    def test_rejects_bad_bounds(self):
+        with pytest.raises(ValueError):
+            ToolPool(max_workers=0, max_queued=0)
+        with pytest.raises(ValueError):
+            ToolPool(max_workers=1, max_queued=-1)
+        with pytest.raises(ValueError):
+            ToolPool(max_workers=1, max_queued=0, max_per_tenant=0)
+
+
+class TestTenants:
+    @pytest.mark.asyncio
+    async def test_waiting_calls_are_started_one_tenant_at_a_time(self):
+        pool = ToolPool(max_workers=1, max_queued=10)
+        release = threading.Event()
+        order = []
+        blocker = asyncio.ensure_future(pool.run(release.wait, 5, tenant="a"))
+        await asyncio.sleep(0.05)
+        calls = [
+            asyncio.ensure_future(pool.run(order.append, name, tenant=name[0]))
+            for name in ("a1", "a2", "a3", "b1", "c1")
+        ]
+        await asyncio.sleep(0.05)
+        assert pool.stats().tenants == 3
+
+        release.set()
+        await asyncio.gather(blocker, *calls)
+        assert order == ["a1", "b1", "c1", "a2", "a3"]
+        assert pool.stats().tenants == 0
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_tenant_over_its_quota_is_rejected(self):
+        pool = ToolPool(max_workers=4, max_queued=10, max_per_tenant=2)
+        release = threading.Event()
+        held = [asyncio.ensure_future(pool.run(release.wait, 5, tenant="a")) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(TenantQuotaError, match=r"Quota exceeded.*2 searches in flight"):
+            await pool.run(release.wait, 5, tenant="a")
+        # Other tenants and untagged calls are unaffected.
+        assert await pool.run(len, "ok", tenant="b") == 2
+        assert await pool.run(len, "ok") == 2
+        release.set()
+        await asyncio.gather(*held)
+        stats = pool.stats()
+        assert (stats.quota_rejected, stats.rejected, stats.completed) == (1, 0, 4)
+        assert await pool.run(len, "again", tenant="a") == 5
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_call_can_wait_for_its_tenants_quota(self):
+        pool = ToolPool(max_workers=4, max_queued=10, max_per_tenant=1)
+        release = threading.Event()
+        held = asyncio.ensure_future(pool.run(release.wait, 5, tenant="a"))
+        await asyncio.sleep(0.05)
+
+        waiting = asyncio.ensure_future(pool.run(len, "ok", tenant="a", wait_for_quota=True))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        assert pool.stats().queued == 0
+        release.set()
+        assert await waiting == 2
+        await held
+        assert pool.stats().quota_rejected == 0
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_quota_waiter_does_not_block_the_next(self):
+        pool = ToolPool(max_workers=4, max_queued=10, max_per_tenant=1)
+        release = threading.Event()
+        held = asyncio.ensure_future(pool.run(release.wait, 5, tenant="a"))
+        await asyncio.sleep(0.05)
+
+        cancelled = asyncio.ensure_future(pool.run(len, "no", tenant="a", wait_for_quota=True))
+        waiting = asyncio.ensure_future(pool.run(len, "ok", tenant="a", wait_for_quota=True))
+        await asyncio.sleep(0.05)
+        cancelled.cancel()
+        release.set()
+        assert await asyncio.wait_for(waiting, 5) == 2
+        await held
+        assert cancelled.cancelled()
+        pool.shutdown()
+
+
+class TestAsyncSearchTools:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_the_pool_without_blocking_the_loop(self):
+        pool = ToolPool(max_workers=4, max_queued=50)
+        lock = threading.Lock()
+        running = peak = 0
+
+        def slow_search(params, on_progress=None):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return empty_flight_result()
+
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        args = FLIGHT_ARGS
+        with (
+            patch.object(server, "TOOL_POOL", pool),
+            patch.object(server, "RESULT_CACHE", None),
+            patch.object(server, "_execute_flight_search", slow_search),
+        ):
+            beat = asyncio.ensure_future(heartbeat())
+            async with Client(server.mcp) as client:
+                results = await asyncio.gather(
+                    *(client.call_tool("search_flights", args) for _ in range(12))
+                )
+            beat.cancel()
+
+        assert all(r.data["success"] for r in results)
+        assert peak == 4
+        # Three waves of 50 ms; the loop kept ticking the whole time.
+        assert ticks >= 10
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_tenant_over_its_quota_gets_an_error_response(self):
+        pool = ToolPool(max_workers=4, max_queued=10, max_per_tenant=1)
+        release = threading.Event()
+        budgets = []
+
+        def search(params, on_progress=None):
+            budgets.append(current_request_budget())
+            release.wait(5)
+            return empty_flight_result()
+
+        args = FLIGHT_ARGS
+        tenant = Tenant("session:abc", "this session")
+        with (
+            patch.object(server, "TOOL_POOL", pool),
+            patch.object(server, "RESULT_CACHE", None),
+            patch.object(server, "_execute_flight_search", search),
+            patch.object(server, "identify_tenant", return_value=tenant),
+        ):
+            async with Client(server.mcp) as client:
+                first = asyncio.ensure_future(client.call_tool("search_flights", args))
+                await asyncio.sleep(0.1)
+                second = await client.call_tool("search_flights", {**args, "origin": "LGA"})
+                release.set()
+                first = await first
+
+        assert first.data["success"] is True
+        assert second.data["success"] is False
+        assert "Quota exceeded" in second.data["error"]
+        assert second.data["flights"] == []
+        assert [b.owner for b in budgets] == ["this session"]
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_local_calls_have_no_quota_or_request_budget(self):
+        pool = ToolPool(max_workers=4, max_queued=10, max_per_tenant=1)
+        release = threading.Event()
+        budgets = []
+
+        def search(params, on_progress=None):
+            budgets.append(current_request_budget())
+            release.wait(5)
+            return empty_flight_result()
+
+        args = FLIGHT_ARGS
+        with (
+            patch.object(server, "TOOL_POOL", pool),
+            patch.object(server, "RESULT_CACHE", None),
+            patch.object(server, "_execute_flight_search", search),
+        ):
+            async with Client(server.mcp) as client:
+                calls = [
+                    asyncio.ensure_future(client.call_tool("search_flights", {**args, "origin": o}))
+                    for o in ("JFK", "LGA", "EWR")
+                ]
+                await asyncio.sleep(0.1)
+                release.set()
+                results = await asyncio.gather(*calls)
+
+        assert all(r.data["success"] for r in results)
+        assert budgets == [None, None, None]
+        assert pool.stats().quota_rejected == 0
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_busy_server_returns_an_error_response(self):
+        pool = ToolPool(max_workers=1, max_queued=0)
+        release = threading.Event()
+        blocker = asyncio.ensure_future(pool.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+
+        args = {
+            "origin": "JFK",
+            "destination": "LHR",
+            "start_date": "2099-01-01",
+            "end_date": "2099-01-10",
+        }
+        with patch.object(server, "TOOL_POOL", pool), patch.object(server, "RESULT_CACHE", None):
+            async with Client(server.mcp) as client:
+                result = await client.call_tool("search_dates", args)
+        release.set()
+        await blocker
+
+        assert result.data["success"] is False
+        assert "Server busy" in result.data["error"]
+        assert result.data["dates"] == []
+        pool.shutdown()
@@ -0,0 +1,157 @@
+"""Test doubles shared by the search tests.
+
+Searches send every request through ``search.client.post``; the tests swap
+``client`` for one of the fakes below, which answer with canned
+``GetCalendarGraph`` / ``GetShoppingResults`` bodies.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import Any
+
+
+class FakeResponse:
+    """The subset of a ``curl_cffi`` response the search classes read."""
+
+    __slots__ = ("text", "status_code")
+
+    def __init__(self, text: str):
+        """Wrap a successful response body."""
+        self.text = text
+        self.status_code = 200
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class FakeClock:
+    """Monotonic clock the tests advance by hand."""
+
+    def __init__(self):
+        """Start at an arbitrary non-zero instant."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wrb_response(payload: Any) -> FakeResponse:
+    """Wrap ``payload`` the way Google frames a single ``wrb.fr`` chunk."""
+    return FakeResponse(")]}'\n" + json.dumps([["wrb.fr", None, json.dumps(payload)]]))
+
+
+def decode_request(kwargs: dict[str, Any]) -> list:
+    """Return the inner request list of a ``post(..., data=...)`` call."""
+    body = urllib.parse.unquote(kwargs["data"])
+    return json.loads(json.loads(body.removeprefix("f.req="))[1])
+
+
+def calendar_response(
+    start: str,
+    end: str,
+    price: Callable[[date, int], float],
+    duration: int | None = None,
+) -> FakeResponse:
+    """Price every day from ``start`` to ``end`` with ``price(day, offset)``.
+
+    With a ``duration``, each cell is a round trip returning that many days later.
+    """
+    first = date.fromisoformat(start)
+    days = (date.fromisoformat(end) - first).days + 1
+    entries = []
+    for offset in range(days):
+        day = first + timedelta(days=offset)
+        back = None if duration is None else (day + timedelta(days=duration)).isoformat()
+        entries.append([day.isoformat(), back, [[None, price(day, offset)], "USD0.000"]])
+    return wrb_response([None, None, entries])
+
+
+class CalendarClient:
+    """Answers ``GetCalendarGraph`` requests with a priced cell per day and logs them.
+
+    Args:
+        price: Fare of a day from ``(day, offset within the chunk, duration)``;
+            ``duration`` is None for one-way requests.
+        round_trip: Read the requested stay and answer with round-trip cells.
+        fail_from: Raise instead of answering for the chunk starting on this day.
+
+    """
+
+    def __init__(
+        self,
+        price: Callable[[date, int, int | None], float] = lambda day, offset, _: 200.0 + offset,
+        *,
+        round_trip: bool = False,
+        fail_from: str | None = None,
+    ):
+        """Start with an empty request log."""
+        self._price = price
+        self._round_trip = round_trip
+        self._fail_from = fail_from
+        self._lock = threading.Lock()
+        self.requests: list[tuple[int | None, str, str]] = []
+
+    @property
+    def ranges(self) -> list[tuple[str, str]]:
+        """Requested ``(start, end)`` ranges, in order."""
+        with self._lock:
+            return [(start, end) for _, start, end in self.requests]
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        formatted = decode_request(kwargs)
+        start, end = formatted[2]
+        duration = formatted[-1][0] if self._round_trip else None
+        with self._lock:
+            self.requests.append((duration, start, end))
+        if start == self._fail_from:
+            raise RuntimeError(f"chunk {start} failed")
+        return calendar_response(
+            start, end, lambda day, offset: self._price(day, offset, duration), duration
+        )
+
+
+class FixtureClient:
+    """Serves one fixture body for every request, after ``latency_s``.
+
+    Counts calls and the peak number in flight, and logs the decoded request
+    bodies. A request whose body contains ``fail_on`` raises. Cancellation is
+    honoured the way the real client's rate-limit wait does it.
+    """
+
+    def __init__(self, text: str, latency_s: float = 0.0, *, fail_on: str | None = None):
+        """Capture the fixture body, latency and an optional failure marker."""
+        self._text = text
+        self._latency_s = latency_s
+        self._fail_on = fail_on
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.calls = 0
+        self.peak_in_flight = 0
+        self.bodies: list[str] = []
+
+    def post(self, url: str, *, cancel_token=None, **kwargs: Any) -> FakeResponse:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        data = kwargs.get("data", "")
+        with self._lock:
+            self.calls += 1
+            self.bodies.append(urllib.parse.unquote(data))
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        try:
+            time.sleep(self._latency_s)
+            if self._fail_on and self._fail_on in data:
+                raise RuntimeError("simulated failure")
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        return FakeResponse(self._text)
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        return self.post(url, **kwargs)
@@ -0,0 +1,192 @@
+"""Tests for :class:`fli.search.CalendarPriceStore` and its use by ``SearchDates``."""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from fli.models import Airport, DateSearchFilters, FlightSegment, PassengerInfo, TripType
+from fli.search import CalendarPriceStore, SearchDates
+from fli.search._calendar_store import default_ttl
+from tests.search.conftest import CalendarClient, FakeClock
+
+TODAY = date(2030, 1, 1)
+
+
+def _store(**kwargs) -> tuple[CalendarPriceStore, FakeClock]:
+    clock = FakeClock()
+    return CalendarPriceStore(clock=clock, today=lambda: TODAY, **kwargs), clock
+
+
+def _days(first: int, last: int) -> list[date]:
+    return [TODAY + timedelta(days=i) for i in range(first, last + 1)]
+
+
+class TestDefaultTtl:
+    def test_grows_with_lead_time(self):
+        ttls = [default_ttl(lead) for lead in (0, 3, 4, 14, 15, 60, 61, 300)]
+        assert ttls == sorted(ttls)
+        assert ttls[0] < ttls[-1]
+
+
+class TestCalendarPriceStore:
+    def test_round_trip_of_cells(self):
+        store, _ = _store()
+        store.put("s", [(d, float(i)) for i, d in enumerate(_days(1, 5))])
+        store.put("s", [(TODAY + timedelta(days=6), None)])
+        found = store.fresh("s", TODAY + timedelta(days=1), TODAY + timedelta(days=7))
+        assert found == {**{d: float(i) for i, d in enumerate(_days(1, 5))}, _days(6, 6)[0]: None}
+
+    def test_scopes_are_isolated(self):
+        store, _ = _store()
+        store.put("a", [(d, 1.0) for d in _days(1, 3)])
+        assert store.fresh("b", *_days(1, 3)[::2]) == {}
+
+    def test_return_day_is_part_of_the_key(self):
+        store, _ = _store()
+        store.put("s", [(d, 1.0) for d in _days(1, 3)], stay_days=7)
+        first, last = _days(1, 3)[0], _days(1, 3)[-1]
+        assert len(store.fresh("s", first, last, stay_days=7)) == 3
+        assert store.fresh("s", first, last, stay_days=5) == {}
+        assert store.fresh("s", first, last) == {}
+
+    def test_near_term_cells_expire_before_far_ones(self):
+        store, clock = _store()
+        near, far = TODAY + timedelta(days=1), TODAY + timedelta(days=200)
+        store.put("s", [(near, 1.0), (far, 2.0)])
+        clock.now += default_ttl(1) + 1
+        assert store.fresh("s", near, near) == {}
+        assert store.fresh("s", far, far) == {far: 2.0}
+
+    def test_custom_ttl_policy(self):
+        store, clock = _store(ttl=lambda lead_days: 5.0)
+        store.put("s", [(TODAY, 1.0)])
+        clock.now += 4
+        assert store.fresh("s", TODAY, TODAY)
+        clock.now += 2
+        assert not store.fresh("s", TODAY, TODAY)
+
+    def test_eviction_prefers_expired_then_oldest(self):
+        store, clock = _store(max_cells=3, ttl=lambda lead_days: 10.0)
+        store.put("s", [(d, 1.0) for d in _days(0, 1)])
+        clock.now += 20  # those two are now expired
+        store.put("s", [(d, 2.0) for d in _days(2, 4)])
+        assert len(store) == 3
+        store.put("s", [(d, 3.0) for d in _days(5, 5)])
+        assert len(store) == 3
+        assert set(store.fresh("s", *_days(0, 5)[::5])) == set(_days(3, 5))
+        assert store.stats().evictions == 3
+
+    def test_stats_count_hits_and_misses(self):
+        store, _ = _store()
+        store.put("s", [(d, 1.0) for d in _days(0, 1)])
+        store.fresh("s", *_days(0, 3)[::3])
+        stats = store.stats()
+        assert (stats.cells, stats.hits, stats.misses, stats.stores) == (2, 2, 2, 2)
+
+    def test_rejects_non_positive_capacity(self):
+        with pytest.raises(ValueError):
+            CalendarPriceStore(max_cells=0)
+
+    def test_concurrent_writers(self):
+        store, _ = _store()
+
+        def write(offset: int) -> None:
+            for i in range(200):
+                store.put(f"s{offset}", [(TODAY + timedelta(days=i % 50), float(i))])
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(store) == 8 * 50
+
+
+def _calendar_client() -> CalendarClient:
+    # Round-trip cells priced ``100 × duration + offset``.
+    return CalendarClient(lambda day, offset, duration: 100.0 * duration + offset, round_trip=True)
+
+
+def _day(offset: int) -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=offset
+    )
+
+
+def _round_trip(start: int, end: int, duration: int) -> DateSearchFilters:
+    return DateSearchFilters(
+        trip_type=TripType.ROUND_TRIP,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=_day(start).strftime("%Y-%m-%d"),
+            ),
+            FlightSegment(
+                departure_airport=[[Airport.LAX, 0]],
+                arrival_airport=[[Airport.JFK, 0]],
+                travel_date=_day(start + duration).strftime("%Y-%m-%d"),
+            ),
+        ],
+        from_date=_day(start).strftime("%Y-%m-%d"),
+        to_date=_day(end).strftime("%Y-%m-%d"),
+        duration=duration,
+    )
+
+
+class TestSearchDatesWithStore:
+    def test_store_is_shared_across_instances(self):
+        store = CalendarPriceStore()
+        first_client, second_client = _calendar_client(), _calendar_client()
+        first, second = SearchDates(store=store), SearchDates(store=store)
+        first.client, second.client = first_client, second_client
+
+        filters = _round_trip(20, 40, duration=7)
+        assert first.search(filters) == second.search(filters)
+        assert first_client.ranges
+        assert second_client.ranges == []
+
+    def test_each_stay_length_gets_its_own_cells(self):
+        store = CalendarPriceStore()
+        search = SearchDates(store=store)
+        client = _calendar_client()
+        search.client = client
+        search.search(_round_trip(20, 40, duration=7))
+        calls = len(client.ranges)
+        search.search(_round_trip(20, 40, duration=5))
+        assert len(client.ranges) > calls
+
+    def test_only_stale_near_term_days_are_refreshed(self):
+        clock = FakeClock()
+        store = CalendarPriceStore(clock=clock)
+        search = SearchDates(store=store)
+        client = _calendar_client()
+        search.client = client
+        filters = _round_trip(1, 200, duration=7)
+        search.search(filters)
+        calls = len(client.ranges)
+
+        # Past the near-term TTL but well inside the far-out one.
+        clock.now += default_ttl(14) + 1
+        results = search.search(filters)
+
+        refreshed = client.ranges[calls:]
+        assert refreshed
+        assert all(start <= _day(15).strftime("%Y-%m-%d") for start, _ in refreshed)
+        assert len(results) == 200
+
+    def test_reuse_cells_is_a_deprecated_private_store(self):
+        with pytest.warns(DeprecationWarning, match="store=CalendarPriceStore"):
+            search = SearchDates(reuse_cells=True)
+        assert isinstance(search.store, CalendarPriceStore)
+        client = _calendar_client()
+        search.client = client
+        filters = _round_trip(20, 40, duration=7)
+        search.search(filters)
+        calls = len(client.ranges)
+        search.search(filters)
+        assert len(client.ranges) == calls
@@ -0,0 +1,238 @@
+"""Tests for cooperative cancellation via :class:`CancellationToken`.
+
+Cancellation has to reach every place a search can block: queued
+``parallel_map`` work, the rate limiter's wait, the HTTP client's retry
+loop, and the nested round-trip expansion fan-out.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from fli.models import (
+    Airport,
+    DateSearchFilters,
+    FlightSearchFilters,
+    FlightSegment,
+    PassengerInfo,
+    TripType,
+)
+from fli.search import (
+    CancellationToken,
+    SearchCancelledError,
+    SearchDates,
+    SearchFlights,
+    executor_stats,
+)
+from fli.search._concurrency import TokenBucketRateLimiter, parallel_imap, parallel_map
+from fli.search.client import Client
+from tests.search.conftest import FixtureClient
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def _cancel_after(token: CancellationToken, seconds: float) -> threading.Timer:
+    timer = threading.Timer(seconds, token.cancel)
+    timer.start()
+    return timer
+
+
+class TestCancellationToken:
+    def test_cancel_is_idempotent_and_runs_callbacks_once(self):
+        token = CancellationToken()
+        calls = []
+        token.add_callback(lambda: calls.append(1))
+        token.cancel()
+        token.cancel()
+        assert token.cancelled
+        assert calls == [1]
+
+    def test_callback_added_after_cancel_runs_immediately(self):
+        token = CancellationToken()
+        token.cancel()
+        calls = []
+        token.add_callback(lambda: calls.append(1))
+        assert calls == [1]
+
+    def test_unregistered_callback_never_runs(self):
+        token = CancellationToken()
+        calls = []
+        unregister = token.add_callback(lambda: calls.append(1))
+        unregister()
+        token.cancel()
+        assert calls == []
+
+    def test_raise_if_cancelled(self):
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        token.cancel()
+        with pytest.raises(SearchCancelledError):
+            token.raise_if_cancelled()
+
+
+class TestLimiterCancellation:
+    def test_blocked_acquire_is_released_promptly(self):
+        limiter = TokenBucketRateLimiter(calls=1, period=30.0)
+        limiter.acquire()  # drain the bucket; next token is 30s away
+        token = CancellationToken()
+        _cancel_after(token, 0.05)
+
+        start = time.monotonic()
+        with pytest.raises(SearchCancelledError):
+            limiter.acquire(cancel_token=token)
+        assert time.monotonic() - start < 1.0
+
+    def test_cancelled_waiter_does_not_consume_tokens(self):
+        limiter = TokenBucketRateLimiter(calls=2, period=1.0)
+        token = CancellationToken()
+        token.cancel()
+        with pytest.raises(SearchCancelledError):
+            limiter.acquire(cancel_token=token)
+        assert limiter.acquire(tokens=2, timeout=0.01)
+
+
+class TestParallelMapCancellation:
+    def test_queued_items_are_dropped_and_caller_released(self):
+        token = CancellationToken()
+        started = []
+        lock = threading.Lock()
+
+        def fn(x):
+            with lock:
+                started.append(x)
+            time.sleep(1.0)
+            return x
+
+        _cancel_after(token, 0.05)
+        start = time.monotonic()
+        with pytest.raises(SearchCancelledError):
+            parallel_map(fn, range(40), max_workers=4, cancel_token=token)
+        # Released well before the running items finish their 1s sleep.
+        assert time.monotonic() - start < 0.6
+        time.sleep(1.1)
+        # At most one wave per worker of the (possibly already grown) shared
+        # pool started; the rest of the 40 were dropped from the queue.
+        assert len(started) <= 2 * max(4, executor_stats().max_workers) < 40
+
+    def test_cancellation_beats_return_exceptions(self):
+        token = CancellationToken()
+        token.cancel()
+        with pytest.raises(SearchCancelledError):
+            parallel_map(lambda x: x, [1, 2, 3], return_exceptions=True, cancel_token=token)
+
+    def test_uncancelled_token_is_transparent(self):
+        token = CancellationToken()
+        assert parallel_map(lambda x: x * 2, [1, 2, 3], cancel_token=token) == [2, 4, 6]
+
+    def test_imap_stops_pulling_after_cancel(self):
+        token = CancellationToken()
+        pulled = 0
+
+        def source():
+            nonlocal pulled
+            while True:
+                pulled += 1
+                yield pulled
+
+        stream = parallel_imap(lambda x: x, source(), window=2, cancel_token=token)
+        next(stream)
+        token.cancel()
+        with pytest.raises(SearchCancelledError):
+            list(stream)
+        assert pulled < 10
+
+
+class TestClientCancellation:
+    def test_cancelled_post_never_hits_the_network_or_retries(self):
+        client = Client()
+        token = CancellationToken()
+        token.cancel()
+        with patch.object(Client, "_session") as session:
+            with pytest.raises(SearchCancelledError):
+                client.post("https://example.com", data="x", cancel_token=token)
+        session.assert_not_called()
+
+    def test_cancel_during_backoff_stops_retries(self):
+        client = Client()
+        token = CancellationToken()
+        attempts = 0
+
+        class _Session:
+            def post(self, url, **kwargs):
+                nonlocal attempts
+                attempts += 1
+                token.cancel()
+                raise RuntimeError("network down")
+
+        with patch.object(Client, "_session", return_value=_Session()):
+            with pytest.raises(Exception):  # noqa: B017 — the wrapped network error
+                client.post("https://example.com", data="x", cancel_token=token)
+        assert attempts == 1
+
+
+def _day(offset: int) -> str:
+    return (datetime.now() + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+class TestSearchCancellation:
+    def test_round_trip_expansions_are_abandoned(self):
+        fixture = (FIXTURE_DIR / "flight_search_jfk_lax_oneway_usd.bin").read_text()
+        client = FixtureClient(fixture, latency_s=0.2)
+        search = SearchFlights()
+        search.client = client
+        filters = FlightSearchFilters(
+            trip_type=TripType.ROUND_TRIP,
+            passenger_info=PassengerInfo(adults=1),
+            flight_segments=[
+                FlightSegment(
+                    departure_airport=[[Airport.JFK, 0]],
+                    arrival_airport=[[Airport.LAX, 0]],
+                    travel_date=_day(30),
+                ),
+                FlightSegment(
+                    departure_airport=[[Airport.LAX, 0]],
+                    arrival_airport=[[Airport.JFK, 0]],
+                    travel_date=_day(37),
+                ),
+            ],
+        )
+        token = CancellationToken()
+        # Cancel while the outbound request is still in flight.
+        _cancel_after(token, 0.1)
+
+        start = time.monotonic()
+        with pytest.raises(SearchCancelledError):
+            search.search(filters, top_n=5, cancel_token=token)
+        assert time.monotonic() - start < 0.5
+        assert client.calls == 1
+
+    def test_date_chunks_are_abandoned(self):
+        client = FixtureClient("", latency_s=0.2)
+        search = SearchDates()
+        search.client = client
+        filters = DateSearchFilters(
+            trip_type=TripType.ONE_WAY,
+            passenger_info=PassengerInfo(adults=1),
+            flight_segments=[
+                FlightSegment(
+                    departure_airport=[[Airport.JFK, 0]],
+                    arrival_airport=[[Airport.LAX, 0]],
+                    travel_date=_day(10),
+                )
+            ],
+            from_date=_day(10),
+            to_date=_day(250),
+        )
+        token = CancellationToken()
+        _cancel_after(token, 0.05)
+
+        start = time.monotonic()
+        with pytest.raises(SearchCancelledError):
+            search.search(filters, cancel_token=token)
+        assert time.monotonic() - start < 0.15
@@ -0,0 +1,172 @@
+"""Tests for :mod:`fli.search._chunk_planner` and store-backed ``SearchDates`` planning."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from fli.models import Airline, Airport, DateSearchFilters, FlightSegment, PassengerInfo, TripType
+from fli.search import CalendarPriceStore, SearchDates
+from fli.search._chunk_planner import GRID_EPOCH, plan_chunks
+from tests.search.conftest import CalendarClient
+
+
+def _d(offset: int) -> date:
+    """Day ``offset`` of the grid cell starting at :data:`GRID_EPOCH` + 61 × 200."""
+    return GRID_EPOCH + timedelta(days=61 * 200 + offset)
+
+
+def _lengths(plan: list[tuple[date, date]]) -> list[int]:
+    return [(last - first).days + 1 for first, last in plan]
+
+
+class TestPlanChunks:
+    def test_single_chunk_untouched(self):
+        assert plan_chunks(_d(3), _d(40)) == [(_d(3), _d(40))]
+
+    def test_62_days_split_evenly(self):
+        plan = plan_chunks(_d(0), _d(61))
+        assert _lengths(plan) == [31, 31]
+        assert plan[0][0] == _d(0) and plan[-1][1] == _d(61)
+
+    def test_chunks_are_contiguous_and_balanced(self):
+        plan = plan_chunks(_d(5), _d(5 + 304))
+        assert len(plan) == 5
+        assert max(_lengths(plan)) - min(_lengths(plan)) <= 1
+        for (_, last), (first, _) in zip(plan, plan[1:], strict=False):
+            assert first == last + timedelta(days=1)
+
+    def test_fully_known_range_needs_no_chunks(self):
+        known = {_d(i) for i in range(10)}
+        assert plan_chunks(_d(0), _d(9), known=known) == []
+
+    def test_only_unseen_days_are_fetched(self):
+        # Slide a 30-day window forward by 10 days.
+        known = {_d(i) for i in range(30)}
+        assert plan_chunks(_d(10), _d(39), known=known) == [(_d(30), _d(39))]
+
+    def test_known_gap_is_bridged_when_free(self):
+        known = {_d(i) for i in range(10, 20)}
+        assert plan_chunks(_d(0), _d(29), known=known) == [(_d(0), _d(29))]
+
+    def test_known_gap_splits_when_bridging_costs_a_request(self):
+        # Bridging 0..154 would take three requests; the two edges need one each.
+        known = {_d(i) for i in range(5, 150)}
+        assert plan_chunks(_d(0), _d(154), known=known) == [(_d(0), _d(4)), (_d(150), _d(154))]
+
+    def test_padding_snaps_to_grid(self):
+        bounds = (_d(-500), _d(500))
+        assert plan_chunks(_d(3), _d(40), pad_bounds=bounds) == [(_d(0), _d(60))]
+        # An overlapping query lands on exactly the same chunk.
+        assert plan_chunks(_d(20), _d(55), pad_bounds=bounds) == [(_d(0), _d(60))]
+
+    def test_padding_is_clipped_to_bounds(self):
+        assert plan_chunks(_d(3), _d(40), pad_bounds=(_d(2), _d(50))) == [(_d(2), _d(50))]
+
+    def test_padding_never_costs_an_extra_request(self):
+        # 61 days straddling a grid boundary: two grid cells, one request → no snap.
+        assert plan_chunks(_d(30), _d(90), pad_bounds=(_d(-500), _d(500))) == [(_d(30), _d(90))]
+
+    def test_rejects_non_positive_max_days(self):
+        with pytest.raises(ValueError):
+            plan_chunks(_d(0), _d(1), max_days=0)
+
+
+def _day(offset: int) -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=offset
+    )
+
+
+def _filters(start: int, end: int, **extra: Any) -> DateSearchFilters:
+    return DateSearchFilters(
+        trip_type=TripType.ONE_WAY,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=_day(start).strftime("%Y-%m-%d"),
+            )
+        ],
+        from_date=_day(start).strftime("%Y-%m-%d"),
+        to_date=_day(end).strftime("%Y-%m-%d"),
+        **extra,
+    )
+
+
+def _searcher(store: CalendarPriceStore | None) -> tuple[SearchDates, CalendarClient]:
+    client = CalendarClient(lambda day, offset, _: 100.0 + day.day)
+    search = SearchDates(store=store)
+    search.client = client
+    return search, client
+
+
+class TestSearchDatesPlanning:
+    def test_62_day_range_uses_two_balanced_requests(self):
+        search, client = _searcher(None)
+        results = search.search(_filters(10, 71))
+        assert len(client.ranges) == 2
+        assert {
+            (datetime.strptime(e, "%Y-%m-%d") - datetime.strptime(s, "%Y-%m-%d")).days
+            for s, e in client.ranges
+        } == {30}
+        assert [dp.date[0] for dp in results] == [_day(i) for i in range(10, 72)]
+
+    def test_chunks_keep_every_filter_field(self):
+        filters = _filters(10, 100, airlines_exclude=[Airline.NK], duration=None)
+        chunks = SearchDates()._build_chunk_filters(
+            filters, filters.parsed_from_date, filters.parsed_to_date
+        )
+        assert len(chunks) == 2
+        varying = {"from_date", "to_date", "flight_segments"}
+        for chunk in chunks:
+            assert chunk.airlines_exclude == [Airline.NK]
+            assert chunk.model_dump(exclude=varying) == filters.model_dump(exclude=varying)
+
+
+class TestStoreBackedPlanning:
+    def test_sliding_window_only_fetches_new_days(self):
+        search, client = _searcher(CalendarPriceStore())
+        first = search.search(_filters(10, 30))
+        assert [dp.date[0] for dp in first] == [_day(i) for i in range(10, 31)]
+        requests_after_first = len(client.ranges)
+
+        second = search.search(_filters(15, 35))
+        assert [dp.date[0] for dp in second] == [_day(i) for i in range(15, 36)]
+        new = client.ranges[requests_after_first:]
+        # Grid padding usually covers the slide already; at most one small top-up.
+        assert len(new) <= 1
+        for start, _ in new:
+            assert start > _day(30).strftime("%Y-%m-%d")
+
+    def test_repeat_search_is_served_from_cells(self):
+        search, client = _searcher(CalendarPriceStore())
+        first = search.search(_filters(10, 80))
+        calls = len(client.ranges)
+        assert search.search(_filters(10, 80)) == first
+        assert len(client.ranges) == calls
+
+    def test_cells_are_scoped_by_filters_and_locale(self):
+        search, client = _searcher(CalendarPriceStore())
+        search.search(_filters(10, 30))
+        calls = len(client.ranges)
+        search.search(_filters(10, 30), currency="EUR")
+        search.search(_filters(10, 30, airlines_exclude=[Airline.NK]))
+        assert len(client.ranges) == calls + 2
+
+    def test_expired_cells_are_refetched(self):
+        search, client = _searcher(CalendarPriceStore(ttl=lambda lead_days: 0.0))
+        search.search(_filters(10, 30))
+        calls = len(client.ranges)
+        search.search(_filters(10, 30))
+        assert len(client.ranges) > calls
+
+    def test_padding_stays_within_today_and_horizon(self):
+        search, client = _searcher(CalendarPriceStore())
+        search.search(_filters(1, 300))
+        today = _day(0).strftime("%Y-%m-%d")
+        horizon = _day(SearchDates.SEARCH_HORIZON_DAYS).strftime("%Y-%m-%d")
+        assert all(today <= start and end <= horizon for start, end in client.ranges)
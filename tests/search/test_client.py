@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 import fli.search.client as client_module
-from fli.search.client import _host_from_url, _wrap_request_error, get_client
+from fli.search import RequestBudget, request_budget
+from fli.search._concurrency import TokenBucketRateLimiter
+from fli.search.client import Client, _host_from_url, _wrap_request_error, get_client
 from fli.search.exceptions import (
     SearchClientError,
     SearchConnectionError,
     SearchHTTPError,
+    SearchQuotaError,
     SearchTimeoutError,
 )
 
@@ -118,3 +121,34 @@ class TestGetClientSingleton:
         client_module.client = None
         c2 = get_client()
         assert c1 is not c2
+
+
+class TestRequestBudget:
+    """Requests made inside ``request_budget`` are charged to it before the shared limiter."""
+
+    def test_requests_are_charged_to_the_budget(self):
+        session = MagicMock()
+        limiter = TokenBucketRateLimiter(calls=5, period=1.0)
+        client = Client()
+        with (
+            patch.object(Client, "_session", return_value=session),
+            request_budget(RequestBudget(limiter)),
+        ):
+            client.post("https://example.com", data="x")
+            client.get("https://example.com")
+        assert limiter.stats().tokens_granted == 2
+        assert client.limiter_stats().tokens_granted == 2
+
+    def test_exhausted_budget_is_not_retried(self):
+        session = MagicMock()
+        limiter = TokenBucketRateLimiter(calls=1, period=60.0)
+        limiter.acquire()
+        client = Client()
+        with (
+            patch.object(Client, "_session", return_value=session),
+            request_budget(RequestBudget(limiter, max_wait=0.01)),
+            pytest.raises(SearchQuotaError, match="Request quota exceeded"),
+        ):
+            client.post("https://example.com", data="x")
+        assert limiter.stats().timeouts == 1
+        session.post.assert_not_called()
@@ -7,7 +7,14 @@ Covers the three building blocks the search layer relies on:
 * :func:`get_executor` / :func:`configure_concurrency` — pool sizing and
   reinitialisation when the worker cap is raised.
 * :func:`parallel_map` — order preservation, exception propagation,
-  fallthrough for ≤1 items, and verifiable in-flight concurrency.
+  ``return_exceptions`` partial results, fallthrough for ≤1 items,
+  verifiable in-flight concurrency, and starvation-free nesting.
+* :func:`parallel_imap` — lazy consumption, bounded in-flight window,
+  completion vs input order, and early-close cancellation.
+* :meth:`TokenBucketRateLimiter.stats` / :func:`executor_stats` — wait
+  histogram, current waiters, queue depth and concurrency high-water marks.
+* :class:`RequestBudget` / :func:`request_budget` — scoping, propagation
+  into executor workers, and the quota error.
 """
 
 from __future__ import annotations
@@ -18,12 +25,22 @@ import time
 import pytest
 
 from fli.search._concurrency import (
+    WAIT_HISTOGRAM_BOUNDS,
+    RequestBudget,
     TokenBucketRateLimiter,
     configure_concurrency,
+    current_request_budget,
+    executor_stats,
     get_executor,
+    gil_enabled,
+    in_pool_thread,
+    parallel_imap,
     parallel_map,
+    request_budget,
+    reset_executor_stats,
     shutdown_executor,
 )
+from fli.search.exceptions import SearchQuotaError
 
 # ---------------------------------------------------------------------------
 # TokenBucketRateLimiter
@@ -257,6 +274,24 @@ class TestParallelMap:
         result = parallel_map(lambda x: x + 1, (10, 20, 30))
         assert result == [11, 21, 31]
 
+    def test_return_exceptions_keeps_successes(self):
+        def fn(x):
+            if x % 2:
+                raise ValueError(f"odd {x}")
+            return x
+
+        result = parallel_map(fn, [0, 1, 2, 3], return_exceptions=True)
+        assert result[0] == 0 and result[2] == 2
+        assert isinstance(result[1], ValueError) and str(result[1]) == "odd 1"
+        assert isinstance(result[3], ValueError)
+
+    def test_return_exceptions_on_sync_path(self):
+        def fn(x):
+            raise RuntimeError("only item")
+
+        (result,) = parallel_map(fn, [1], return_exceptions=True)
+        assert isinstance(result, RuntimeError)
+
     def test_exception_in_last_item_propagates(self):
         def fn(x):
             if x == 2:
@@ -267,6 +302,217 @@ class TestParallelMap:
             parallel_map(fn, [0, 1, 2])
 
 
+class TestNestedParallelMap:
+    def setup_method(self):
+        shutdown_executor()
+        configure_concurrency(2)
+
+    def teardown_method(self):
+        shutdown_executor()
+        configure_concurrency(10)
+
+    def _run_with_deadline(self, fn, timeout: float = 5.0):
+        box: dict = {}
+
+        def target():
+            try:
+                box["result"] = fn()
+            except BaseException as exc:  # noqa: BLE001
+                box["error"] = exc
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        assert not thread.is_alive(), "nested parallel_map deadlocked"
+        if "error" in box:
+            raise box["error"]
+        return box["result"]
+
+    def test_pool_threads_are_marked(self):
+        assert not in_pool_thread()
+        assert get_executor().submit(in_pool_thread).result() is True
+
+    def test_three_levels_deep_on_two_workers_completes(self):
+        """Each level fans out wider than the pool; blocking submits would starve."""
+
+        def leaf(x):
+            time.sleep(0.005)
+            return x
+
+        def middle(x):
+            return sum(parallel_map(leaf, [x] * 4))
+
+        def top(x):
+            return sum(parallel_map(middle, [x] * 4))
+
+        result = self._run_with_deadline(lambda: parallel_map(top, [1, 2, 3, 4]))
+        assert result == [16, 32, 48, 64]
+
+    def test_nested_preserves_order_and_propagates_errors(self):
+        def inner(x):
+            if x == 3:
+                raise ValueError("inner 3")
+            return x * 10
+
+        def outer(xs):
+            return parallel_map(inner, xs)
+
+        assert self._run_with_deadline(lambda: parallel_map(outer, [[0, 1], [2, 4]])) == [
+            [0, 10],
+            [20, 40],
+        ]
+        with pytest.raises(ValueError, match="inner 3"):
+            self._run_with_deadline(lambda: parallel_map(outer, [[0, 1], [2, 3]]))
+
+    def test_nested_return_exceptions(self):
+        def inner(x):
+            if x:
+                raise RuntimeError("boom")
+            return x
+
+        def outer(_):
+            return parallel_map(inner, [0, 1, 0], return_exceptions=True)
+
+        for row in self._run_with_deadline(lambda: parallel_map(outer, range(3))):
+            assert row[0] == 0 and row[2] == 0
+            assert isinstance(row[1], RuntimeError)
+
+
+class TestParallelImap:
+    def setup_method(self):
+        shutdown_executor()
+        configure_concurrency(10)
+
+    def test_yields_in_completion_order(self):
+        delays = {0: 0.15, 1: 0.0, 2: 0.05}
+        result = list(parallel_imap(lambda x: time.sleep(delays[x]) or x, [0, 1, 2]))
+        assert result == [1, 2, 0]
+
+    def test_ordered_yields_in_input_order(self):
+        delays = {0: 0.1, 1: 0.0, 2: 0.05}
+        result = list(parallel_imap(lambda x: time.sleep(delays[x]) or x, [0, 1, 2], ordered=True))
+        assert result == [0, 1, 2]
+
+    def test_window_bounds_in_flight_and_pulls_lazily(self):
+        in_flight = 0
+        peak = 0
+        pulled = 0
+        lock = threading.Lock()
+
+        def source():
+            nonlocal pulled
+            for i in range(20):
+                pulled += 1
+                yield i
+
+        def fn(x):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return x
+
+        stream = parallel_imap(fn, source(), window=3)
+        first = next(stream)
+        assert pulled <= 4  # the window, plus one refill after the first result
+        assert sorted([first, *stream]) == list(range(20))
+        assert peak <= 3
+
+    def test_infinite_source_with_early_close(self):
+        started = []
+
+        def fn(x):
+            started.append(x)
+            time.sleep(0.01)
+            return x
+
+        def naturals():
+            n = 0
+            while True:
+                yield n
+                n += 1
+
+        stream = parallel_imap(fn, naturals(), window=4)
+        taken = [next(stream) for _ in range(5)]
+        stream.close()
+        time.sleep(0.05)
+        assert len(taken) == 5
+        assert len(started) <= 9
+
+    def test_exception_propagates(self):
+        def fn(x):
+            if x == 2:
+                raise ValueError("bad 2")
+            return x
+
+        with pytest.raises(ValueError, match="bad 2"):
+            list(parallel_imap(fn, range(5)))
+
+    def test_return_exceptions(self):
+        def fn(x):
+            if x == 2:
+                raise ValueError("bad 2")
+            return x
+
+        result = list(parallel_imap(fn, range(5), return_exceptions=True, ordered=True))
+        assert result[:2] == [0, 1] and result[3:] == [3, 4]
+        assert isinstance(result[2], ValueError)
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            parallel_imap(lambda x: x, [1], window=0)
+
+    def test_nested_runs_inline(self):
+        def outer(x):
+            return list(parallel_imap(lambda y: (y, in_pool_thread()), range(x)))
+
+        rows = parallel_map(outer, [2, 3])
+        assert rows == [[(0, True), (1, True)], [(0, True), (1, True), (2, True)]]
+
+
+class TestExecutorResizeRace:
+    def teardown_method(self):
+        shutdown_executor()
+        configure_concurrency(10)
+
+    def test_submit_survives_concurrent_resize(self):
+        """Growing the pool mid-fan-out must not break in-flight parallel_map calls."""
+        configure_concurrency(4)
+        stop = threading.Event()
+        errors: list[BaseException] = []
+
+        def resizer():
+            size = 4
+            while not stop.is_set():
+                size += 1
+                get_executor(max_workers=size)
+                time.sleep(0.001)
+
+        def mapper():
+            try:
+                for _ in range(30):
+                    assert parallel_map(lambda x: x + 1, range(6)) == [1, 2, 3, 4, 5, 6]
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+
+        resize_thread = threading.Thread(target=resizer)
+        resize_thread.start()
+        mappers = [threading.Thread(target=mapper) for _ in range(4)]
+        for t in mappers:
+            t.start()
+        for t in mappers:
+            t.join()
+        stop.set()
+        resize_thread.join()
+        assert errors == []
+
+    def test_gil_enabled_reports_a_bool(self):
+        assert isinstance(gil_enabled(), bool)
+
+
 class TestShutdownExecutor:
     def teardown_method(self):
         shutdown_executor()
@@ -290,3 +536,115 @@ class TestTokenBucketEdgeCases:
         start = time.perf_counter()
         assert limiter.acquire(tokens=3) is True
         assert (time.perf_counter() - start) < 0.05
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation
+# ---------------------------------------------------------------------------
+
+
+class TestLimiterStats:
+    def test_uncontended_grants_land_in_first_bucket(self):
+        limiter = TokenBucketRateLimiter(calls=5, period=1.0)
+        limiter.acquire()
+        limiter.acquire(tokens=2)
+        stats = limiter.stats()
+        assert stats.tokens_granted == 3
+        assert stats.acquisitions == 2
+        assert stats.wait_histogram[0] == 2
+        assert len(stats.wait_histogram) == len(WAIT_HISTOGRAM_BOUNDS)
+        assert stats.waiters == 0
+
+    def test_contended_wait_is_measured(self):
+        limiter = TokenBucketRateLimiter(calls=1, period=0.1)
+        limiter.acquire()
+        limiter.acquire()  # waits ~100ms for the refill
+        stats = limiter.stats()
+        assert stats.max_wait_s >= 0.05
+        assert sum(stats.wait_histogram) == 2
+        assert stats.wait_histogram[0] == 1
+        assert 0 < stats.mean_wait_s <= stats.max_wait_s
+
+    def test_blocked_threads_show_as_waiters(self):
+        limiter = TokenBucketRateLimiter(calls=1, period=0.3)
+        limiter.acquire()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(2)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        assert limiter.stats().waiters == 2
+        for t in threads:
+            t.join()
+        assert limiter.stats().waiters == 0
+
+    def test_timeouts_counted_and_reset(self):
+        limiter = TokenBucketRateLimiter(calls=1, period=10.0)
+        limiter.acquire()
+        assert limiter.acquire(timeout=0.01) is False
+        assert limiter.stats().timeouts == 1
+        limiter.reset_stats()
+        stats = limiter.stats()
+        assert (stats.timeouts, stats.acquisitions, stats.tokens_granted) == (0, 0, 0)
+
+
+class TestExecutorStats:
+    def setup_method(self):
+        configure_concurrency(4)
+        reset_executor_stats()
+
+    def teardown_method(self):
+        configure_concurrency(10)
+        reset_executor_stats()
+
+    def test_counts_and_high_water_marks(self):
+        parallel_map(lambda _: time.sleep(0.05), range(8), max_workers=4)
+        stats = executor_stats()
+        assert stats.submitted == stats.completed == 8
+        assert stats.queued == stats.running == 0
+        assert stats.max_running == 4
+        assert stats.max_queued >= 4
+        assert stats.mean_run_s >= 0.04
+        assert stats.mean_queue_s > 0
+        assert stats.max_workers == 4
+
+    def test_inline_fast_path_is_not_counted(self):
+        parallel_map(lambda x: x, [1])
+        assert executor_stats().submitted == 0
+
+    def test_reset(self):
+        parallel_map(lambda x: x, range(4), max_workers=2)
+        reset_executor_stats()
+        stats = executor_stats()
+        assert (stats.submitted, stats.completed, stats.max_running) == (0, 0, 0)
+
+
+class TestRequestBudget:
+    def test_scope_is_restored_on_exit(self):
+        budget = RequestBudget(TokenBucketRateLimiter(calls=1, period=1.0))
+        assert current_request_budget() is None
+        with request_budget(budget):
+            assert current_request_budget() is budget
+            with request_budget(None):
+                assert current_request_budget() is None
+            assert current_request_budget() is budget
+        assert current_request_budget() is None
+
+    def test_follows_work_into_executor_workers(self):
+        budget = RequestBudget(TokenBucketRateLimiter(calls=1, period=1.0))
+
+        def nested(_):
+            return parallel_map(lambda _: current_request_budget(), range(3), max_workers=3)
+
+        with request_budget(budget):
+            seen = parallel_map(nested, range(3), max_workers=3)
+        assert all(b is budget for inner in seen for b in inner)
+        # Workers do not keep the budget once the block is left.
+        assert parallel_map(lambda _: current_request_budget(), range(2)) == [None, None]
+
+    def test_exhausted_budget_raises_after_max_wait(self):
+        budget = RequestBudget(
+            TokenBucketRateLimiter(calls=1, period=10.0), max_wait=0.02, owner="this session"
+        )
+        budget.acquire()
+        with pytest.raises(SearchQuotaError, match="this session is limited to 0.1 Google"):
+            budget.acquire()
@@ -0,0 +1,115 @@
+"""Tests for :class:`fli.search.DatePriceArray` and ``SearchDates.search_array``."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from fli.models import Airport, DateSearchFilters, FlightSegment, PassengerInfo, TripType
+from fli.search import CalendarPriceStore, DatePrice, DatePriceArray, SearchDates
+from fli.search.dates import _decode_calendar
+from tests.search.conftest import CalendarClient
+
+
+class TestDecodeCalendar:
+    def test_one_pass_decode_skips_unpriced_and_malformed_rows(self):
+        items = [
+            ["2030-01-01", None, [[None, 120.5], "USD0.000"]],
+            ["2030-01-02", None, [[None, None], "USD0.000"]],
+            ["2030-01-03", None, [[None, 0], "USD0.000"]],
+            ["not-a-date", None, [[None, 99.0], "USD0.000"]],
+            ["2030-01-05", None, "garbage"],
+            ["2030-01-06", None, {"price": 1}],
+            None,
+            ["2030-01-07", None, [[None, "80"]]],
+        ]
+        prices = _decode_calendar(items, round_trip=False)
+        assert not prices.round_trip
+        assert prices.departure_dates() == [date(2030, 1, 1), date(2030, 1, 7)]
+        assert list(prices.prices) == [120.5, 80.0]
+        assert prices.currencies[1] is None
+
+    def test_round_trip_rows_keep_the_return_day(self):
+        items = [["2030-01-01", "2030-01-08", [[None, 300.0], "USD0.000"]]]
+        (cell,) = _decode_calendar(items, round_trip=True)
+        assert cell.date == (datetime(2030, 1, 1), datetime(2030, 1, 8))
+        assert cell.price == 300.0
+
+
+class TestDatePriceArray:
+    def _array(self) -> DatePriceArray:
+        items = [
+            [(date(2030, 1, 1) + timedelta(days=i)).isoformat(), None, [[None, p], None]]
+            for i, p in enumerate([300.0, 120.0, 450.0, 90.0])
+        ]
+        return _decode_calendar(items, round_trip=False)
+
+    def test_items_are_date_prices(self):
+        prices = self._array()
+        assert len(prices) == 4
+        assert prices[1] == DatePrice(date=(datetime(2030, 1, 2),), price=120.0, currency=None)
+        assert prices.to_date_prices() == list(prices)
+
+    def test_cheapest_builds_only_k_items(self):
+        assert [dp.price for dp in self._array().cheapest(2)] == [90.0, 120.0]
+
+    def test_round_trip_cells_without_a_return_day_are_rejected(self):
+        day = date(2030, 1, 1)
+        cells = [(day, (300.0, (day + timedelta(days=7)).toordinal(), "USD"))]
+        (cell,) = DatePriceArray._from_cells(cells, round_trip=True)
+        assert cell.date == (datetime(2030, 1, 1), datetime(2030, 1, 8))
+        with pytest.raises(ValueError, match="no return date"):
+            DatePriceArray._from_cells([(day, (300.0, None, "USD"))], round_trip=True)
+
+    def test_empty(self):
+        assert len(DatePriceArray.empty()) == 0
+        assert DatePriceArray.empty(round_trip=True).round_trip
+
+    def test_to_numpy(self):
+        np = pytest.importorskip("numpy")
+        columns = self._array().to_numpy()
+        assert columns["departure"][0] == np.datetime64("2030-01-01")
+        assert columns["price"].tolist() == [300.0, 120.0, 450.0, 90.0]
+
+
+def _day(offset: int) -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=offset
+    )
+
+
+def _filters(days: int) -> DateSearchFilters:
+    return DateSearchFilters(
+        trip_type=TripType.ONE_WAY,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=_day(10).strftime("%Y-%m-%d"),
+            )
+        ],
+        from_date=_day(10).strftime("%Y-%m-%d"),
+        to_date=_day(10 + days - 1).strftime("%Y-%m-%d"),
+    )
+
+
+@pytest.mark.parametrize("days", [30, 150])
+def test_search_array_matches_search(days):
+    search = SearchDates()
+    search.client = CalendarClient()
+    prices = search.search_array(_filters(days))
+    assert len(prices) == days
+    assert prices.to_date_prices() == search.search(_filters(days))
+
+
+def test_search_array_builds_no_date_price_objects():
+    search = SearchDates(store=CalendarPriceStore())
+    search.client = CalendarClient()
+    with patch.object(DatePrice, "model_construct", side_effect=AssertionError("built")):
+        prices = search.search_array(_filters(150))
+        # Served from the store the second time round.
+        assert list(search.search_array(_filters(150)).prices) == list(prices.prices)
+    assert prices.departure_dates()[0] == _day(10).date()
@@ -0,0 +1,102 @@
+"""Tests for the HTTP client and decoder counters in :mod:`fli.search._metrics`."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from tenacity import wait_none
+
+from fli.search import HistogramSnapshot, decode_stats
+from fli.search._concurrency import run_decoder
+from fli.search._metrics import Histogram, reset_decode_stats
+from fli.search.client import Client
+from fli.search.exceptions import SearchHTTPError
+
+
+class TestHistogram:
+    def test_buckets_hold_values_up_to_their_bound(self):
+        histogram = Histogram((0.1, 1.0, float("inf")))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        assert histogram.snapshot() == HistogramSnapshot(
+            bounds=(0.1, 1.0, float("inf")), counts=(2, 1, 1), count=4, sum=3.65
+        )
+
+    def test_bounds_must_end_with_infinity(self):
+        with pytest.raises(ValueError):
+            Histogram((0.1, 1.0))
+
+
+class _Response:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            from curl_cffi.requests import exceptions
+
+            error = exceptions.HTTPError(f"HTTP {self.status_code}")
+            error.response = self
+            raise error
+
+
+class _Session:
+    """Answers with the queued status codes, one per attempt."""
+
+    def __init__(self, *statuses: int):
+        self.statuses = list(statuses)
+
+    def post(self, url, **kwargs):
+        return _Response(self.statuses.pop(0))
+
+
+class TestClientStats:
+    @pytest.fixture(autouse=True)
+    def _no_backoff(self):
+        with patch.object(Client.post.retry, "wait", wait_none()):
+            yield
+
+    def test_counts_attempts_by_outcome_and_retries(self):
+        client = Client()
+        with patch.object(Client, "_session", return_value=_Session(429, 200)):
+            client.post("https://example.com", data="x")
+
+        stats = client.stats()
+        assert stats.requests == {("POST", "http_429"): 1, ("POST", "ok"): 1}
+        assert stats.retries == 1
+        assert stats.latency.count == 2
+
+    def test_exhausted_retries_are_all_counted(self):
+        client = Client()
+        with patch.object(Client, "_session", return_value=_Session(503, 503, 503)):
+            with pytest.raises(SearchHTTPError):
+                client.post("https://example.com", data="x")
+
+        stats = client.stats()
+        assert stats.requests == {("POST", "http_503"): 3}
+        assert stats.retries == 2
+
+
+def _decode_ok(body: str) -> int:
+    return len(body)
+
+
+def _decode_broken(body: str) -> int:
+    raise ValueError("bad body")
+
+
+class TestDecodeStats:
+    def test_run_decoder_times_each_decoder_and_counts_failures(self):
+        reset_decode_stats()
+        run_decoder(_decode_ok, "abc")
+        run_decoder(_decode_ok, "abcdef")
+        with pytest.raises(ValueError):
+            run_decoder(_decode_broken, "x")
+
+        stats = decode_stats()
+        assert stats.duration["_decode_ok"].count == 2
+        assert stats.duration["_decode_broken"].count == 1
+        assert stats.errors == {"_decode_broken": 1}
+        reset_decode_stats()
+        assert decode_stats().duration == {}
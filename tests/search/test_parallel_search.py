@@ -15,7 +15,6 @@ import time
 from copy import deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -32,6 +31,7 @@ from fli.models import (
     TripType,
 )
 from fli.search import SearchDates, SearchFlights
+from tests.search.conftest import FixtureClient
 
 FIXTURE_DIR = Path(__file__).parent / "fixtures"
 
@@ -41,49 +41,6 @@ FIXTURE_DIR = Path(__file__).parent / "fixtures"
 # ---------------------------------------------------------------------------
 
 
-class _FakeResponse:
-    __slots__ = ("text", "status_code")
-
-    def __init__(self, text: str):
-        self.text = text
-        self.status_code = 200
-
-    def raise_for_status(self) -> None:
-        return None
-
-
-class FakeClient:
-    """Records concurrency + simulates per-request latency."""
-
-    def __init__(self, fixture_text: str, latency_ms: float = 50.0):
-        """Capture the fixture body and per-request latency budget."""
-        self._fixture = fixture_text
-        self._latency_s = latency_ms / 1000.0
-        self._lock = threading.Lock()
-        self.calls = 0
-        self.peak_in_flight = 0
-        self._in_flight = 0
-
-    def _do(self) -> _FakeResponse:
-        with self._lock:
-            self.calls += 1
-            self._in_flight += 1
-            if self._in_flight > self.peak_in_flight:
-                self.peak_in_flight = self._in_flight
-        try:
-            time.sleep(self._latency_s)
-        finally:
-            with self._lock:
-                self._in_flight -= 1
-        return _FakeResponse(self._fixture)
-
-    def post(self, url: str, **kwargs: Any) -> _FakeResponse:
-        return self._do()
-
-    def get(self, url: str, **kwargs: Any) -> _FakeResponse:
-        return self._do()
-
-
 def _date_fixture(days: int = 61) -> str:
     """Minimal ``GetCalendarGraph`` body for the date-search parser."""
     base = datetime(2026, 7, 1)
@@ -152,7 +109,7 @@ class TestRoundTripParallel:
         return (FIXTURE_DIR / "flight_search_jfk_lax_oneway_usd.bin").read_text()
 
     def test_peak_in_flight_matches_top_n(self, fixture_text):
-        fake = FakeClient(fixture_text, latency_ms=60.0)
+        fake = FixtureClient(fixture_text, latency_s=0.06)
         search = SearchFlights()
         search.client = fake
 
@@ -168,7 +125,7 @@ class TestRoundTripParallel:
 
     def test_wall_time_under_sequential_bound(self, fixture_text):
         latency = 60
-        fake = FakeClient(fixture_text, latency_ms=latency)
+        fake = FixtureClient(fixture_text, latency_s=latency / 1000)
         search = SearchFlights()
         search.client = fake
 
@@ -257,7 +214,7 @@ class TestRoundTripParallel:
 
 class TestDateChunkParallel:
     def test_three_chunks_overlap(self):
-        fake = FakeClient(_date_fixture(days=61), latency_ms=60.0)
+        fake = FixtureClient(_date_fixture(days=61), latency_s=0.06)
         search = SearchDates()
         search.client = fake
 
@@ -272,7 +229,7 @@ class TestDateChunkParallel:
 
     def test_single_chunk_skips_executor(self):
         """Sub-61-day ranges still take the synchronous fast path."""
-        fake = FakeClient(_date_fixture(days=30), latency_ms=10.0)
+        fake = FixtureClient(_date_fixture(days=30), latency_s=0.01)
         search = SearchDates()
         search.client = fake
 
@@ -283,7 +240,7 @@ class TestDateChunkParallel:
         assert fake.peak_in_flight == 1
 
     def test_chunk_filters_advance_segment_dates(self):
-        """Each chunk's segment ``travel_date`` is offset by N×61 days."""
+        """Each chunk's segment ``travel_date`` moves by the chunk's offset from ``from_date``."""
         search = SearchDates()
         filters = _date_filters(days=180)
         chunks = search._build_chunk_filters(
@@ -296,13 +253,18 @@ class TestDateChunkParallel:
         second = chunks[1].flight_segments[0].travel_date
         third = chunks[2].flight_segments[0].travel_date
         assert first == "2026-08-01"
-        # Shifted by exactly 61 and 122 days.
+        # 180 days split into three balanced 60-day chunks.
+        assert [(c.from_date, c.to_date) for c in chunks] == [
+            ("2026-08-01", "2026-09-29"),
+            ("2026-09-30", "2026-11-28"),
+            ("2026-11-29", "2027-01-27"),
+        ]
         assert datetime.strptime(second, "%Y-%m-%d") - datetime.strptime(
             first, "%Y-%m-%d"
-        ) == timedelta(days=61)
+        ) == timedelta(days=60)
         assert datetime.strptime(third, "%Y-%m-%d") - datetime.strptime(
             first, "%Y-%m-%d"
-        ) == timedelta(days=122)
+        ) == timedelta(days=120)
 
     def test_chunk_filters_do_not_mutate_source(self):
         """``_build_chunk_filters`` must not mutate the caller's filters."""
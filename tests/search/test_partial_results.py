@@ -0,0 +1,166 @@
+"""Tests for ``partial=True`` on :class:`SearchFlights` and :class:`SearchDates`.
+
+A failed sub-request (one round-trip expansion, one date chunk) must not
+discard the results of its successful siblings; instead it is reported on
+``last_failures``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from fli.models import (
+    Airline,
+    Airport,
+    DateSearchFilters,
+    FlightLeg,
+    FlightResult,
+    FlightSearchFilters,
+    FlightSegment,
+    PassengerInfo,
+    TripType,
+)
+from fli.search import SearchDates, SearchFlights, SubRequestFailure
+from tests.search.conftest import CalendarClient
+
+
+def _day(offset: int) -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=offset
+    )
+
+
+def _result(flight_number: str) -> FlightResult:
+    return FlightResult(
+        legs=[
+            FlightLeg(
+                airline=Airline.AA,
+                flight_number=flight_number,
+                departure_airport=Airport.JFK,
+                arrival_airport=Airport.LAX,
+                departure_datetime=_day(30).replace(hour=9),
+                arrival_datetime=_day(30).replace(hour=12),
+                duration=180,
+            )
+        ],
+        price=300,
+        currency="USD",
+        duration=180,
+        stops=0,
+    )
+
+
+def _round_trip_filters() -> FlightSearchFilters:
+    return FlightSearchFilters(
+        trip_type=TripType.ROUND_TRIP,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=_day(30).strftime("%Y-%m-%d"),
+            ),
+            FlightSegment(
+                departure_airport=[[Airport.LAX, 0]],
+                arrival_airport=[[Airport.JFK, 0]],
+                travel_date=_day(37).strftime("%Y-%m-%d"),
+            ),
+        ],
+    )
+
+
+def _fetch_with_one_failing_expansion(_self, filters, **kwargs):
+    if kwargs["capture_session"]:
+        return [_result(str(i)) for i in range(4)]
+    selected = filters.flight_segments[0].selected_flight
+    if selected.legs[0].flight_number == "2":
+        raise RuntimeError("expansion 2 failed")
+    return [_result(f"ret-{selected.legs[0].flight_number}")]
+
+
+class TestSearchFlightsPartial:
+    def test_default_mode_raises(self):
+        with patch.object(
+            SearchFlights,
+            "_fetch_flights",
+            autospec=True,
+            side_effect=_fetch_with_one_failing_expansion,
+        ):
+            with pytest.raises(RuntimeError, match="expansion 2 failed"):
+                SearchFlights().search(_round_trip_filters(), top_n=4)
+
+    def test_partial_mode_keeps_successful_combos(self):
+        with patch.object(
+            SearchFlights,
+            "_fetch_flights",
+            autospec=True,
+            side_effect=_fetch_with_one_failing_expansion,
+        ):
+            search = SearchFlights()
+            results = search.search(_round_trip_filters(), top_n=4, partial=True)
+
+        assert results is not None
+        assert [out.legs[0].flight_number for out, _ in results] == ["0", "1", "3"]
+        assert len(search.last_failures) == 1
+        failure = search.last_failures[0]
+        assert isinstance(failure, SubRequestFailure)
+        assert failure.kind == "expansion"
+        assert "AA2" in failure.description
+        assert isinstance(failure.error, RuntimeError)
+
+    def test_failures_reset_between_searches(self):
+        search = SearchFlights()
+        search.last_failures = [SubRequestFailure("chunk", "stale", RuntimeError())]
+        with patch.object(SearchFlights, "_fetch_flights", autospec=True, return_value=None):
+            search.search(_round_trip_filters(), partial=True)
+        assert search.last_failures == []
+
+
+def _date_filters(days: int) -> DateSearchFilters:
+    start = _day(10).strftime("%Y-%m-%d")
+    return DateSearchFilters(
+        trip_type=TripType.ONE_WAY,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=start,
+            )
+        ],
+        from_date=start,
+        to_date=_day(10 + days - 1).strftime("%Y-%m-%d"),
+    )
+
+
+class TestSearchDatesPartial:
+    def _search(self) -> tuple[SearchDates, DateSearchFilters, str]:
+        filters = _date_filters(days=150)
+        search = SearchDates()
+        chunks = search._build_chunk_filters(
+            filters, filters.parsed_from_date, filters.parsed_to_date
+        )
+        failing = chunks[1].from_date
+        search.client = CalendarClient(lambda day, offset, _: 100.0, fail_from=failing)
+        return search, filters, failing
+
+    def test_default_mode_raises(self):
+        search, filters, _ = self._search()
+        with pytest.raises(RuntimeError, match="failed"):
+            search.search(filters)
+
+    def test_partial_mode_keeps_other_chunks(self):
+        search, filters, failing = self._search()
+        results = search.search(filters, partial=True)
+
+        assert results is not None
+        returned = {dp.date[0].strftime("%Y-%m-%d") for dp in results}
+        assert failing not in returned
+        assert len(returned) > 0
+        assert len(search.last_failures) == 1
+        failure = search.last_failures[0]
+        assert failure.kind == "chunk"
+        assert failure.description.startswith(failing)
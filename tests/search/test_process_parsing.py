@@ -0,0 +1,157 @@
+"""Tests for the whole-response decoders and the optional process-pool decode stage."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from fli.models import Airport, FlightSearchFilters, FlightSegment, PassengerInfo
+from fli.search import SearchFlights
+from fli.search._concurrency import (
+    configure_process_parsing,
+    process_parsing_enabled,
+    run_decoder,
+)
+from fli.search._decoders import (
+    decode_booking_response,
+    decode_shopping_response,
+    parse_booking_chunk,
+)
+from fli.search._wire import iter_wrb_chunks
+from fli.search.flights import SearchParseError
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def _fixture(name: str) -> str:
+    return (FIXTURE_DIR / name).read_text()
+
+
+def _one_way_filters() -> FlightSearchFilters:
+    return FlightSearchFilters(
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=(datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"),
+            )
+        ],
+    )
+
+
+def _shopping_body(inner: list) -> str:
+    return ")]}'\n\n" + json.dumps([["wrb.fr", None, json.dumps(inner)]])
+
+
+class TestDecodeShoppingResponse:
+    def test_real_fixture(self):
+        decoded = decode_shopping_response(_fixture("flight_search_jfk_lax_oneway_usd.bin"))
+        assert decoded.has_payload
+        assert decoded.shape_error is None
+        assert decoded.flights and decoded.row_count == len(decoded.flights)
+        assert isinstance(decoded.session_id, str) and decoded.session_id
+
+    def test_accepts_bytes(self):
+        body = _fixture("flight_search_jfk_lax_oneway_usd.bin")
+        assert decode_shopping_response(body.encode()).flights == (
+            decode_shopping_response(body).flights
+        )
+
+    def test_no_payload(self):
+        assert not decode_shopping_response("not a response").has_payload
+
+    def test_shape_error_and_missing_session_are_reported_not_raised(self):
+        decoded = decode_shopping_response(_shopping_body([None]))
+        assert decoded.has_payload
+        assert decoded.session_id_missing
+        assert isinstance(decoded.session_id_error, TypeError)
+        assert decoded.shape_error is not None
+        assert decoded.flights == []
+
+    def test_missing_session_is_logged_with_its_traceback(self, caplog):
+        decoded = decode_shopping_response(_shopping_body([None]))
+        with caplog.at_level("WARNING", logger="fli.search.flights"):
+            SearchFlights()._capture_session_id(decoded)
+        (record,) = caplog.records
+        assert "Failed to capture shopping session id" in record.getMessage()
+        assert record.exc_info[1] is decoded.session_id_error
+        assert record.exc_info[2] is not None  # the traceback, not just the message
+
+    def test_shape_change_is_raised_from_the_decoder_error(self):
+        body = _shopping_body([None])
+
+        class _Client:
+            def post(self, url: str, **kwargs: Any):
+                return type("R", (), {"text": body, "raise_for_status": lambda self: None})()
+
+        search = SearchFlights()
+        search.client = _Client()
+        with pytest.raises(SearchParseError, match="IndexError") as excinfo:
+            search._fetch_flights(
+                _one_way_filters(),
+                currency=None,
+                language=None,
+                country=None,
+                capture_session=False,
+            )
+        assert isinstance(excinfo.value.__cause__, IndexError)
+        assert excinfo.value.__cause__.__traceback__ is not None
+
+    def test_unparseable_rows_are_sampled(self):
+        bad_row = [None, [[None, "not-a-number"]]]
+        inner = [[None, None, None, None, "S"], None, [[bad_row, bad_row]], None]
+        decoded = decode_shopping_response(_shopping_body(inner))
+        assert decoded.row_count == 2
+        assert decoded.failed_rows == 2
+        assert len(decoded.failure_samples) == 1
+
+
+def test_decode_booking_response_matches_per_chunk_parse():
+    body = _fixture("booking_results_aa_jfk_lax.bin")
+    expected = [opt for chunk in iter_wrb_chunks(body) for opt in parse_booking_chunk(chunk)]
+    assert expected
+    assert decode_booking_response(body) == expected
+
+
+class TestProcessParsing:
+    def teardown_method(self):
+        configure_process_parsing(0)
+
+    def test_disabled_by_default_runs_inline(self):
+        assert not process_parsing_enabled()
+        calls = []
+        assert run_decoder(lambda body: calls.append(body) or len(body), "abc") == 3
+        assert calls == ["abc"]
+
+    def test_negative_workers_rejected(self):
+        with pytest.raises(ValueError):
+            configure_process_parsing(-1)
+
+    def test_search_results_identical_across_processes(self):
+        body = _fixture("flight_search_jfk_lax_oneway_usd.bin")
+
+        class _Client:
+            def post(self, url: str, **kwargs: Any):
+                return type("R", (), {"text": body, "raise_for_status": lambda self: None})()
+
+        filters = _one_way_filters()
+        search = SearchFlights()
+        search.client = _Client()
+        in_thread = search.search(filters)
+        thread_session = search._last_session_id
+
+        configure_process_parsing(2)
+        assert process_parsing_enabled()
+        search._last_session_id = None
+        in_process = search.search(filters)
+
+        assert in_process == in_thread
+        assert search._last_session_id == thread_session
+
+        booking = _fixture("booking_results_aa_jfk_lax.bin")
+        assert run_decoder(decode_booking_response, booking) == decode_booking_response(booking)
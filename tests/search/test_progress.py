@@ -0,0 +1,195 @@
+"""Tests for ``on_progress`` on :class:`SearchFlights` and :class:`SearchDates`."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from fli.models import (
+    Airline,
+    Airport,
+    DateSearchFilters,
+    FlightLeg,
+    FlightResult,
+    FlightSearchFilters,
+    FlightSegment,
+    PassengerInfo,
+    TripType,
+)
+from fli.search import DatePriceArray, SearchDates, SearchFlights, SearchProgress
+from tests.search.conftest import CalendarClient, FakeResponse
+
+
+def _day(offset: int) -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=offset
+    )
+
+
+def _result(flight_number: str) -> FlightResult:
+    return FlightResult(
+        legs=[
+            FlightLeg(
+                airline=Airline.AA,
+                flight_number=flight_number,
+                departure_airport=Airport.JFK,
+                arrival_airport=Airport.LAX,
+                departure_datetime=_day(30).replace(hour=9),
+                arrival_datetime=_day(30).replace(hour=12),
+                duration=180,
+            )
+        ],
+        price=300,
+        currency="USD",
+        duration=180,
+        stops=0,
+    )
+
+
+def _segment(origin: Airport, destination: Airport, offset: int) -> FlightSegment:
+    return FlightSegment(
+        departure_airport=[[origin, 0]],
+        arrival_airport=[[destination, 0]],
+        travel_date=_day(offset).strftime("%Y-%m-%d"),
+    )
+
+
+def _flight_filters(trip_type: TripType, *segments: FlightSegment) -> FlightSearchFilters:
+    return FlightSearchFilters(
+        trip_type=trip_type,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=list(segments),
+    )
+
+
+def _fake_fetch(_self, filters, **kwargs):
+    """Three options per leg; the selected flight numbers chain into the next leg's."""
+    if kwargs["capture_session"]:
+        return [_result(str(i)) for i in range(3)]
+    chosen = [s.selected_flight for s in filters.flight_segments if s.selected_flight]
+    prefix = "-".join(f.legs[0].flight_number for f in chosen)
+    if prefix == "1":
+        raise RuntimeError("expansion failed")
+    return [_result(f"{prefix}/{i}") for i in range(2)]
+
+
+def _collect() -> tuple[list[SearchProgress], Any]:
+    events: list[SearchProgress] = []
+    lock = threading.Lock()
+
+    def on_progress(event: SearchProgress) -> None:
+        with lock:
+            events.append(event)
+
+    return events, on_progress
+
+
+class TestFlightProgress:
+    def test_one_way_reports_a_single_outbound_step(self):
+        events, on_progress = _collect()
+        filters = _flight_filters(TripType.ONE_WAY, _segment(Airport.JFK, Airport.LAX, 30))
+        with patch.object(SearchFlights, "_fetch_flights", autospec=True, side_effect=_fake_fetch):
+            SearchFlights().search(filters, on_progress=on_progress)
+
+        assert [(e.kind, e.completed, e.total) for e in events] == [("outbound", 1, 1)]
+        assert events[0].description.startswith("JFK-LAX ")
+        assert len(events[0].results) == 3
+
+    def test_round_trip_reports_each_expansion_with_its_itineraries(self):
+        events, on_progress = _collect()
+        filters = _flight_filters(
+            TripType.ROUND_TRIP,
+            _segment(Airport.JFK, Airport.LAX, 30),
+            _segment(Airport.LAX, Airport.JFK, 37),
+        )
+        with patch.object(SearchFlights, "_fetch_flights", autospec=True, side_effect=_fake_fetch):
+            results = SearchFlights().search(
+                filters, top_n=3, partial=True, on_progress=on_progress
+            )
+
+        assert events[0].kind == "outbound"
+        assert [e.completed for e in events] == [1, 2, 3, 4]
+        assert all(e.total == 4 for e in events)
+        expansions = events[1:]
+        assert {e.kind for e in expansions} == {"expansion"}
+        streamed = [combo for e in expansions for combo in e.results]
+        assert sorted(streamed, key=repr) == sorted(results, key=repr)
+        failed = [e for e in expansions if e.description.endswith("(failed)")]
+        assert len(failed) == 1 and failed[0].results == ()
+
+    def test_multi_city_counts_nested_expansions_and_streams_full_itineraries(self):
+        events, on_progress = _collect()
+        filters = _flight_filters(
+            TripType.MULTI_CITY,
+            _segment(Airport.JFK, Airport.LAX, 30),
+            _segment(Airport.LAX, Airport.SFO, 33),
+            _segment(Airport.SFO, Airport.JFK, 36),
+        )
+        with patch.object(SearchFlights, "_fetch_flights", autospec=True, side_effect=_fake_fetch):
+            results = SearchFlights().search(
+                filters, top_n=3, partial=True, on_progress=on_progress
+            )
+
+        # 1 outbound + 3 second-leg requests (one fails) + 2×2 third-leg requests.
+        assert [e.completed for e in events] == list(range(1, 9))
+        assert events[-1].total == 8
+        streamed = [combo for e in events if e.kind == "expansion" for combo in e.results]
+        assert all(len(combo) == 3 for combo in streamed)
+        assert sorted(streamed, key=repr) == sorted(results, key=repr)
+
+    def test_no_callback_no_events(self):
+        filters = _flight_filters(TripType.ONE_WAY, _segment(Airport.JFK, Airport.LAX, 30))
+        with patch.object(SearchFlights, "_fetch_flights", autospec=True, side_effect=_fake_fetch):
+            assert len(SearchFlights().search(filters)) == 3
+
+
+def _date_filters(days: int) -> DateSearchFilters:
+    return DateSearchFilters(
+        trip_type=TripType.ONE_WAY,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[_segment(Airport.JFK, Airport.LAX, 10)],
+        from_date=_day(10).strftime("%Y-%m-%d"),
+        to_date=_day(10 + days - 1).strftime("%Y-%m-%d"),
+    )
+
+
+class TestDateProgress:
+    @pytest.mark.parametrize("days, chunks", [(30, 1), (150, 3)])
+    def test_one_step_per_chunk_with_its_prices(self, days, chunks):
+        events, on_progress = _collect()
+        search = SearchDates()
+        search.client = CalendarClient()
+        prices = search.search(_date_filters(days), on_progress=on_progress)
+
+        assert [e.completed for e in events] == list(range(1, chunks + 1))
+        assert all(e.kind == "chunk" and e.total == chunks for e in events)
+        assert all(isinstance(e.results, DatePriceArray) for e in events)
+        streamed = sorted(dp.date for e in events for dp in e.results)
+        assert streamed == [dp.date for dp in prices]
+
+    def test_failed_chunk_is_reported(self):
+        events, on_progress = _collect()
+        search = SearchDates()
+        client = CalendarClient()
+        calls = 0
+        lock = threading.Lock()
+
+        def flaky_post(url: str, **kwargs: Any) -> FakeResponse:
+            nonlocal calls
+            with lock:
+                calls += 1
+                failing = calls == 2
+            if failing:
+                raise RuntimeError("chunk failed")
+            return CalendarClient.post(client, url, **kwargs)
+
+        search.client = type("Flaky", (), {"post": staticmethod(flaky_post)})()
+        search.search(_date_filters(150), partial=True, on_progress=on_progress)
+
+        assert len(events) == 3
+        failed = [e for e in events if e.description.endswith("(failed)")]
+        assert len(failed) == 1 and len(failed[0].results) == 0
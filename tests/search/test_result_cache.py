@@ -0,0 +1,140 @@
+"""Tests for :class:`fli.search.ResultCache`."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from fli.search import ResultCache
+from fli.search._result_cache import approx_size
+from tests.search.conftest import FakeClock
+
+
+def _cache(ttl: float = 60.0, max_bytes: int = 1000) -> tuple[ResultCache, FakeClock]:
+    clock = FakeClock()
+    return ResultCache(ttl, max_bytes, sizer=lambda value: value["size"], clock=clock), clock
+
+
+class TestResultCache:
+    def test_hit_after_put(self):
+        cache, _ = _cache()
+        value = {"size": 10}
+        cache.put("k", value)
+        assert cache.get("k") is value
+        assert cache.get("other") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries, stats.bytes) == (1, 1, 1, 10)
+        assert stats.hit_rate == 0.5
+
+    def test_entries_expire(self):
+        cache, clock = _cache(ttl=5.0)
+        cache.put("k", {"size": 10})
+        clock.now += 5.0
+        assert cache.get("k", "gone") == "gone"
+        stats = cache.stats()
+        assert (stats.entries, stats.bytes, stats.expirations) == (0, 0, 1)
+
+    def test_expires_in_does_not_count_as_a_lookup(self):
+        cache, clock = _cache(ttl=5.0)
+        cache.put("k", {"size": 10})
+        clock.now += 2.0
+        assert cache.expires_in("k") == pytest.approx(3.0)
+        assert cache.expires_in("other") is None
+        clock.now += 3.0
+        assert cache.expires_in("k") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (0, 0)
+
+    def test_stale_entries_are_kept_until_the_hard_ttl(self):
+        clock = FakeClock()
+        cache = ResultCache(5.0, 1000, hard_ttl=20.0, sizer=lambda value: 1, clock=clock)
+        cache.put("k", None)
+        clock.now += 2.0
+        entry = cache.lookup("k")
+        assert (entry.value, entry.age, entry.stale) == (None, 2.0, False)
+        clock.now += 5.0
+        assert cache.get("k", "miss") == "miss"
+        assert cache.expires_in("k") is None
+        entry = cache.lookup("k")
+        assert (entry.age, entry.stale) == (7.0, True)
+        clock.now += 13.0
+        assert cache.lookup("k") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.stale_hits, stats.misses, stats.expirations) == (1, 1, 2, 1)
+
+    def test_hard_ttl_must_not_be_shorter_than_ttl(self):
+        with pytest.raises(ValueError):
+            ResultCache(10.0, 1000, hard_ttl=5.0)
+
+    def test_evicts_least_recently_used_within_budget(self):
+        cache, _ = _cache(max_bytes=30)
+        for key in "abc":
+            cache.put(key, {"size": 10})
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("d", {"size": 10})
+        assert cache.get("b") is None
+        assert all(cache.get(key) is not None for key in "acd")
+        assert cache.stats().evictions == 1
+        assert cache.stats().bytes == 30
+
+    def test_overwrite_replaces_size(self):
+        cache, _ = _cache()
+        cache.put("k", {"size": 10})
+        cache.put("k", {"size": 25})
+        assert cache.stats().bytes == 25
+        assert len(cache) == 1
+
+    def test_value_larger_than_budget_is_not_cached(self):
+        cache, _ = _cache(max_bytes=30)
+        cache.put("small", {"size": 10})
+        cache.put("huge", {"size": 31})
+        assert cache.get("huge") is None
+        assert cache.get("small") is not None
+
+    def test_invalidate_and_clear(self):
+        cache, _ = _cache()
+        cache.put("a", {"size": 1})
+        cache.put("b", {"size": 1})
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats().bytes == 0
+
+    def test_rejects_bad_bounds(self):
+        with pytest.raises(ValueError):
+            ResultCache(0, 100)
+        with pytest.raises(ValueError):
+            ResultCache(10, 0)
+
+    def test_concurrent_access_keeps_the_byte_count_consistent(self):
+        cache, _ = _cache(max_bytes=500)
+
+        def worker(offset: int) -> None:
+            for i in range(300):
+                cache.put((offset, i % 40), {"size": 7})
+                cache.get((offset, (i + 1) % 40))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = cache.stats()
+        assert stats.bytes == 7 * stats.entries <= 500
+
+
+def test_approx_size_walks_containers():
+    flat = approx_size([])
+    nested = approx_size([{"a": "x" * 1000}])
+    assert nested > flat + 1000
+
+
+def test_approx_size_walks_pydantic_models():
+    from pydantic import BaseModel
+
+    class Model(BaseModel):
+        name: str
+
+    assert approx_size(Model(name="x" * 1000)) > 1000
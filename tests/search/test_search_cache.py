@@ -0,0 +1,223 @@
+"""Tests for stale-while-revalidate caching with :class:`fli.search.SearchResultCache`."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from fli.models import (
+    Airline,
+    Airport,
+    DateSearchFilters,
+    FlightLeg,
+    FlightResult,
+    FlightSearchFilters,
+    FlightSegment,
+    PassengerInfo,
+    TripType,
+)
+from fli.search import CacheStatus, DatePriceArray, SearchDates, SearchFlights, SearchResultCache
+from tests.search.conftest import FakeClock
+
+
+def _cache(ttl: float = 60.0, hard_ttl: float = 600.0) -> tuple[SearchResultCache, FakeClock]:
+    clock = FakeClock()
+    return SearchResultCache(ttl, hard_ttl, clock=clock), clock
+
+
+def _wait_for_refreshes(cache: SearchResultCache) -> None:
+    deadline = time.monotonic() + 5
+    while cache.refresh_stats().revalidating:
+        assert time.monotonic() < deadline, "background refresh did not finish"
+        time.sleep(0.005)
+
+
+class TestSearchResultCache:
+    def test_fresh_hit_does_not_refresh(self):
+        cache, clock = _cache()
+        cache.put("k", "v1")
+        clock.now += 30.0
+        entry, status = cache.serve("k", lambda: pytest.fail("refreshed a fresh entry"))
+        assert entry.value == "v1"
+        assert status == CacheStatus(hit=True, age_s=30.0)
+
+    def test_stale_hit_is_served_and_replaced_in_the_background(self):
+        cache, clock = _cache()
+        cache.put("k", "v1")
+        clock.now += 90.0
+        entry, status = cache.serve("k", lambda: "v2")
+        assert entry.value == "v1"
+        assert status == CacheStatus(hit=True, age_s=90.0, stale=True, revalidating=True)
+        _wait_for_refreshes(cache)
+        assert cache.get("k") == "v2"
+        assert cache.refresh_stats().revalidations == 1
+
+    def test_one_refresh_per_key_at_a_time(self):
+        cache, clock = _cache()
+        cache.put("k", "v1")
+        clock.now += 90.0
+        release = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            release.wait(5)
+            return "v2"
+
+        cache.serve("k", refresh)
+        _, status = cache.serve("k", refresh)
+        assert status.revalidating
+        release.set()
+        _wait_for_refreshes(cache)
+        assert len(calls) == 1
+
+    def test_failed_refresh_keeps_the_stale_entry(self):
+        cache, clock = _cache()
+        cache.put("k", "v1")
+        clock.now += 90.0
+
+        def refresh():
+            raise RuntimeError("Google is down")
+
+        cache.serve("k", refresh)
+        _wait_for_refreshes(cache)
+        assert cache.lookup("k").value == "v1"
+        assert cache.refresh_stats().revalidation_failures == 1
+
+    def test_entries_past_the_hard_ttl_are_misses(self):
+        cache, clock = _cache()
+        cache.put("k", "v1")
+        clock.now += 600.0
+        assert cache.serve("k", lambda: "v2") == (None, CacheStatus.miss())
+
+
+def _day(offset: int) -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=offset
+    )
+
+
+def _result(flight_number: str) -> FlightResult:
+    return FlightResult(
+        legs=[
+            FlightLeg(
+                airline=Airline.AA,
+                flight_number=flight_number,
+                departure_airport=Airport.JFK,
+                arrival_airport=Airport.LAX,
+                departure_datetime=_day(30).replace(hour=9),
+                arrival_datetime=_day(30).replace(hour=12),
+                duration=180,
+            )
+        ],
+        price=300,
+        currency="USD",
+        duration=180,
+        stops=0,
+    )
+
+
+def _one_way_filters() -> FlightSearchFilters:
+    return FlightSearchFilters(
+        trip_type=TripType.ONE_WAY,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=_day(30).strftime("%Y-%m-%d"),
+            )
+        ],
+    )
+
+
+class TestSearchFlightsCache:
+    def test_serves_cached_and_stale_results_with_their_age(self):
+        cache, clock = _cache()
+        fetched = iter(["1", "2"])
+
+        def fetch(_self, filters, **kwargs):
+            return [_result(next(fetched))]
+
+        with patch.object(SearchFlights, "_fetch_flights", autospec=True, side_effect=fetch):
+            search = SearchFlights(cache=cache)
+            first = search.search(_one_way_filters())
+            assert search.last_cache_status == CacheStatus.miss()
+
+            clock.now += 10.0
+            assert SearchFlights(cache=cache).search(_one_way_filters()) is first
+
+            clock.now += 60.0
+            assert search.search(_one_way_filters()) is first
+            status = search.last_cache_status
+            assert (status.hit, status.age_s, status.stale) == (True, 70.0, True)
+            _wait_for_refreshes(cache)
+
+            refreshed = search.search(_one_way_filters())
+        assert refreshed[0].legs[0].flight_number == "2"
+        assert search.last_cache_status == CacheStatus(hit=True)
+
+    def test_other_filters_and_locales_are_separate_entries(self):
+        cache, _ = _cache()
+        with patch.object(
+            SearchFlights, "_fetch_flights", autospec=True, return_value=[_result("1")]
+        ) as fetch:
+            search = SearchFlights(cache=cache)
+            search.search(_one_way_filters())
+            search.search(_one_way_filters(), currency="EUR")
+            search.search(_one_way_filters(), currency="EUR")
+        assert fetch.call_count == 2
+
+    def test_without_a_cache_nothing_is_recorded(self):
+        with patch.object(
+            SearchFlights, "_fetch_flights", autospec=True, return_value=[_result("1")]
+        ):
+            search = SearchFlights()
+            search.search(_one_way_filters())
+        assert search.last_cache_status is None
+
+
+def _date_filters() -> DateSearchFilters:
+    start = _day(10).strftime("%Y-%m-%d")
+    return DateSearchFilters(
+        trip_type=TripType.ONE_WAY,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=start,
+            )
+        ],
+        from_date=start,
+        to_date=_day(20).strftime("%Y-%m-%d"),
+    )
+
+
+class TestSearchDatesCache:
+    def test_stale_results_are_revalidated_without_touching_the_instance(self):
+        cache, clock = _cache()
+        prices = iter([100.0, 80.0])
+        day = _day(10).date().toordinal()
+
+        def chunk(_self, filters, **kwargs):
+            cell = (next(prices), None, "USD")
+            return DatePriceArray._from_cells([(_day(10).date(), cell)], round_trip=False)
+
+        with patch.object(SearchDates, "_search_chunk_array", autospec=True, side_effect=chunk):
+            search = SearchDates(cache=cache)
+            first = search.search_array(_date_filters())
+            assert list(first.departures) == [day]
+
+            clock.now += 120.0
+            assert search.search(_date_filters())[0].price == 100.0
+            assert search.last_cache_status.stale
+            _wait_for_refreshes(cache)
+
+            assert search.search(_date_filters())[0].price == 80.0
+        assert search.last_failures == []
+        assert search.last_cache_status == CacheStatus(hit=True)
@@ -0,0 +1,104 @@
+"""Tests for :meth:`SearchDates.search_durations` — the round-trip duration sweep."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from fli.models import Airport, DateSearchFilters, FlightSegment, PassengerInfo, TripType
+from fli.search import SearchDates
+from tests.search.conftest import CalendarClient
+
+
+def _day(offset: int) -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=offset
+    )
+
+
+def _round_trip(days: int, duration: int = 3) -> DateSearchFilters:
+    start = _day(10)
+    return DateSearchFilters(
+        trip_type=TripType.ROUND_TRIP,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=start.strftime("%Y-%m-%d"),
+            ),
+            FlightSegment(
+                departure_airport=[[Airport.LAX, 0]],
+                arrival_airport=[[Airport.JFK, 0]],
+                travel_date=(start + timedelta(days=duration)).strftime("%Y-%m-%d"),
+            ),
+        ],
+        from_date=start.strftime("%Y-%m-%d"),
+        to_date=(start + timedelta(days=days - 1)).strftime("%Y-%m-%d"),
+        duration=duration,
+    )
+
+
+@pytest.fixture
+def search() -> tuple[SearchDates, CalendarClient]:
+    # Prices encode the duration (``100 × duration + offset``) so each cell
+    # can be checked against its matrix column.
+    client = CalendarClient(
+        lambda day, offset, duration: 100.0 * duration + offset, round_trip=True
+    )
+    searcher = SearchDates()
+    searcher.client = client
+    return searcher, client
+
+
+class TestSearchDurations:
+    def test_builds_every_duration_chunk_request(self, search):
+        searcher, client = search
+        searcher.search_durations(_round_trip(days=90), range(3, 6))
+        # 90 days → 2 chunks, × 3 durations.
+        assert len(client.requests) == 6
+        assert sorted({d for d, _, _ in client.requests}) == [3, 4, 5]
+
+    def test_matrix_is_depart_by_duration(self, search):
+        searcher, _ = search
+        matrix = searcher.search_durations(_round_trip(days=20), [3, 7])
+
+        assert list(matrix) == sorted(matrix)
+        assert len(matrix) == 20
+        first = matrix[_day(10)]
+        assert set(first) == {3, 7}
+        assert first[3].price == 300.0
+        assert first[7].price == 700.0
+        assert first[7].date == (_day(10), _day(17))
+
+    def test_source_filters_unchanged(self, search):
+        searcher, _ = search
+        filters = _round_trip(days=20, duration=3)
+        searcher.search_durations(filters, [5, 6])
+        assert filters.duration == 3
+        assert filters.flight_segments[1].travel_date == _day(13).strftime("%Y-%m-%d")
+
+    def test_rejects_one_way(self, search):
+        searcher, _ = search
+        filters = DateSearchFilters(
+            trip_type=TripType.ONE_WAY,
+            passenger_info=PassengerInfo(adults=1),
+            flight_segments=[
+                FlightSegment(
+                    departure_airport=[[Airport.JFK, 0]],
+                    arrival_airport=[[Airport.LAX, 0]],
+                    travel_date=_day(10).strftime("%Y-%m-%d"),
+                )
+            ],
+            from_date=_day(10).strftime("%Y-%m-%d"),
+            to_date=_day(20).strftime("%Y-%m-%d"),
+        )
+        with pytest.raises(ValueError):
+            searcher.search_durations(filters, [3])
+
+    @pytest.mark.parametrize("durations", [[], [0, 3]])
+    def test_rejects_invalid_durations(self, search, durations):
+        searcher, _ = search
+        with pytest.raises(ValueError):
+            searcher.search_durations(_round_trip(days=20), durations)
@@ -0,0 +1,178 @@
+"""Tests for :class:`fli.search.SearchExplore` — one origin, many destination calendars."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+
+from fli.models import Airport, DateSearchFilters, FlightSegment, PassengerInfo, TripType
+from fli.search import (
+    CalendarPriceStore,
+    CancellationToken,
+    SearchCancelledError,
+    SearchDates,
+    SearchExplore,
+)
+from fli.search.explore import _for_destination
+from tests.search.conftest import FakeResponse, calendar_response, decode_request
+
+# Cheapest fare per destination in the fake calendar.
+BASE_PRICE = {Airport.LAX: 300.0, Airport.MIA: 150.0, Airport.DEN: 220.0, Airport.SEA: 410.0}
+
+
+class ExploreClient:
+    """Prices each destination's days at ``BASE_PRICE + day offset`` from the range start."""
+
+    def __init__(self, latency_s: float = 0.0, fail: Airport | None = None):
+        """Configure per-request latency and an optional destination that always fails."""
+        self._latency_s = latency_s
+        self._fail = fail
+        self._lock = threading.Lock()
+        self.requests: list[tuple[str, str, str, str]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        formatted = decode_request(kwargs)
+        start, end = formatted[2]
+        outbound = formatted[1][13][0]
+        origin, destination = outbound[0][0][0][0], outbound[1][0][0][0]
+        with self._lock:
+            self.requests.append((origin, destination, start, end))
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            time.sleep(self._latency_s)
+            if self._fail is not None and destination == self._fail.name:
+                raise RuntimeError(f"{destination} unavailable")
+            base = BASE_PRICE[Airport[destination]]
+            return calendar_response(start, end, lambda day, offset: base + offset)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _day(offset: int) -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=offset
+    )
+
+
+def _filters(days: int) -> DateSearchFilters:
+    return DateSearchFilters(
+        trip_type=TripType.ONE_WAY,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=_day(10).strftime("%Y-%m-%d"),
+            )
+        ],
+        from_date=_day(10).strftime("%Y-%m-%d"),
+        to_date=_day(10 + days - 1).strftime("%Y-%m-%d"),
+    )
+
+
+def _explore(client: ExploreClient, store: CalendarPriceStore | None = None) -> SearchExplore:
+    dates = SearchDates(store=store)
+    dates.client = client
+    return SearchExplore(dates)
+
+
+class TestSearchExplore:
+    def test_every_destination_by_chunk_request_is_issued(self):
+        client = ExploreClient()
+        result = _explore(client).search(_filters(90), list(BASE_PRICE))
+
+        assert result.requests == len(client.requests) == 4 * 2
+        assert {(o, d) for o, d, _, _ in client.requests} == {
+            ("JFK", airport.name) for airport in BASE_PRICE
+        }
+        assert all(len(fares.prices) == 90 for fares in result.fares.values())
+
+    def test_ranked_cheapest_first(self):
+        result = _explore(ExploreClient()).search(_filters(30), list(BASE_PRICE))
+        ranked = [fares.destination for fares in result.ranked()]
+        assert ranked == [Airport.MIA, Airport.DEN, Airport.LAX, Airport.SEA]
+        destination, cheapest = result.table()[0]
+        assert destination == Airport.MIA
+        assert cheapest.price == 150.0
+        assert cheapest.date == (_day(10),)
+
+    def test_requests_share_one_window(self):
+        client = ExploreClient(latency_s=0.05)
+        _explore(client).search(_filters(30), list(BASE_PRICE), max_in_flight=4)
+        assert client.peak_in_flight == 4
+
+    def test_destinations_stream_as_they_complete(self):
+        client = ExploreClient(latency_s=0.02)
+        seen = []
+        stream = _explore(client).stream(_filters(90), list(BASE_PRICE), max_in_flight=2)
+        seen.append(next(stream).destination)
+        stream.close()
+        assert seen[0] in BASE_PRICE
+        # Far fewer than all 8 requests were needed for the first destination.
+        assert len(client.requests) < 8
+
+    def test_failed_destination_is_reported_not_raised(self):
+        result = _explore(ExploreClient(fail=Airport.DEN)).search(_filters(30), list(BASE_PRICE))
+        failed = result.fares[Airport.DEN]
+        assert isinstance(failed.error, RuntimeError)
+        assert failed.cheapest is None
+        assert result.ranked()[-1] is failed
+
+    def test_round_trip_mirrors_the_return_segment(self):
+        filters = DateSearchFilters(
+            trip_type=TripType.ROUND_TRIP,
+            passenger_info=PassengerInfo(adults=1),
+            flight_segments=[
+                FlightSegment(
+                    departure_airport=[[Airport.JFK, 0]],
+                    arrival_airport=[[Airport.LAX, 0]],
+                    travel_date=_day(10).strftime("%Y-%m-%d"),
+                ),
+                FlightSegment(
+                    departure_airport=[[Airport.LAX, 0]],
+                    arrival_airport=[[Airport.JFK, 0]],
+                    travel_date=_day(17).strftime("%Y-%m-%d"),
+                ),
+            ],
+            from_date=_day(10).strftime("%Y-%m-%d"),
+            to_date=_day(20).strftime("%Y-%m-%d"),
+            duration=7,
+        )
+        mirrored = _for_destination(filters, Airport.MIA)
+        assert mirrored.flight_segments[0].arrival_airport == [[Airport.MIA, 0]]
+        assert mirrored.flight_segments[1].departure_airport == [[Airport.MIA, 0]]
+        assert mirrored.flight_segments[1].arrival_airport == [[Airport.JFK, 0]]
+        assert filters.flight_segments[0].arrival_airport == [[Airport.LAX, 0]]
+
+    def test_store_skips_known_destinations(self):
+        store = CalendarPriceStore()
+        client = ExploreClient()
+        explore = _explore(client, store)
+        first = explore.search(_filters(30), [Airport.LAX, Airport.MIA])
+        calls = len(client.requests)
+
+        second = explore.search(_filters(30), [Airport.LAX, Airport.MIA, Airport.DEN])
+        assert {d for _, d, _, _ in client.requests[calls:]} == {"DEN"}
+        assert second.fares[Airport.LAX].cheapest == first.fares[Airport.LAX].cheapest
+
+    def test_cancellation_aborts_everything(self):
+        token = CancellationToken()
+        client = ExploreClient(latency_s=0.1)
+        threading.Timer(0.05, token.cancel).start()
+        with pytest.raises(SearchCancelledError):
+            _explore(client).search(
+                _filters(90), list(BASE_PRICE), max_in_flight=2, cancel_token=token
+            )
+        assert len(client.requests) < 8
+
+    def test_rejects_empty_destinations(self):
+        with pytest.raises(ValueError):
+            _explore(ExploreClient()).search(_filters(30), [])
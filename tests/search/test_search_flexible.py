@@ -0,0 +1,117 @@
+"""Tests for :class:`fli.search.SearchFlexible` — calendar sweep then targeted fan-out."""
+
+from __future__ import annotations
+
+import json
+import threading
+import urllib.parse
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from fli.models import Airport, DateSearchFilters, FlightSegment, PassengerInfo, TripType
+from fli.search import SearchDates, SearchFlexible, SearchFlights
+from tests.search.conftest import FakeResponse
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+class RoutingClient:
+    """Serves calendar or shopping fixtures depending on the endpoint."""
+
+    def __init__(self, calendar_text: str, shopping_text: str):
+        """Capture both fixture bodies."""
+        self._calendar = calendar_text
+        self._shopping = shopping_text
+        self._lock = threading.Lock()
+        self.calendar_calls = 0
+        self.shopping_bodies: list[str] = []
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        with self._lock:
+            if "GetCalendarGraph" in url:
+                self.calendar_calls += 1
+                return FakeResponse(self._calendar)
+            self.shopping_bodies.append(urllib.parse.unquote(kwargs.get("data", "")))
+            return FakeResponse(self._shopping)
+
+
+def _day(offset: int) -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=offset
+    )
+
+
+def _calendar_fixture(prices: dict[int, float]) -> str:
+    entries = [
+        [_day(offset).strftime("%Y-%m-%d"), None, [[None, price], "USD0.000"]]
+        for offset, price in prices.items()
+    ]
+    inner = json.dumps([None, None, entries])
+    return ")]}'\n" + json.dumps([["wrb.fr", None, inner]])
+
+
+def _date_filters(start: int, end: int) -> DateSearchFilters:
+    return DateSearchFilters(
+        trip_type=TripType.ONE_WAY,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[Airport.LAX, 0]],
+                travel_date=_day(start).strftime("%Y-%m-%d"),
+            )
+        ],
+        from_date=_day(start).strftime("%Y-%m-%d"),
+        to_date=_day(end).strftime("%Y-%m-%d"),
+    )
+
+
+@pytest.fixture
+def engine_and_client():
+    prices = {10: 500.0, 11: 120.0, 12: 300.0, 13: 90.0, 14: 450.0, 15: 200.0}
+    shopping = (FIXTURE_DIR / "flight_search_jfk_lax_oneway_usd.bin").read_text()
+    client = RoutingClient(_calendar_fixture(prices), shopping)
+    flights = SearchFlights()
+    flights.client = client
+    dates = SearchDates()
+    dates.client = client
+    return SearchFlexible(flights=flights, dates=dates), client
+
+
+class TestSearchFlexible:
+    def test_only_top_k_dates_are_searched_in_full(self, engine_and_client):
+        engine, client = engine_and_client
+        results = engine.search(_date_filters(10, 15), top_k=2)
+
+        assert client.calendar_calls == 1
+        assert len(client.shopping_bodies) == 2
+        bodies = client.shopping_bodies
+        assert any(_day(13).strftime("%Y-%m-%d") in body for body in bodies)
+        assert any(_day(11).strftime("%Y-%m-%d") in body for body in bodies)
+        assert {r.dates[0] for r in results} == {_day(11), _day(13)}
+        assert all(r.flights and r.error is None for r in results)
+
+    def test_results_ranked_by_itinerary_price(self, engine_and_client):
+        engine, _ = engine_and_client
+        results = engine.search(_date_filters(10, 15), top_k=3)
+        prices = [r.price for r in results]
+        assert prices == sorted(prices)
+        # The shopping fixture's cheapest fare (289) replaces calendar prices.
+        assert prices[0] == 289.0
+
+    def test_empty_calendar_returns_empty_list(self):
+        client = RoutingClient(_calendar_fixture({}), "")
+        dates = SearchDates()
+        dates.client = client
+        flights = SearchFlights()
+        flights.client = client
+        assert SearchFlexible(flights=flights, dates=dates).search(_date_filters(10, 15)) == []
+        assert client.shopping_bodies == []
+
+    def test_invalid_top_k(self, engine_and_client):
+        engine, _ = engine_and_client
+        with pytest.raises(ValueError):
+            engine.search(_date_filters(10, 15), top_k=0)
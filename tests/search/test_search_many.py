@@ -0,0 +1,156 @@
+"""Tests for :meth:`SearchFlights.search_many` batch scheduling.
+
+HTTP is replaced with a controlled-latency stub so the tests are offline
+and deterministic. They cover result delivery, per-query failure
+isolation, the ``max_in_flight`` bound, lazy consumption of the query
+source, and the aggregate statistics.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from fli.models import (
+    Airport,
+    FlightSearchFilters,
+    FlightSegment,
+    PassengerInfo,
+    TripType,
+)
+from fli.search import BatchResult, SearchFlights
+from tests.search.conftest import FixtureClient
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def _future(days: int) -> str:
+    return (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def _one_way(destination: Airport = Airport.LAX, days: int = 30) -> FlightSearchFilters:
+    return FlightSearchFilters(
+        trip_type=TripType.ONE_WAY,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=[
+            FlightSegment(
+                departure_airport=[[Airport.JFK, 0]],
+                arrival_airport=[[destination, 0]],
+                travel_date=_future(days),
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def fixture_text() -> str:
+    return (FIXTURE_DIR / "flight_search_jfk_lax_oneway_usd.bin").read_text()
+
+
+class TestSearchMany:
+    def test_every_query_yields_one_result(self, fixture_text):
+        fake = FixtureClient(fixture_text, latency_s=0.02)
+        search = SearchFlights()
+        search.client = fake
+
+        queries = [_one_way(days=30 + i) for i in range(6)]
+        results = search.search_many(queries, max_in_flight=3).collect()
+
+        assert [r.index for r in results] == list(range(6))
+        assert all(r.ok and r.flights for r in results)
+        assert fake.calls == 6
+
+    def test_failures_are_isolated(self, fixture_text):
+        # ``SFO`` only appears in the encoded body of the SFO query.
+        fake = FixtureClient(fixture_text, latency_s=0.02, fail_on="SFO")
+        search = SearchFlights()
+        search.client = fake
+
+        queries = [_one_way(Airport.LAX), _one_way(Airport.SFO), _one_way(Airport.ORD)]
+        batch = search.search_many(queries, max_in_flight=3)
+        results = batch.collect()
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, RuntimeError)
+        assert results[1].flights is None
+        assert batch.stats.succeeded == 2
+        assert batch.stats.failed == 1
+
+    def test_max_in_flight_is_respected(self, fixture_text):
+        fake = FixtureClient(fixture_text, latency_s=0.03)
+        search = SearchFlights()
+        search.client = fake
+
+        list(search.search_many([_one_way(days=30 + i) for i in range(8)], max_in_flight=2))
+
+        assert fake.calls == 8
+        assert 2 <= fake.peak_in_flight <= 2
+
+    def test_queries_consumed_lazily(self, fixture_text):
+        fake = FixtureClient(fixture_text, latency_s=0.005)
+        search = SearchFlights()
+        search.client = fake
+        pulled = 0
+
+        def source():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield _one_way(days=30 + i % 50)
+
+        batch = search.search_many(source(), max_in_flight=2)
+        first = next(iter(batch))
+
+        assert isinstance(first, BatchResult)
+        # Only the in-flight window (plus the refill after one completion)
+        # may have been pulled from the generator.
+        assert pulled <= 4
+
+    def test_on_result_and_stats(self, fixture_text):
+        fake = FixtureClient(fixture_text, latency_s=0.02)
+        search = SearchFlights()
+        search.client = fake
+        seen: list[int] = []
+
+        batch = search.search_many(
+            [_one_way(days=30 + i) for i in range(4)],
+            on_result=lambda r: seen.append(r.index),
+        )
+        list(batch)
+
+        assert sorted(seen) == [0, 1, 2, 3]
+        assert batch.stats.submitted == 4
+        assert batch.stats.completed == 4
+        assert batch.stats.queries_per_second > 0
+        assert batch.stats.mean_query_s > 0
+
+    def test_batch_does_not_touch_cached_session(self, fixture_text):
+        search = SearchFlights()
+        search.client = FixtureClient(fixture_text, latency_s=0.02)
+
+        search.search_many([_one_way()]).collect()
+
+        assert search._last_session_id is None
+
+    def test_each_result_carries_its_session_id(self, fixture_text):
+        search = SearchFlights()
+        search.client = FixtureClient(fixture_text, latency_s=0.02)
+
+        (result,) = search.search_many([_one_way()]).collect()
+
+        assert isinstance(result.session_id, str) and result.session_id
+        assert search._last_session_id is None
+
+    def test_cannot_iterate_twice(self, fixture_text):
+        search = SearchFlights()
+        search.client = FixtureClient(fixture_text, latency_s=0.02)
+        batch = search.search_many([_one_way()])
+        batch.collect()
+        with pytest.raises(RuntimeError):
+            list(batch)
+
+    def test_invalid_max_in_flight(self):
+        with pytest.raises(ValueError):
+            SearchFlights().search_many([], max_in_flight=-1)
@@ -0,0 +1,103 @@
+"""Tests for :class:`fli.search.SearchMatrix` request packing and attribution."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from fli.core import build_flight_segments
+from fli.models import Airport, FlightSearchFilters, PassengerInfo
+from fli.search import SearchFlights, SearchMatrix
+from fli.search.matrix import MAX_AIRPORTS_PER_SIDE, _regroup
+from tests.search.conftest import FixtureClient
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def _filters(origins: list[Airport], destinations: list[Airport]) -> FlightSearchFilters:
+    date = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+    segments, trip_type = build_flight_segments(origins, destinations, date)
+    return FlightSearchFilters(
+        trip_type=trip_type,
+        passenger_info=PassengerInfo(adults=1),
+        flight_segments=segments,
+    )
+
+
+@pytest.fixture
+def matrix() -> tuple[SearchMatrix, FixtureClient]:
+    fixture = (FIXTURE_DIR / "flight_search_jfk_lax_oneway_usd.bin").read_text()
+    client = FixtureClient(fixture)
+    search = SearchFlights()
+    search.client = client
+    return SearchMatrix(search), client
+
+
+class TestSearchMatrix:
+    def test_packed_pass_then_refinement(self, matrix):
+        engine, client = matrix
+        result = engine.search(_filters([Airport.JFK, Airport.LGA, Airport.EWR], [Airport.LAX]))
+
+        # One packed request for the 3×1 block, then one refinement request
+        # for the two origins that share the same uncovered destination.
+        assert result.requests == 2
+        assert len(client.bodies) == 2
+        assert '\\"LGA\\"' in client.bodies[1] and '\\"EWR\\"' in client.bodies[1]
+        assert '\\"JFK\\"' not in client.bodies[1]
+
+        cheapest = result.cheapest(Airport.JFK, Airport.LAX)
+        assert cheapest is not None and cheapest.price == 289.0
+        assert set(result.missing) == {(Airport.LGA, Airport.LAX), (Airport.EWR, Airport.LAX)}
+        assert result.table() == [[289.0], [None], [None]]
+
+    def test_refine_disabled_caps_request_count(self, matrix):
+        engine, client = matrix
+        result = engine.search(
+            _filters([Airport.JFK, Airport.LGA], [Airport.LAX, Airport.SFO]), refine=False
+        )
+        assert result.requests == 1
+        assert len(client.bodies) == 1
+
+    def test_large_sides_are_split_into_blocks(self, matrix):
+        engine, client = matrix
+        origins = [
+            Airport.JFK,
+            Airport.LGA,
+            Airport.EWR,
+            Airport.BOS,
+            Airport.PHL,
+            Airport.IAD,
+            Airport.DCA,
+            Airport.BWI,
+        ]
+        result = engine.search(_filters(origins, [Airport.LAX]), refine=False)
+        assert len(origins) > MAX_AIRPORTS_PER_SIDE
+        assert result.requests == 2
+
+    def test_round_trip_rejected(self, matrix):
+        engine, _ = matrix
+        date = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+        back = (datetime.now() + timedelta(days=37)).strftime("%Y-%m-%d")
+        segments, trip_type = build_flight_segments(Airport.JFK, Airport.LAX, date, back)
+        filters = FlightSearchFilters(
+            trip_type=trip_type, passenger_info=PassengerInfo(), flight_segments=segments
+        )
+        with pytest.raises(ValueError):
+            engine.search(filters)
+
+
+class TestRegroup:
+    def test_origins_with_same_missing_set_share_a_request(self):
+        missing = [
+            (Airport.JFK, Airport.LHR),
+            (Airport.JFK, Airport.LGW),
+            (Airport.EWR, Airport.LHR),
+            (Airport.EWR, Airport.LGW),
+            (Airport.LGA, Airport.STN),
+        ]
+        blocks = _regroup(missing)
+        assert len(blocks) == 2
+        assert ([Airport.JFK, Airport.EWR], [Airport.LHR, Airport.LGW]) in blocks
+        assert ([Airport.LGA], [Airport.STN]) in blocks